@@ -13,30 +13,31 @@ maze = [[1 for _ in range(WIDTH)] for _ in range(HEIGHT)]
 def is_valid(x, y):
     return 0 <= x < HEIGHT and 0 <= y < WIDTH
 
-def count_adjacent_paths(x, y):
-    """Count the number of adjacent path cells (0s) around (x, y)."""
-    count = 0
-    for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-        nx, ny = x + dx, y + dy
-        if is_valid(nx, ny) and maze[nx][ny] == 0:
-            count += 1
-    return count
-
 def carve(x, y):
-    # Mark current cell as visited (carve it)
+    # Explicit stack instead of recursion: each entry is a cell and how many
+    # of the shared DIRECTIONS it has tried, so large mazes cannot overflow
     maze[x][y] = 0
-
-    # Shuffle directions to visit neighbors randomly
     random.shuffle(DIRECTIONS)
+    stack = [[x, y, 0]]
 
-    for dx, dy in DIRECTIONS:
+    while stack:
+        frame = stack[-1]
+        x, y, index = frame
+        if index == len(DIRECTIONS):
+            stack.pop()
+            continue
+        frame[2] = index + 1
+        dx, dy = DIRECTIONS[index]
         nx, ny = x + dx, y + dy
         mx, my = x + dx//2, y + dy//2
+        # An unvisited target two cells away never has another open neighbor,
+        # so carving through the midpoint cannot create a loop
         if is_valid(nx, ny) and maze[nx][ny] == 1:
-            # Prevent loops: only carve if the midpoint and target have at most one adjacent path
-            if count_adjacent_paths(mx, my) <= 1 and count_adjacent_paths(nx, ny) <= 1:
-                maze[mx][my] = 0
-                carve(nx, ny)
+            maze[mx][my] = 0
+            maze[nx][ny] = 0
+            # Shuffle directions to visit neighbors randomly
+            random.shuffle(DIRECTIONS)
+            stack.append([nx, ny, 0])
 
 # Start carving from top-left corner (even coordinates required)
 carve(1, 1)
@@ -1,8 +1,11 @@
-import os
 import time
 import heapq
-import tracemalloc
+from frameRenderer import FrameRenderer
 from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from bitGrid import ParentBits
+from searchCore import get_neighbors, reconstruct_path
+from summaryTables import make_result, print_summary
 
 # Constants
 GREEN  = "\033[1;32m"  # Color for start point
@@ -11,6 +14,8 @@ HEAD   = "\033[1;34m"  # Color for current position
 BLUE   = "\033[1;36m"  # Color for current path
 YELLOW = "\033[0;33m"  # Color for traversed nodes
 
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
 # Function definitions
 def heuristic(point_a, point_b):
     """
@@ -25,26 +30,7 @@ def heuristic(point_a, point_b):
     """
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
-def get_neighbors(position, maze):
-    """
-    Get valid neighboring positions (walkable cells only).
-    
-    Args:
-        position (tuple): Current position (x, y).
-        maze (list): 2D grid representing the maze.
-        
-    Returns:
-        list: List of valid neighboring positions.
-    """
-    x, y = position
-    neighbors = []
-    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Up, Right, Down, Left
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
-            neighbors.append((nx, ny))
-    return neighbors
-
-def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True):
+def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True, heuristic_fn=heuristic):
     """
     Visualize the maze with current path and traversed nodes.
     
@@ -55,9 +41,10 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
         current_path (list): Current path being explored.
         traversed_nodes (list): Nodes that have been traversed.
         step (int): Current step number.
+        heuristic_fn (callable): Heuristic shown in the header.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
     if not hasattr(visualize_maze, 'prev_path'):
         visualize_maze.prev_path = []
     
@@ -70,11 +57,11 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
             backtracking = True
 
     visualize_maze.prev_path = current_path.copy()
-    h_value = heuristic(current_position, end)
+    h_value = heuristic_fn(current_position, end)
     g_value = len(current_path) - 1 if current_path else 0
     f_value = g_value + h_value
-    print(f"Current position: {current_position}, f(n) = g(n) + h(n) = {g_value} + {h_value} = {f_value}")
-    print(f"Nodes expanded: {len(traversed_nodes)}")
+    header = [f"Current position: {current_position}, f(n) = g(n) + h(n) = {g_value} + {h_value} = {f_value}"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
     
     delay = 0.1
     if step == 1:
@@ -87,46 +74,12 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
     else:
         explanation = "Exploring: Moving to a position with lowest f(n) score..."
     
-    print(explanation)
+    header.append(explanation)
     
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            pos = (i, j)
-            if ansi:
-                if pos == start:
-                    print(f"{GREEN}S", end="\033[0m ")
-                elif pos == end:
-                    print(f"{RED}E", end="\033[0m ")
-                elif pos == current_position:
-                    print(f"{HEAD}@", end="\033[0m ")
-                elif pos in current_path:
-                    print(f"{BLUE}*", end="\033[0m ")
-                elif pos in traversed_nodes:
-                    print(f"{YELLOW}.", end="\033[0m ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-            else:
-                if pos == start:
-                    print("S", end=" ")
-                elif pos == end:
-                    print("E", end=" ")
-                elif pos == current_position:
-                    print("@", end=" ")
-                elif pos in current_path:
-                    print("*", end=" ")
-                elif pos in traversed_nodes:
-                    print(".", end=" ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-        print()
-    print()
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
     time.sleep(delay)
 
-def astar(start, end, maze, visualize=False, ansi=True):
+def astar_search(start, end, maze, visualize=False, ansi=True, heuristic_fn=heuristic, parents=None):
     """
     Solve the maze using A* Search algorithm.
     
@@ -136,63 +89,262 @@ def astar(start, end, maze, visualize=False, ansi=True):
         maze (list): 2D grid representing the maze.
         visualize (bool): Whether to visualize the search process.
         ansi (bool): Whether to use ANSI color in visualization.
+        heuristic_fn (callable): h(position, goal), Manhattan distance by default;
+            must be consistent, e.g. landmarks.LandmarkHeuristic.
+        parents (callable): parents(maze) -> empty store for each node's parent; a dict
+            if omitted. bitGrid.ParentBits keeps three bits per cell at about half the speed.
         
     Returns:
-        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+        tuple: (path, traversed_nodes)
     """
-    start_time = time.time()
     start, end = tuple(start), tuple(end)
 
     position_id = 0  # Tie-breaker for items with same f(n) score
-    # Priority queue stores (f(n), position_id, current, path, g(n))
-    frontier = [(heuristic(start, end), position_id, start, [start], 0)]
+    # Priority queue stores (f(n), position_id, current, g(n), parent)
+    frontier = [(heuristic_fn(start, end), position_id, start, 0, None)]
     heapq.heapify(frontier)
 
-    visited = {start: 0}  # Track nodes and their g(n) values
+    # Parent of each expanded node. The heuristic is consistent (Manhattan and
+    # landmark bounds both are), so the first time a node is popped its g(n) is
+    # optimal and it never needs reopening.
+    came_from = parents(maze) if parents else {}
     nodes_traversed = 0
     traversed_nodes = []
     step = 0
 
-    # Start tracing memory
-    tracemalloc.start()
-
     while frontier:
-        f_score, _, current, path, g_score = heapq.heappop(frontier)
+        f_score, _, current, g_score, parent = heapq.heappop(frontier)
+        if current in came_from:
+            continue  # Already expanded through a path at least as cheap
+        came_from[current] = parent
         traversed_nodes.append(current)
         nodes_traversed = len(traversed_nodes)
 
         if visualize:
-            visualize_maze(maze, start, end, path, traversed_nodes, nodes_traversed, ansi=ansi)
+            visualize_maze(maze, start, end, reconstruct_path(came_from, current), traversed_nodes, nodes_traversed, ansi=ansi, heuristic_fn=heuristic_fn)
 
         if current == end:
-            time.sleep(0.000000000000000000000000000001)  # Allow time to update
-            time_taken = time.time() - start_time
-            peak_memory = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            path = reconstruct_path(came_from, current)
             if visualize:
-                visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
+                visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi, heuristic_fn=heuristic_fn)
                 print("Path found! Press Enter to continue...")
                 input()
-            return path, nodes_traversed, time_taken, traversed_nodes, peak_memory
+            return path, traversed_nodes
 
         for neighbor in get_neighbors(current, maze):
             new_g_score = g_score + 1  # Each step has a cost of 1
-            if neighbor not in visited or new_g_score < visited[neighbor]:
-                visited[neighbor] = new_g_score
-                new_path = path + [neighbor]
-                h_score = heuristic(neighbor, end)
+            if neighbor not in came_from:
+                h_score = heuristic_fn(neighbor, end)
                 f_score = new_g_score + h_score
                 position_id += 1
-                heapq.heappush(frontier, (f_score, position_id, neighbor, new_path, new_g_score))
+                heapq.heappush(frontier, (f_score, position_id, neighbor, new_g_score, current))
+
+    if visualize:
+        visualize_maze(maze, start, end, [], traversed_nodes, step + 1, ansi=ansi, heuristic_fn=heuristic_fn)
+        print("No path found! Press Enter to continue...")
+        input()
+    return [], traversed_nodes
+
+
+def astar(start, end, maze, visualize=False, ansi=True, heuristic_fn=heuristic, parents=None):
+    """
+    Solve the maze using A* Search algorithm.
+
+    The search itself is timed from outside with tracing off, then replayed
+    under tracemalloc for peak memory (see measurement.measure_once).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+        heuristic_fn (callable): h(position, goal), Manhattan distance by default.
+        parents (callable): Parent store factory passed to astar_search.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(astar_search, start, end, maze, visualize=True, ansi=ansi, heuristic_fn=heuristic_fn)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(astar_search, start, end, maze, heuristic_fn=heuristic_fn, parents=parents)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
+
+def is_walkable(position, maze):
+    """
+    Check whether a position is inside the maze and not a wall.
+
+    Args:
+        position (tuple): Position (x, y).
+        maze (list): 2D grid representing the maze.
+
+    Returns:
+        bool: True if the position can be stepped on.
+    """
+    x, y = position
+    return 0 <= x < len(maze) and 0 <= y < len(maze[0]) and maze[x][y] == 0
+
+def jump(position, direction, end, maze):
+    """
+    Move from a position in one direction until a jump point is found.
+
+    This is the 4-connected Jump Point Search rule. Moving along a row, a
+    cell is a jump point when a side opening appears that was walled off one
+    step back (a forced neighbor). Moving along a column, the same holds, and
+    the cell is also a jump point if a jump sideways along its row would find
+    one, because row moves are only explored from such cells.
+
+    Args:
+        position (tuple): Position (x, y) the jump starts from.
+        direction (tuple): Unit step (dx, dy).
+        end (tuple): Goal position.
+        maze (list): 2D grid representing the maze.
+
+    Returns:
+        tuple: The jump point reached, or None if a wall is hit first.
+    """
+    x, y = position
+    dx, dy = direction
+    while True:
+        x, y = x + dx, y + dy
+        if not is_walkable((x, y), maze):
+            return None
+        if (x, y) == end:
+            return x, y
+        if dx == 0:
+            # Moving along a row: look for a forced neighbor above or below
+            for side in (-1, 1):
+                if is_walkable((x + side, y), maze) and not is_walkable((x + side, y - dy), maze):
+                    return x, y
+        else:
+            # Moving along a column: look for a forced neighbor left or right
+            for side in (-1, 1):
+                if is_walkable((x, y + side), maze) and not is_walkable((x - dx, y + side), maze):
+                    return x, y
+            if jump((x, y), (0, 1), end, maze) or jump((x, y), (0, -1), end, maze):
+                return x, y
+
+def jps_directions(current, parent, maze):
+    """
+    Get the directions worth jumping in from a jump point.
+
+    Args:
+        current (tuple): Jump point (x, y) being expanded.
+        parent (tuple): Jump point it was reached from, None for the start.
+        maze (list): 2D grid representing the maze.
+
+    Returns:
+        list: Unit steps (dx, dy) to jump along.
+    """
+    if parent is None:
+        return [(dx, dy) for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
+                if is_walkable((current[0] + dx, current[1] + dy), maze)]
+    dx = (current[0] > parent[0]) - (current[0] < parent[0])
+    dy = (current[1] > parent[1]) - (current[1] < parent[1])
+    if dx == 0:
+        candidates = [(0, dy), (1, 0), (-1, 0)]  # Keep going along the row, or turn
+    else:
+        candidates = [(dx, 0), (0, 1), (0, -1)]  # Keep going along the column, or turn
+    return [(sx, sy) for sx, sy in candidates if is_walkable((current[0] + sx, current[1] + sy), maze)]
+
+def expand_jumps(jump_points):
+    """
+    Fill in the straight runs between consecutive jump points.
+
+    Args:
+        jump_points (list): Jump points from the start to the goal.
+
+    Returns:
+        list: Every cell on the path.
+    """
+    path = jump_points[:1]
+    for (x1, y1), (x2, y2) in zip(jump_points, jump_points[1:]):
+        dx = (x2 > x1) - (x2 < x1)
+        dy = (y2 > y1) - (y2 < y1)
+        x, y = x1, y1
+        while (x, y) != (x2, y2):
+            x, y = x + dx, y + dy
+            path.append((x, y))
+    return path
+
+def jps_search(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Jump Point Search (4-connected).
+
+    A* over jump points only: straight corridors are crossed by jump() without
+    being pushed onto the frontier, so traversed_nodes lists only the jump
+    points that were expanded.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, traversed_nodes)
+    """
+    start, end = tuple(start), tuple(end)
+
+    position_id = 0  # Tie-breaker for items with same f(n) score
+    # Priority queue stores (f(n), position_id, current, g(n), parent)
+    frontier = [(heuristic(start, end), position_id, start, 0, None)]
+
+    came_from = {}  # Parent jump point of each expanded jump point
+    traversed_nodes = []
+    step = 0
+
+    while frontier:
+        f_score, _, current, g_score, parent = heapq.heappop(frontier)
+        if current in came_from:
+            continue  # Already expanded through a path at least as cheap
+        came_from[current] = parent
+        traversed_nodes.append(current)
+
+        if visualize:
+            visualize_maze(maze, start, end, expand_jumps(reconstruct_path(came_from, current)), traversed_nodes, len(traversed_nodes), ansi=ansi)
+
+        if current == end:
+            path = expand_jumps(reconstruct_path(came_from, current))
+            if visualize:
+                visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
+                print("Path found! Press Enter to continue...")
+                input()
+            return path, traversed_nodes
+
+        for direction in jps_directions(current, parent, maze):
+            successor = jump(current, direction, end, maze)
+            if successor is not None and successor not in came_from:
+                new_g_score = g_score + heuristic(current, successor)  # Straight run, cost = length
+                f_score = new_g_score + heuristic(successor, end)
+                position_id += 1
+                heapq.heappush(frontier, (f_score, position_id, successor, new_g_score, current))
 
-    time_taken = time.time() - start_time
-    peak_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
     if visualize:
         visualize_maze(maze, start, end, [], traversed_nodes, step + 1, ansi=ansi)
         print("No path found! Press Enter to continue...")
         input()
-    return [], nodes_traversed, time_taken, traversed_nodes, peak_memory
+    return [], traversed_nodes
+
+def jps(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Jump Point Search (4-connected).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(jps_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(jps_search, start, end, maze)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
 
 def main():
     """
@@ -232,7 +384,8 @@ def main():
         maze = test_case["maze"]
         start_point = test_case["start"]
         end_point = test_case["end"]
-        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = astar(start_point, end_point, maze, visualize=False)
+        # The summary reports peak memory, so keep parents in the compact store
+        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = astar(start_point, end_point, maze, visualize=False, parents=ParentBits)
 
         solution_found = bool(path)
         steps = len(path) - 1 if solution_found else 0
@@ -283,5 +436,12 @@ def main():
               f"{result['peak_memory_mb']:^17.6f} |")
     print("+--------+---------------------+-------+-------------------+-------------------+-------------------+-------+-------------------+")
 
+    # Same cases with Jump Point Search, to compare Nodes Traversed against A*
+    jps_results = []
+    for i, test_case in enumerate(maze_test_cases, 1):
+        path, nodes_expanded, time_taken, _, peak_memory = jps(test_case["start"], test_case["end"], test_case["maze"])
+        jps_results.append(make_result(i, test_case["start"], test_case["end"], path, nodes_expanded, time_taken, peak_memory))
+    print_summary(jps_results, "Jump Point Search")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
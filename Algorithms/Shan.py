@@ -1,8 +1,10 @@
-import os
 import time
-import tracemalloc
 from collections import deque
+from frameRenderer import FrameRenderer
 from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from bitGrid import ParentBits
+from searchCore import get_neighbors, reconstruct_path
 
 # Constants
 GREEN  = "\033[1;32m"  # Color for start point
@@ -11,6 +13,8 @@ HEAD   = "\033[1;34m"  # Color for current position
 BLUE   = "\033[1;36m"  # Color for current path
 YELLOW = "\033[0;33m"  # Color for traversed nodes
 
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
 # Function definitions
 def heuristic(point_a, point_b):
     """
@@ -26,26 +30,6 @@ def heuristic(point_a, point_b):
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
 
-def get_neighbors(position, maze):
-    """
-    Get valid neighboring positions (walkable cells only).
-    
-    Args:
-        position (tuple): Current position (x, y).
-        maze (list): 2D grid representing the maze.
-        
-    Returns:
-        list: List of valid neighboring positions.
-    """
-    x, y = position
-    neighbors = []
-    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Up, Right, Down, Left
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
-            neighbors.append((nx, ny))
-    return neighbors
-
-
 def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True):
     """
     Visualize the maze with current path and traversed nodes.
@@ -58,8 +42,8 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
         traversed_nodes (list): Nodes that have been traversed.
         step (int): Current step number.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
     if not hasattr(visualize_maze, 'prev_path'):
         visualize_maze.prev_path = []
     
@@ -73,8 +57,8 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
 
     visualize_maze.prev_path = current_path.copy()
     h_value = heuristic(current_position, end)
-    print(f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}")
-    print(f"Nodes expanded: {len(traversed_nodes)}")
+    header = [f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
     
     delay = 0.1
     if step == 1:
@@ -87,47 +71,13 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
     else:
         explanation = "Exploring: Moving to next position in queue..."
     
-    print(explanation)
+    header.append(explanation)
     
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            pos = (i, j)
-            if ansi:
-                if pos == start:
-                    print(f"{GREEN}S", end="\033[0m ")
-                elif pos == end:
-                    print(f"{RED}E", end="\033[0m ")
-                elif pos == current_position:
-                    print(f"{HEAD}@", end="\033[0m ")
-                elif pos in current_path:
-                    print(f"{BLUE}*", end="\033[0m ")
-                elif pos in traversed_nodes:
-                    print(f"{YELLOW}.", end="\033[0m ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-            else:
-                if pos == start:
-                    print("S", end=" ")
-                elif pos == end:
-                    print("E", end=" ")
-                elif pos == current_position:
-                    print("@", end=" ")
-                elif pos in current_path:
-                    print("*", end=" ")
-                elif pos in traversed_nodes:
-                    print(".", end=" ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-        print()
-    print()
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
     time.sleep(delay)
 
 
-def bfs(start, end, maze, visualize=False, ansi=True):
+def bfs_search(start, end, maze, visualize=False, ansi=True, parents=None):
     """
     Solve the maze using Breadth-First Search.
     
@@ -137,55 +87,71 @@ def bfs(start, end, maze, visualize=False, ansi=True):
         maze (list): 2D grid representing the maze.
         visualize (bool): Whether to visualize the search process.
         ansi (bool): Whether to use ANSI color in visualization.
+        parents (callable): parents(maze) -> empty store for each node's parent; a dict
+            if omitted. bitGrid.ParentBits keeps three bits per cell at about half the speed.
         
     Returns:
-        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+        tuple: (path, traversed_nodes)
     """
-    start_time = time.time()
     start, end = tuple(start), tuple(end)
 
-    frontier = deque([(start, [start])])
-    visited = {start}
+    frontier = deque([start])
+    came_from = parents(maze) if parents else {}  # Parent of each discovered node
+    came_from[start] = None
     nodes_traversed = 0
     traversed_nodes = []
     step = 0
 
-    # Start tracing memory
-    tracemalloc.start()
-
     while frontier:
-        current, path = frontier.popleft()
+        current = frontier.popleft()
         traversed_nodes.append(current)
         nodes_traversed = len(traversed_nodes)
 
         if visualize:
-            visualize_maze(maze, start, end, path, traversed_nodes, nodes_traversed, ansi=ansi)
+            visualize_maze(maze, start, end, reconstruct_path(came_from, current), traversed_nodes, nodes_traversed, ansi=ansi)
 
         if current == end:
-            time.sleep(0.000000000000000000000000000001)  # Allow time to update
-            time_taken = time.time() - start_time
-            peak_memory = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            path = reconstruct_path(came_from, current)
             if visualize:
                 visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
                 print("Path found! Press Enter to continue...")
                 input()
-            return path, nodes_traversed, time_taken, traversed_nodes, peak_memory
+            return path, traversed_nodes
 
         for neighbor in get_neighbors(current, maze):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                frontier.append((neighbor, new_path))
+            if neighbor not in came_from:
+                came_from[neighbor] = current
+                frontier.append(neighbor)
 
-    time_taken = time.time() - start_time
-    peak_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
     if visualize:
         visualize_maze(maze, start, end, [], traversed_nodes, step + 1, ansi=ansi)
         print("No path found! Press Enter to continue...")
         input()
-    return [], nodes_traversed, time_taken, traversed_nodes, peak_memory
+    return [], traversed_nodes
+
+
+def bfs(start, end, maze, visualize=False, ansi=True, parents=None):
+    """
+    Solve the maze using Breadth-First Search.
+
+    The search itself is timed from outside with tracing off, then replayed
+    under tracemalloc for peak memory (see measurement.measure_once).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+        parents (callable): Parent store factory passed to bfs_search.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(bfs_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(bfs_search, start, end, maze, parents=parents)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
 
 
 def main():
@@ -226,7 +192,8 @@ def main():
         maze = test_case["maze"]
         start_point = test_case["start"]
         end_point = test_case["end"]
-        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = bfs(start_point, end_point, maze, visualize=False)
+        # The summary reports peak memory, so keep parents in the compact store
+        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = bfs(start_point, end_point, maze, visualize=False, parents=ParentBits)
 
         solution_found = bool(path)
         steps = len(path) - 1 if solution_found else 0
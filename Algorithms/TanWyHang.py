@@ -1,8 +1,10 @@
-import os
 import time
 import heapq
-import tracemalloc
+from frameRenderer import FrameRenderer
 from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from bitGrid import ParentBits
+from searchCore import get_neighbors, reconstruct_path
 
 # Constants
 GREEN  = "\033[1;32m"  # Color for start point
@@ -11,6 +13,8 @@ HEAD   = "\033[1;34m"  # Color for current position
 BLUE   = "\033[1;36m"  # Color for current path
 YELLOW = "\033[0;33m"  # Color for traversed nodes
 
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
 # Function definitions
 def heuristic(point_a, point_b):
     """
@@ -26,27 +30,7 @@ def heuristic(point_a, point_b):
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
 
-def get_neighbors(position, maze):
-    """
-    Get valid neighboring positions (walkable cells only).
-    
-    Args:
-        position (tuple): Current position (x, y).
-        maze (list): 2D grid representing the maze.
-        
-    Returns:
-        list: List of valid neighboring positions.
-    """
-    x, y = position
-    neighbors = []
-    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Up, Right, Down, Left
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
-            neighbors.append((nx, ny))
-    return neighbors
-
-
-def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True):
+def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True, heuristic_fn=heuristic):
     """
     Visualize the maze with current path and traversed nodes.
     
@@ -57,9 +41,10 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
         current_path (list): Current path being explored.
         traversed_nodes (list): Nodes that have been traversed.
         step (int): Current step number.
+        heuristic_fn (callable): Heuristic shown in the header.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
     if not hasattr(visualize_maze, 'prev_path'):
         visualize_maze.prev_path = []
     
@@ -72,9 +57,10 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
             backtracking = True
 
     visualize_maze.prev_path = current_path.copy()
-    h_value = heuristic(current_position, end)
-    print(f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}")
-    print(f"Nodes expanded: {len(traversed_nodes)}")
+    h_value = heuristic_fn(current_position, end)
+    label = "Manhattan distance" if heuristic_fn is heuristic else "h(n)"
+    header = [f"Current position: {current_position}, Heuristic ({label}): {h_value}"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
     
     delay = 0.1
     if step == 1:
@@ -87,48 +73,14 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
     else:
         explanation = "Exploring: Moving to a promising position..."
     
-    print(explanation)
+    header.append(explanation)
     
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            pos = (i, j)
-            if ansi:
-                if pos == start:
-                    print(f"{GREEN}S", end="\033[0m ")
-                elif pos == end:
-                    print(f"{RED}E", end="\033[0m ")
-                elif pos == current_position:
-                    print(f"{HEAD}@", end="\033[0m ")
-                elif pos in current_path:
-                    print(f"{BLUE}*", end="\033[0m ")
-                elif pos in traversed_nodes:
-                    print(f"{YELLOW}.", end="\033[0m ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-            else:
-                if pos == start:
-                    print("S", end=" ")
-                elif pos == end:
-                    print("E", end=" ")
-                elif pos == current_position:
-                    print("@", end=" ")
-                elif pos in current_path:
-                    print("*", end=" ")
-                elif pos in traversed_nodes:
-                    print(".", end=" ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-        print()
-    print()
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
     time.sleep(delay)
 
 
 # can change to other algorithms
-def greedy_bfs(start, end, maze, visualize=False, ansi=True):
+def greedy_bfs_search(start, end, maze, visualize=False, ansi=True, heuristic_fn=heuristic, parents=None):
     """
     Solve the maze using Greedy Best-First Search.
     
@@ -138,59 +90,77 @@ def greedy_bfs(start, end, maze, visualize=False, ansi=True):
         maze (list): 2D grid representing the maze.
         visualize (bool): Whether to visualize the search process.
         ansi (bool): Whether to use ANSI color in visualization.
+        heuristic_fn (callable): h(position, goal), Manhattan distance by default.
+        parents (callable): parents(maze) -> empty store for each node's parent; a dict
+            if omitted. bitGrid.ParentBits keeps three bits per cell at about half the speed.
         
     Returns:
-        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+        tuple: (path, traversed_nodes)
     """
-    start_time = time.time()
     start, end = tuple(start), tuple(end)
 
     position_id = 0  # Tie-breaker for items with same heuristic
-    frontier = [(heuristic(start, end), position_id, start, [start])]
+    frontier = [(heuristic_fn(start, end), position_id, start)]
     heapq.heapify(frontier)
 
-    visited = {start}
+    came_from = parents(maze) if parents else {}  # Parent of each discovered node
+    came_from[start] = None
     nodes_traversed = 0
     traversed_nodes = []
     step = 0
 
-    # Start tracing memory
-    tracemalloc.start()
-
     while frontier:
-        _, _, current, path = heapq.heappop(frontier)
+        _, _, current = heapq.heappop(frontier)
         traversed_nodes.append(current)
         nodes_traversed = len(traversed_nodes)
 
         if visualize:
-            visualize_maze(maze, start, end, path, traversed_nodes, nodes_traversed, ansi=ansi)
+            visualize_maze(maze, start, end, reconstruct_path(came_from, current), traversed_nodes, nodes_traversed, ansi=ansi, heuristic_fn=heuristic_fn)
 
         if current == end:
-            time.sleep(0.000000000000000000000000000001)  # Allow time to update
-            time_taken = time.time() - start_time
-            peak_memory = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            path = reconstruct_path(came_from, current)
             if visualize:
-                visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
+                visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi, heuristic_fn=heuristic_fn)
                 print("Path found! Press Enter to continue...")
                 input()
-            return path, nodes_traversed, time_taken, traversed_nodes, peak_memory
+            return path, traversed_nodes
 
         for neighbor in get_neighbors(current, maze):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
+            if neighbor not in came_from:
+                came_from[neighbor] = current
                 position_id += 1
-                heapq.heappush(frontier, (heuristic(neighbor, end), position_id, neighbor, new_path))
+                heapq.heappush(frontier, (heuristic_fn(neighbor, end), position_id, neighbor))
 
-    time_taken = time.time() - start_time
-    peak_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
     if visualize:
-        visualize_maze(maze, start, end, [], traversed_nodes, step + 1, ansi=ansi)
+        visualize_maze(maze, start, end, [], traversed_nodes, step + 1, ansi=ansi, heuristic_fn=heuristic_fn)
         print("No path found! Press Enter to continue...")
         input()
-    return [], nodes_traversed, time_taken, traversed_nodes, peak_memory
+    return [], traversed_nodes
+
+
+def greedy_bfs(start, end, maze, visualize=False, ansi=True, heuristic_fn=heuristic, parents=None):
+    """
+    Solve the maze using Greedy Best-First Search.
+
+    The search itself is timed from outside with tracing off, then replayed
+    under tracemalloc for peak memory (see measurement.measure_once).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+        heuristic_fn (callable): h(position, goal), Manhattan distance by default.
+        parents (callable): Parent store factory passed to greedy_bfs_search.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(greedy_bfs_search, start, end, maze, visualize=True, ansi=ansi, heuristic_fn=heuristic_fn)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(greedy_bfs_search, start, end, maze, heuristic_fn=heuristic_fn, parents=parents)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
 
 
 def main():
@@ -231,7 +201,8 @@ def main():
         maze = test_case["maze"]
         start_point = test_case["start"]
         end_point = test_case["end"]
-        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = greedy_bfs(start_point, end_point, maze, visualize=False)
+        # The summary reports peak memory, so keep parents in the compact store
+        path, nodes_expanded, time_taken, traversed_nodes, peak_memory = greedy_bfs(start_point, end_point, maze, visualize=False, parents=ParentBits)
 
         solution_found = bool(path)
         steps = len(path) - 1 if solution_found else 0
@@ -1,9 +1,10 @@
-import os
 import time
 import random
 import math
-import tracemalloc
+from frameRenderer import FrameRenderer
 from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from searchCore import get_neighbors
 
 # Constants
 GREEN  = "\033[1;32m"  # Color for start point
@@ -12,6 +13,8 @@ HEAD   = "\033[1;34m"  # Color for current position
 BLUE   = "\033[1;36m"  # Color for current path
 YELLOW = "\033[0;33m"  # Color for traversed nodes
 
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
 # Function definitions
 def heuristic(point_a, point_b):
     """
@@ -26,25 +29,6 @@ def heuristic(point_a, point_b):
     """
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
-def get_neighbors(position, maze):
-    """
-    Get valid neighboring positions (walkable cells only).
-    
-    Args:
-        position (tuple): Current position (x, y).
-        maze (list): 2D grid representing the maze.
-        
-    Returns:
-        list: List of valid neighboring positions.
-    """
-    x, y = position
-    neighbors = []
-    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Up, Right, Down, Left
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
-            neighbors.append((nx, ny))
-    return neighbors
-
 def visualize_maze(maze, start, end, current_path, traversed_nodes, step, temperature, ansi=True):
     """
     Visualize the maze with current path and traversed nodes.
@@ -58,8 +42,8 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, temper
         step (int): Current step number.
         temperature (float): Current temperature in simulated annealing.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
     if not hasattr(visualize_maze, 'prev_path'):
         visualize_maze.prev_path = []
     
@@ -72,9 +56,9 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, temper
 
     visualize_maze.prev_path = current_path.copy()
     h_value = heuristic(current_position, end)
-    print(f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}")
-    print(f"Nodes expanded: {len(traversed_nodes)}")
-    print(f"Current temperature: {temperature:.2f}")
+    header = [f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
+    header.append(f"Current temperature: {temperature:.2f}")
     
     delay = 0.1
     if step == 1:
@@ -87,46 +71,12 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, temper
     else:
         explanation = "Exploring: Moving to a random neighbor..."
     
-    print(explanation)
+    header.append(explanation)
     
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            pos = (i, j)
-            if ansi:
-                if pos == start:
-                    print(f"{GREEN}S", end="\033[0m ")
-                elif pos == end:
-                    print(f"{RED}E", end="\033[0m ")
-                elif pos == current_position:
-                    print(f"{HEAD}@", end="\033[0m ")
-                elif pos in current_path:
-                    print(f"{BLUE}*", end="\033[0m ")
-                elif pos in traversed_nodes:
-                    print(f"{YELLOW}.", end="\033[0m ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-            else:
-                if pos == start:
-                    print("S", end=" ")
-                elif pos == end:
-                    print("E", end=" ")
-                elif pos == current_position:
-                    print("@", end=" ")
-                elif pos in current_path:
-                    print("*", end=" ")
-                elif pos in traversed_nodes:
-                    print(".", end=" ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-        print()
-    print()
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
     time.sleep(delay)
 
-def simulated_annealing(start, end, maze, visualize=False, ansi=True):
+def simulated_annealing_search(start, end, maze, visualize=False, ansi=True):
     """
     Solve the maze using Simulated Annealing Search.
     
@@ -138,9 +88,8 @@ def simulated_annealing(start, end, maze, visualize=False, ansi=True):
         ansi (bool): Whether to use ANSI color in visualization.
         
     Returns:
-        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+        tuple: (path, traversed_nodes)
     """
-    start_time = time.time()
     start, end = tuple(start), tuple(end)
 
     # Simulated Annealing parameters
@@ -160,9 +109,6 @@ def simulated_annealing(start, end, maze, visualize=False, ansi=True):
     traversed_nodes = [start]
     step = 0
 
-    # Start tracing memory
-    tracemalloc.start()
-
     temperature = initial_temp
     iteration = 0
 
@@ -204,13 +150,8 @@ def simulated_annealing(start, end, maze, visualize=False, ansi=True):
         if current_position == end:
             break
 
-    time_taken = time.time() - start_time
-    peak_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-
     # Use the best path found
     path = best_path if best_position == end else []
-    nodes_traversed = len(traversed_nodes)
 
     if visualize:
         visualize_maze(maze, start, end, path, traversed_nodes, step + 1, temperature, ansi=ansi)
@@ -220,7 +161,29 @@ def simulated_annealing(start, end, maze, visualize=False, ansi=True):
             print("No path found! Press Enter to continue...")
         input()
 
-    return path, nodes_traversed, time_taken, traversed_nodes, peak_memory
+    return path, traversed_nodes
+
+def simulated_annealing(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Simulated Annealing Search.
+
+    The search itself is timed from outside with tracing off, then replayed
+    under tracemalloc for peak memory (see measurement.measure_once).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(simulated_annealing_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(simulated_annealing_search, start, end, maze)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
 
 def main():
     """
@@ -1,7 +1,8 @@
-import os
 import time
-import tracemalloc
+from frameRenderer import FrameRenderer
 from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from searchCore import get_neighbors
 
 # Constants
 GREEN  = "\033[1;32m"  # Color for start point
@@ -10,6 +11,8 @@ HEAD   = "\033[1;34m"  # Color for current position
 BLUE   = "\033[1;36m"  # Color for current path
 YELLOW = "\033[0;33m"  # Color for traversed nodes
 
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
 # Function definitions
 def heuristic(point_a, point_b):
     """
@@ -24,25 +27,6 @@ def heuristic(point_a, point_b):
     """
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
-def get_neighbors(position, maze):
-    """
-    Get valid neighboring positions (walkable cells only).
-    
-    Args:
-        position (tuple): Current position (x, y).
-        maze (list): 2D grid representing the maze.
-        
-    Returns:
-        list: List of valid neighboring positions.
-    """
-    x, y = position
-    neighbors = []
-    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Up, Right, Down, Left
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
-            neighbors.append((nx, ny))
-    return neighbors
-
 def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=True):
     """
     Visualize the maze with current path and traversed nodes.
@@ -55,8 +39,8 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
         traversed_nodes (list): Nodes that have been traversed.
         step (int): Current step number.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
     if not hasattr(visualize_maze, 'prev_path'):
         visualize_maze.prev_path = []
     
@@ -69,8 +53,8 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
 
     visualize_maze.prev_path = current_path.copy()
     h_value = heuristic(current_position, end)
-    print(f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}")
-    print(f"Nodes expanded: {len(traversed_nodes)}")
+    header = [f"Current position: {current_position}, Heuristic (Manhattan distance): {h_value}"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
     
     delay = 0.1
     if step == 1:
@@ -83,46 +67,12 @@ def visualize_maze(maze, start, end, current_path, traversed_nodes, step, ansi=T
     else:
         explanation = "Exploring: Moving to the neighbor with the best heuristic..."
     
-    print(explanation)
+    header.append(explanation)
     
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            pos = (i, j)
-            if ansi:
-                if pos == start:
-                    print(f"{GREEN}S", end="\033[0m ")
-                elif pos == end:
-                    print(f"{RED}E", end="\033[0m ")
-                elif pos == current_position:
-                    print(f"{HEAD}@", end="\033[0m ")
-                elif pos in current_path:
-                    print(f"{BLUE}*", end="\033[0m ")
-                elif pos in traversed_nodes:
-                    print(f"{YELLOW}.", end="\033[0m ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-            else:
-                if pos == start:
-                    print("S", end=" ")
-                elif pos == end:
-                    print("E", end=" ")
-                elif pos == current_position:
-                    print("@", end=" ")
-                elif pos in current_path:
-                    print("*", end=" ")
-                elif pos in traversed_nodes:
-                    print(".", end=" ")
-                elif maze[i][j] == 1:
-                    print("0", end=" ")
-                else:
-                    print(" ", end=" ")
-        print()
-    print()
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
     time.sleep(delay)
 
-def hill_climbing(start, end, maze, visualize=False, ansi=True):
+def hill_climbing_search(start, end, maze, visualize=False, ansi=True):
     """
     Solve the maze using Hill Climbing algorithm.
     
@@ -134,20 +84,15 @@ def hill_climbing(start, end, maze, visualize=False, ansi=True):
         ansi (bool): Whether to use ANSI color in visualization.
         
     Returns:
-        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+        tuple: (path, traversed_nodes)
     """
-    start_time = time.time()
     start, end = tuple(start), tuple(end)
 
     current = start
     path = [start]
     traversed_nodes = [start]
-    nodes_traversed = 1
     step = 0
 
-    # Start tracing memory
-    tracemalloc.start()
-
     while current != end:
         step += 1
         if visualize:
@@ -157,14 +102,11 @@ def hill_climbing(start, end, maze, visualize=False, ansi=True):
         neighbors = get_neighbors(current, maze)
         if not neighbors:
             # No valid neighbors, no path exists
-            time_taken = time.time() - start_time
-            peak_memory = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
             if visualize:
                 visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
                 print("No path found! Press Enter to continue...")
                 input()
-            return [], nodes_traversed, time_taken, traversed_nodes, peak_memory
+            return [], traversed_nodes
 
         # Find the neighbor with the lowest heuristic value
         best_neighbor = min(neighbors, key=lambda x: heuristic(x, end), default=None)
@@ -173,29 +115,44 @@ def hill_climbing(start, end, maze, visualize=False, ansi=True):
 
         # If no better neighbor is found, we're stuck
         if best_heuristic >= current_heuristic:
-            time_taken = time.time() - start_time
-            peak_memory = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
             if visualize:
                 visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
                 print("No path found! Stuck at local minimum. Press Enter to continue...")
                 input()
-            return [], nodes_traversed, time_taken, traversed_nodes, peak_memory
+            return [], traversed_nodes
 
         # Move to the best neighbor
         current = best_neighbor
         path.append(current)
         traversed_nodes.append(current)
-        nodes_traversed += 1
 
-    time_taken = time.time() - start_time
-    peak_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
     if visualize:
         visualize_maze(maze, start, end, path, traversed_nodes, step + 1, ansi=ansi)
         print("Path found! Press Enter to continue...")
         input()
-    return path, nodes_traversed, time_taken, traversed_nodes, peak_memory
+    return path, traversed_nodes
+
+def hill_climbing(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Hill Climbing algorithm.
+
+    The search itself is timed from outside with tracing off, then replayed
+    under tracemalloc for peak memory (see measurement.measure_once).
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(hill_climbing_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(hill_climbing_search, start, end, maze)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
 
 def main():
     """
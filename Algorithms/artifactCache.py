@@ -0,0 +1,314 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from mazeSamples import maze_grid, maze_test_cases
+from flatGrid import FlatGrid, hash_cells
+from corridorGraph import JunctionGraph
+from batchQuery import distance_field, path_from_field
+
+# Cache files live under this directory unless MAZE_CACHE_DIR says otherwise
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".maze_cache")
+
+# File layout, all little-endian except the array payloads, which are stored
+# in the machine's native order recorded in the header:
+#   header:  magic, format version, byte order ("<" or ">"), section count
+#   table:   one (name, typecode, item size, byte offset, item count) per section
+#   payload: each section's raw array bytes, starting on an 8-byte boundary
+MAGIC = b"MZAC"
+VERSION = 1
+HEADER = struct.Struct("<4sHcxI")
+SECTION = struct.Struct("<16scBxxxxxxQQ")
+ALIGNMENT = 8
+BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+
+def write_sections(path, sections):
+    """
+    Write named arrays to one binary file, replacing it atomically.
+
+    Args:
+        path (str): Destination file.
+        sections (dict): Section name -> (typecode, array or bytes-like).
+    """
+    table = []
+    position = HEADER.size + SECTION.size * len(sections)
+    for name, (typecode, values) in sections.items():
+        position = -(-position // ALIGNMENT) * ALIGNMENT
+        itemsize = array(typecode).itemsize
+        table.append((name, typecode, itemsize, position, len(values)))
+        position += itemsize * len(values)
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, BYTE_ORDER, len(sections)))
+            for name, typecode, itemsize, offset, count in table:
+                file.write(SECTION.pack(name.encode(), typecode.encode(), itemsize, offset, count))
+            for (name, typecode, itemsize, offset, count), (_, values) in zip(table, sections.values()):
+                file.write(b"\0" * (offset - file.tell()))
+                file.write(memoryview(values).cast("B"))
+        # Readers either see the old file or the complete new one, never half of it
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def read_sections(path):
+    """
+    Memory-map a file written by write_sections.
+
+    Args:
+        path (str): File to map.
+
+    Returns:
+        dict: Section name -> read-only memoryview with the section's typecode,
+        or None if the file is missing, truncated or from another format version.
+    """
+    try:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    view = None
+    parsed = {}
+    sections = None
+    try:
+        if len(mapped) < HEADER.size:
+            return None
+        magic, version, byte_order, count = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION or byte_order != BYTE_ORDER:
+            return None
+        if len(mapped) < HEADER.size + SECTION.size * count:
+            return None
+
+        view = memoryview(mapped)
+        for index in range(count):
+            name, typecode, itemsize, offset, length = SECTION.unpack_from(mapped, HEADER.size + SECTION.size * index)
+            try:
+                typecode = typecode.decode()
+                valid = array(typecode).itemsize == itemsize
+            except (UnicodeDecodeError, ValueError):
+                valid = False
+            if not valid or offset + itemsize * length > len(mapped):
+                return None
+            parsed[name.rstrip(b"\0").decode(errors="replace")] = view[offset:offset + itemsize * length].cast(typecode)
+        sections = parsed
+        return sections
+    finally:
+        # A rejected file must not leave its mapping open; views pin it until released
+        if sections is None:
+            for part in parsed.values():
+                part.release()
+            if view is not None:
+                view.release()
+            mapped.close()
+
+
+class ArtifactCache:
+    """
+    On-disk cache of everything derived from a maze, keyed by the maze's contents.
+
+    Each maze gets a directory named after FlatGrid.content_hash(). The first
+    run builds an artifact and writes it there; later runs (and other worker
+    processes) memory-map the file instead of recomputing. Mapped arrays are
+    shared read-only pages, so many short-lived workers on one machine cost
+    one copy of the data. Artifacts stored:
+
+        grid.bin       open-cell list and CSR adjacency table (offsets, targets)
+        junctions.bin  dead-end filling and corridor contraction (JunctionGraph)
+        field-<id>.bin BFS distance field towards goal cell <id>
+    """
+
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory (str): Cache root, defaults to MAZE_CACHE_DIR or DEFAULT_DIRECTORY.
+        """
+        self.directory = directory or os.environ.get("MAZE_CACHE_DIR") or DEFAULT_DIRECTORY
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key, name):
+        """
+        Location of one artifact file for the maze with the given content hash.
+        """
+        return os.path.join(self.directory, key, name)
+
+    def load(self, key, name, build):
+        """
+        Map an artifact, building and storing it first on a miss.
+
+        Args:
+            key (str): Maze content hash.
+            name (str): Artifact file name.
+            build (callable): Returns the sections to store when the file is unusable.
+
+        Returns:
+            dict: Section name -> memoryview.
+        """
+        path = self.path(key, name)
+        sections = read_sections(path)
+        if sections is not None:
+            self.hits += 1
+            return sections
+        self.misses += 1
+        write_sections(path, build())
+        return read_sections(path)
+
+    def grid(self, maze):
+        """
+        Get a FlatGrid whose neighbor table and open-cell list come from the cache.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+
+        Returns:
+            FlatGrid: Grid backed by mapped arrays.
+        """
+        if isinstance(maze, FlatGrid):
+            height, width, cells = maze.height, maze.width, maze.cells
+        else:
+            height, width = len(maze), len(maze[0]) if maze else 0
+            cells = bytearray(cell for row in maze for cell in row)
+        key = hash_cells(height, width, cells)
+
+        def build():
+            built = maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+            return {
+                "offsets": ("I", built.offsets),
+                "targets": ("I", built.targets),
+                "open_cells": ("I", built.open_cells),
+            }
+
+        sections = self.load(key, "grid.bin", build)
+        return FlatGrid.from_arrays(height, width, cells, sections["offsets"], sections["targets"],
+                                    sections["open_cells"])
+
+    def junction_graph(self, grid):
+        """
+        Get the JunctionGraph of a grid from the cache.
+
+        Args:
+            grid (FlatGrid): Maze, usually from ArtifactCache.grid.
+
+        Returns:
+            JunctionGraph: Graph backed by mapped arrays.
+        """
+        def build():
+            graph = JunctionGraph(grid)
+            starts = array("I", [0])
+            flat = array("I")
+            for cells in graph.corridors:
+                flat.extend(cells)
+                starts.append(len(flat))
+            return {
+                "removed": ("B", graph.removed),
+                "exit_cell": ("i", graph.exit_cell),
+                "depth": ("i", graph.depth),
+                "filled_count": ("I", array("I", [graph.filled_count])),
+                "junctions": ("I", array("I", graph.junctions)),
+                "corridor_starts": ("I", starts),
+                "corridor_cells": ("I", flat),
+                "edge_nodes": ("I", array("I", [node for edge in graph.edge_nodes for node in edge])),
+                "corridor_of": ("i", graph.corridor_of),
+                "offset_in": ("i", graph.offset_in),
+            }
+
+        sections = self.load(grid.content_hash(), "junctions.bin", build)
+        starts, flat, nodes = sections["corridor_starts"], sections["corridor_cells"], sections["edge_nodes"]
+        corridors = [flat[starts[index]:starts[index + 1]] for index in range(len(starts) - 1)]
+        edge_nodes = [(nodes[index], nodes[index + 1]) for index in range(0, len(nodes), 2)]
+        return JunctionGraph.from_arrays(grid, sections["removed"], sections["exit_cell"], sections["depth"],
+                                         sections["filled_count"][0], sections["junctions"], corridors,
+                                         edge_nodes, sections["corridor_of"], sections["offset_in"])
+
+    def field_path(self, grid, goal):
+        """
+        Location of the distance field file towards a goal.
+        """
+        return self.path(grid.content_hash(), f"field-{grid.cell_id(goal)}.bin")
+
+    def lookup_field(self, grid, goal):
+        """
+        Map a stored distance field without building it on a miss.
+
+        Args:
+            grid (FlatGrid): Maze, usually from ArtifactCache.grid.
+            goal (tuple): Goal position (x, y).
+
+        Returns:
+            tuple: (distances, nodes_expanded), or None if the field is not stored.
+        """
+        sections = read_sections(self.field_path(grid, goal))
+        if sections is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return sections["distances"], sections["nodes_expanded"][0]
+
+    def store_field(self, grid, goal, entry):
+        """
+        Store a distance field built by batchQuery.distance_field.
+        """
+        distances, nodes_expanded = entry
+        write_sections(self.field_path(grid, goal), {
+            "distances": ("i", distances),
+            "nodes_expanded": ("I", array("I", [nodes_expanded])),
+        })
+
+    def distance_field(self, grid, goal):
+        """
+        Get the BFS distance field towards a goal from the cache, building it on a miss.
+
+        Args:
+            grid (FlatGrid): Maze, usually from ArtifactCache.grid.
+            goal (tuple): Goal position (x, y).
+
+        Returns:
+            tuple: (distances, nodes_expanded) as returned by batchQuery.distance_field.
+        """
+        entry = self.lookup_field(grid, goal)
+        if entry is None:
+            entry = distance_field(grid, goal)
+            self.store_field(grid, goal, entry)
+        return entry
+
+def main():
+    """
+    Time a cold and a warm start over the sample maze and check the answers agree.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        queries = [(tuple(test_case["start"]), tuple(test_case["end"])) for test_case in maze_test_cases]
+        timings = {}
+        for label in ("cold", "warm"):
+            cache = ArtifactCache(directory)
+            start_time = time.perf_counter()
+            grid = cache.grid(maze_grid)
+            graph = cache.junction_graph(grid)
+            fields = {end: cache.distance_field(grid, end)[0] for _, end in queries}
+            ready_time = time.perf_counter() - start_time
+            paths = [path_from_field(grid, fields[end], start) for start, end in queries]
+            first_query = graph.solve(*queries[0])[0]
+            timings[label] = (ready_time, paths, first_query, cache.hits, cache.misses)
+
+        print("\nArtifact Cache (sample maze, all artifacts)")
+        print("+-------+-------------------+--------+--------+")
+        print("| Start | Startup Time (ms) | Hits   | Misses |")
+        print("+-------+-------------------+--------+--------+")
+        for label, (ready_time, _, _, hits, misses) in timings.items():
+            print(f"| {label:<5} | {ready_time * 1000:^17.4f} | {hits:^6} | {misses:^6} |")
+        print("+-------+-------------------+--------+--------+")
+        same = timings["cold"][1:3] == timings["warm"][1:3]
+        print(f"Cached artifacts give the same answers: {same}")
+        print(f"Cache key: {grid.content_hash()}")
+
+
+if __name__ == "__main__":
+    main()
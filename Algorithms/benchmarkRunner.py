@@ -0,0 +1,170 @@
+import argparse
+import importlib
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from mazeSamples import maze_test_cases
+
+# Display name -> (module, solver function) for every solver
+ALGORITHMS = {
+    "A*": ("ChiaZhenYang", "astar"),
+    "JPS": ("ChiaZhenYang", "jps"),
+    "GREEDY-BFS": ("TanWyHang", "greedy_bfs"),
+    "BFS": ("Shan", "bfs"),
+    "DFS": ("YongZiSheng", "dfs"),
+    "HILL-CLIMBING": ("YapJinYan", "hill_climbing"),
+    "SIMULATED ANNEALING": ("WongYingYi", "simulated_annealing"),
+    "BIDIRECTIONAL BFS": ("bidirectionalSearch", "bidirectional_bfs"),
+    "BIDIRECTIONAL A*": ("bidirectionalSearch", "bidirectional_astar"),
+    "TREE LCA": ("treeIndex", "tree_path"),
+}
+
+
+def run_case(algorithm, case_index, repetition):
+    """
+    Run one solver on one test case. Executed inside a worker process.
+
+    Args:
+        algorithm (str): Key into ALGORITHMS.
+        case_index (int): Index into maze_test_cases.
+        repetition (int): Repetition number, also used to seed the RNG.
+
+    Returns:
+        dict: Raw measurement for this (algorithm, case, repetition).
+    """
+    module_name, function_name = ALGORITHMS[algorithm]
+    solver = getattr(importlib.import_module(module_name), function_name)
+    test_case = maze_test_cases[case_index]
+    # Simulated annealing is randomized; seed so runs are reproducible
+    random.seed(case_index * 1000 + repetition)
+    path, nodes_expanded, time_taken, _, peak_memory = solver(
+        test_case["start"], test_case["end"], test_case["maze"], visualize=False)
+    return {
+        "algorithm": algorithm,
+        "case": case_index,
+        "found": bool(path),
+        "path_length": len(path),
+        "nodes_expanded": nodes_expanded,
+        "time": time_taken,
+        "peak_memory": peak_memory,
+    }
+
+
+def run_matrix(algorithms, repeat, workers=None):
+    """
+    Fan the (algorithm x test case x repetition) matrix out over a process pool.
+
+    Args:
+        algorithms (list): Keys into ALGORITHMS to run.
+        repeat (int): Repetitions per (algorithm, test case).
+        workers (int): Worker processes, defaults to the CPU count.
+
+    Returns:
+        list: Raw measurements from run_case.
+    """
+    tasks = [(algorithm, case_index, repetition)
+             for algorithm in algorithms
+             for case_index in range(len(maze_test_cases))
+             for repetition in range(repeat)]
+    workers = workers or os.cpu_count() or 1
+    # Batch tasks per round trip so IPC does not dominate the short searches
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_case, *zip(*tasks), chunksize=chunksize))
+
+
+def merge_results(measurements):
+    """
+    Merge repetitions into one row per (algorithm, test case).
+
+    Time is the median over repetitions; the other columns take the first
+    repetition, except peak memory which takes the maximum.
+
+    Args:
+        measurements (list): Raw measurements from run_case.
+
+    Returns:
+        list: Merged rows ordered by algorithm then test case.
+    """
+    grouped = {}
+    for measurement in measurements:
+        grouped.setdefault((measurement["algorithm"], measurement["case"]), []).append(measurement)
+    order = list(ALGORITHMS)
+    rows = []
+    for (algorithm, case_index), runs in sorted(grouped.items(), key=lambda item: (order.index(item[0][0]), item[0][1])):
+        first = runs[0]
+        rows.append({
+            "algorithm": algorithm,
+            "maze_num": case_index + 1,
+            "found": sum(run["found"] for run in runs),
+            "runs": len(runs),
+            "path_length": first["path_length"],
+            "nodes_expanded": first["nodes_expanded"],
+            "time": statistics.median(run["time"] for run in runs),
+            "peak_memory_mb": max(run["peak_memory"] for run in runs) / (1024 * 1024),
+        })
+    return rows
+
+
+def print_comparison(rows, detail=False):
+    """
+    Print one comparison table across all algorithms.
+
+    Args:
+        rows (list): Merged rows from merge_results.
+        detail (bool): Whether to print one row per test case instead of per algorithm.
+    """
+    print("\nAlgorithm Comparison")
+    print("+---------------------+--------+---------+-------------------+-------------------+---------------------+-------------------+")
+    print("| Algorithm           | Maze # | Solved  | Nodes Traversed   | Path Length       | Median Time (s)     | Peak Memory (MB)  |")
+    print("+---------------------+--------+---------+-------------------+-------------------+---------------------+-------------------+")
+    if detail:
+        for row in rows:
+            print(f"| {row['algorithm']:<19} | "
+                  f"{row['maze_num']:^6} | "
+                  f"{str(row['found']) + '/' + str(row['runs']):^7} | "
+                  f"{row['nodes_expanded']:^17} | "
+                  f"{row['path_length']:^17} | "
+                  f"{row['time']:<19.16f} | "
+                  f"{row['peak_memory_mb']:^17.6f} |")
+    else:
+        for algorithm in ALGORITHMS:
+            algorithm_rows = [row for row in rows if row["algorithm"] == algorithm]
+            if not algorithm_rows:
+                continue
+            solved = sum(row["found"] for row in algorithm_rows)
+            runs = sum(row["runs"] for row in algorithm_rows)
+            print(f"| {algorithm:<19} | "
+                  f"{'All':^6} | "
+                  f"{str(solved) + '/' + str(runs):^7} | "
+                  f"{statistics.mean(row['nodes_expanded'] for row in algorithm_rows):^17.1f} | "
+                  f"{statistics.mean(row['path_length'] for row in algorithm_rows):^17.1f} | "
+                  f"{statistics.median(row['time'] for row in algorithm_rows):<19.16f} | "
+                  f"{max(row['peak_memory_mb'] for row in algorithm_rows):^17.6f} |")
+    print("+---------------------+--------+---------+-------------------+-------------------+---------------------+-------------------+")
+
+
+def main():
+    """
+    Run every solver on every test case in parallel and print one comparison table.
+    """
+    parser = argparse.ArgumentParser(description="Run all maze solvers over all test cases in parallel.")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per algorithm and test case")
+    parser.add_argument("--workers", type=int, default=None, help=f"worker processes (default: {os.cpu_count()})")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS),
+                        help="algorithms to run (default: all)")
+    parser.add_argument("--detail", action="store_true", help="print one row per test case")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    measurements = run_matrix(args.algorithms, args.repeat, args.workers)
+    elapsed = time.perf_counter() - start_time
+
+    print_comparison(merge_results(measurements), detail=args.detail)
+    print(f"\nRan {len(measurements)} searches in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
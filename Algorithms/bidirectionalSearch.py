@@ -0,0 +1,264 @@
+import time
+import heapq
+from frameRenderer import FrameRenderer
+from mazeSamples import maze_test_cases
+from measurement import measure_once, preview_run
+from searchCore import get_neighbors, reconstruct_path
+from summaryTables import make_result, print_summary
+
+# Constants
+GREEN  = "\033[1;32m"  # Color for start point
+RED    = "\033[1;31m"  # Color for end point
+HEAD   = "\033[1;34m"  # Color for current position
+BLUE   = "\033[1;36m"  # Color for current path
+YELLOW = "\033[0;33m"  # Color for traversed nodes
+
+RENDERER = FrameRenderer({"S": GREEN, "E": RED, "@": HEAD, "*": BLUE, ".": YELLOW})
+
+# Function definitions
+def heuristic(point_a, point_b):
+    """
+    Calculate Manhattan distance between two points.
+
+    Args:
+        point_a (tuple): (x, y) coordinates.
+        point_b (tuple): (x, y) coordinates.
+
+    Returns:
+        int: Manhattan distance.
+    """
+    return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
+
+def join_paths(came_from_start, came_from_end, meeting):
+    """
+    Join the two half paths that meet at a node into one start-to-goal path.
+
+    Args:
+        came_from_start (dict): Parents found searching from the start.
+        came_from_end (dict): Parents found searching from the goal.
+        meeting (tuple): Node reached by both searches.
+
+    Returns:
+        list: Positions from the start to the goal.
+    """
+    path = reconstruct_path(came_from_start, meeting)
+    path.extend(reversed(reconstruct_path(came_from_end, meeting)[:-1]))
+    return path
+
+def visualize_maze(maze, start, end, current_path, traversed_nodes, step, direction, ansi=True):
+    """
+    Visualize the maze with the side currently expanding and all traversed nodes.
+
+    Args:
+        maze (list): The maze grid.
+        start (tuple): Starting position.
+        end (tuple): Goal position.
+        current_path (list): Path from the expanding side's root to its current node.
+        traversed_nodes (list): Nodes that have been traversed by either side.
+        step (int): Current step number.
+        direction (str): "forward" or "backward".
+    """
+    if step == 1:
+        RENDERER.reset()  # New search, so the previous frame is no longer on screen
+    current_position = current_path[-1] if current_path else start
+    header = [f"Current position: {current_position}, expanding {direction} search"]
+    header.append(f"Nodes expanded: {len(traversed_nodes)}")
+    if step == 1:
+        header.append("Starting searches from both the start and the goal...")
+    else:
+        header.append("Exploring: Growing the smaller frontier until the searches meet...")
+    RENDERER.render(maze, start, end, current_path, traversed_nodes, header, ansi=ansi)
+    time.sleep(0.1)
+
+def finish_visualization(maze, start, end, path, traversed_nodes, ansi):
+    """
+    Show the final frame and wait for the user.
+    """
+    RENDERER.render(maze, start, end, path, traversed_nodes,
+                    ["Searches met!" if path else "Searches never met!",
+                     f"Nodes expanded: {len(traversed_nodes)}", ""], ansi=ansi)
+    print("Path found! Press Enter to continue..." if path else "No path found! Press Enter to continue...")
+    input()
+
+def bidirectional_bfs_search(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Bidirectional Breadth-First Search.
+
+    Both searches advance one full layer at a time, always growing the
+    smaller frontier. When a layer touches the other search, the rest of
+    that layer is still checked so the shortest joining edge is kept.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, traversed_nodes)
+    """
+    start, end = tuple(start), tuple(end)
+    came_from = {start: None}, {end: None}
+    depth = {start: 0}, {end: 0}
+    frontiers = [start], [end]
+    traversed_nodes = []
+
+    if start == end:
+        traversed_nodes.append(start)
+        return [start], traversed_nodes
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        best_length, meeting = None, None
+        next_frontier = []
+        for current in frontiers[side]:
+            traversed_nodes.append(current)
+            if visualize:
+                visualize_maze(maze, start, end, reconstruct_path(came_from[side], current), traversed_nodes,
+                               len(traversed_nodes), "forward" if side == 0 else "backward", ansi=ansi)
+            for neighbor in get_neighbors(current, maze):
+                if neighbor not in came_from[side]:
+                    came_from[side][neighbor] = current
+                    depth[side][neighbor] = depth[side][current] + 1
+                    next_frontier.append(neighbor)
+                if neighbor in came_from[other]:
+                    length = depth[side][current] + 1 + depth[other][neighbor]
+                    if best_length is None or length < best_length:
+                        best_length, meeting = length, (current, neighbor)
+        if meeting is not None:
+            current, neighbor = meeting
+            # root of this side -> current -> neighbor -> root of the other side
+            path = reconstruct_path(came_from[side], current)
+            path.extend(reversed(reconstruct_path(came_from[other], neighbor)))
+            if side == 1:
+                path.reverse()
+            if visualize:
+                finish_visualization(maze, start, end, path, traversed_nodes, ansi)
+            return path, traversed_nodes
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+    if visualize:
+        finish_visualization(maze, start, end, [], traversed_nodes, ansi)
+    return [], traversed_nodes
+
+def bidirectional_astar_search(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Bidirectional A* Search.
+
+    The forward search is guided by the distance to the goal and the backward
+    search by the distance to the start. best_cost tracks the cheapest
+    start-to-goal path seen where the searches touch. Every undiscovered
+    path must pass through both open lists, so it costs at least the larger
+    of their smallest f(n); once best_cost is no more than that, it is optimal.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, traversed_nodes)
+    """
+    start, end = tuple(start), tuple(end)
+    targets = end, start  # Each side heads for the other side's root
+    position_id = 0  # Tie-breaker for items with same f(n) score
+    # Each priority queue stores (f(n), position_id, current, g(n))
+    frontiers = [(heuristic(start, end), 0, start, 0)], [(heuristic(end, start), 0, end, 0)]
+    g_scores = {start: 0}, {end: 0}
+    came_from = {start: None}, {end: None}
+    traversed_nodes = []
+    best_cost, meeting = None, None
+
+    while frontiers[0] and frontiers[1]:
+        if best_cost is not None and best_cost <= max(frontiers[0][0][0], frontiers[1][0][0]):
+            break  # No unexplored path can beat the one already found
+
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        _, _, current, g_score = heapq.heappop(frontiers[side])
+        if g_score > g_scores[side][current]:
+            continue  # Stale entry, a cheaper route to this node was found later
+        traversed_nodes.append(current)
+
+        if visualize:
+            visualize_maze(maze, start, end, reconstruct_path(came_from[side], current), traversed_nodes,
+                           len(traversed_nodes), "forward" if side == 0 else "backward", ansi=ansi)
+
+        if current in g_scores[other]:
+            cost = g_score + g_scores[other][current]
+            if best_cost is None or cost < best_cost:
+                best_cost, meeting = cost, current
+
+        for neighbor in get_neighbors(current, maze):
+            new_g_score = g_score + 1  # Each step has a cost of 1
+            if neighbor not in g_scores[side] or new_g_score < g_scores[side][neighbor]:
+                g_scores[side][neighbor] = new_g_score
+                came_from[side][neighbor] = current
+                position_id += 1
+                f_score = new_g_score + heuristic(neighbor, targets[side])
+                heapq.heappush(frontiers[side], (f_score, position_id, neighbor, new_g_score))
+                if neighbor in g_scores[other]:
+                    cost = new_g_score + g_scores[other][neighbor]
+                    if best_cost is None or cost < best_cost:
+                        best_cost, meeting = cost, neighbor
+
+    path = join_paths(came_from[0], came_from[1], meeting) if meeting is not None else []
+    if visualize:
+        finish_visualization(maze, start, end, path, traversed_nodes, ansi)
+    return path, traversed_nodes
+
+def bidirectional_bfs(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Bidirectional Breadth-First Search.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(bidirectional_bfs_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(bidirectional_bfs_search, start, end, maze)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
+
+def bidirectional_astar(start, end, maze, visualize=False, ansi=True):
+    """
+    Solve the maze using Bidirectional A* Search.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the search process.
+        ansi (bool): Whether to use ANSI color in visualization.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if visualize:
+        preview_run(bidirectional_astar_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(bidirectional_astar_search, start, end, maze)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
+
+def main():
+    """
+    Solve all maze test cases with both bidirectional searches and print summaries.
+    """
+    for title, solver in [("BIDIRECTIONAL BFS", bidirectional_bfs), ("BIDIRECTIONAL A*", bidirectional_astar)]:
+        results = []
+        for i, test_case in enumerate(maze_test_cases, 1):
+            path, nodes_expanded, time_taken, _, peak_memory = solver(test_case["start"], test_case["end"], test_case["maze"])
+            results.append(make_result(i, test_case["start"], test_case["end"], path, nodes_expanded, time_taken, peak_memory))
+        print_summary(results, title)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+from flatGrid import DIRECTIONS
+
+# (dx, dy) -> index into DIRECTIONS, for storing a step in two bits
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+# Cell bytes (0/1) <-> ASCII bits ("0"/"1") so int() and format() do the packing in C
+TO_BITS = bytes.maketrans(b"\x00\x01", b"01")
+FROM_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def row_bytes(width):
+    """
+    Number of bytes one packed row of the given width takes.
+    """
+    return (width + 7) // 8
+
+
+def pack_row(row, width):
+    """
+    Pack one row of 0/1 cells into bytes, most significant bit first.
+
+    Args:
+        row (list or bytes-like): Cells, 1 for a wall and 0 for an open cell.
+        width (int): Number of cells in the row.
+
+    Returns:
+        bytes: row_bytes(width) bytes with the padding bits set.
+    """
+    size = row_bytes(width)
+    bits = bytes(row).translate(TO_BITS) + b"1" * (size * 8 - width)
+    return int(bits, 2).to_bytes(size, "big")
+
+
+def unpack_row(data, width):
+    """
+    Unpack one packed row back into a bytearray of 0/1 cells.
+    """
+    bits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b")
+    return bytearray(bits[:width].encode().translate(FROM_BITS))
+
+
+class PackedRow:
+    """
+    Read-only view of one packed row that reads single cells on demand.
+    """
+
+    __slots__ = ("data", "start", "width")
+
+    def __init__(self, data, start, width):
+        self.data = data
+        self.start = start
+        self.width = width
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, col):
+        if col < 0:
+            col += self.width
+        if not 0 <= col < self.width:
+            raise IndexError("maze column out of range")
+        return (self.data[self.start + (col >> 3)] >> (7 - (col & 7))) & 1
+
+    def __iter__(self):
+        return iter(self.unpack())
+
+    def unpack(self):
+        """
+        Decode the whole row into a bytearray of 0/1 cells.
+        """
+        return unpack_row(self.data[self.start:self.start + row_bytes(self.width)], self.width)
+
+
+class BitSet:
+    """
+    Fixed-size set of cell ids stored one bit per cell in a bytearray.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, size):
+        """
+        Args:
+            size (int): Number of cell ids the set can hold (0 to size - 1).
+        """
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __contains__(self, cell):
+        return (self.bits[cell >> 3] >> (cell & 7)) & 1 == 1
+
+    def __len__(self):
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def add(self, cell):
+        """
+        Set the bit for a cell id.
+        """
+        self.bits[cell >> 3] |= 1 << (cell & 7)
+
+    def discard(self, cell):
+        """
+        Clear the bit for a cell id.
+        """
+        self.bits[cell >> 3] &= ~(1 << (cell & 7)) & 0xFF
+
+    def clear(self):
+        """
+        Clear every bit.
+        """
+        self.bits[:] = bytes(len(self.bits))
+
+
+class BitMaze:
+    """
+    Maze walls packed one bit per cell, eight cells to a byte.
+
+    Uses the same row layout as mazeFile, so rows are PackedRow views and
+    len(maze) / maze[row][col] behave like the nested-list maze. A 1000 x
+    1000 maze takes 125 KB instead of 8 MB of list pointers.
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (list): 2D grid where 1 is a wall and 0 is an open cell.
+        """
+        self.height = len(maze)
+        self.width = len(maze[0]) if maze else 0
+        self.row_bytes = row_bytes(self.width)
+        self.data = bytearray().join(pack_row(row, self.width) for row in maze)
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.height
+        if not 0 <= row < self.height:
+            raise IndexError("maze row out of range")
+        return PackedRow(self.data, row * self.row_bytes, self.width)
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self[row]
+
+    def is_wall(self, row, col):
+        """
+        Read one cell without creating a row view.
+        """
+        return (self.data[row * self.row_bytes + (col >> 3)] >> (7 - (col & 7))) & 1
+
+    def neighbors(self, position):
+        """
+        Get the open positions adjacent to a (row, col) position.
+        """
+        x, y = position
+        data, stride = self.data, self.row_bytes
+        found = []
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.height and 0 <= ny < self.width and \
+                    not (data[nx * stride + (ny >> 3)] >> (7 - (ny & 7))) & 1:
+                found.append((nx, ny))
+        return found
+
+
+class ParentBits:
+    """
+    Bit-packed stand-in for a solver's came_from dict.
+
+    Each cell gets one visited bit and two bits naming the direction of its
+    parent, three bits in all, against roughly 100 bytes per entry for a dict
+    keyed by tuples. Supports exactly what the solvers and reconstruct_path
+    use: position in came_from, came_from[position] = parent and
+    came_from[position]. Parents must be adjacent cells, or None for the
+    start.
+    """
+
+    __slots__ = ("width", "visited", "directions", "root")
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (list, FlatGrid or BitMaze): Maze the search runs on.
+        """
+        height = len(maze)
+        self.width = width = len(maze[0]) if height else 0
+        self.visited = bytearray((height * width + 7) >> 3)
+        self.directions = bytearray((height * width + 3) >> 2)
+        self.root = None
+
+    def __contains__(self, position):
+        cell = position[0] * self.width + position[1]
+        return (self.visited[cell >> 3] >> (cell & 7)) & 1 == 1
+
+    def __setitem__(self, position, parent):
+        x, y = position
+        cell = x * self.width + y
+        self.visited[cell >> 3] |= 1 << (cell & 7)
+        if parent is None:
+            self.root = position
+            return
+        shift = (cell & 3) << 1
+        direction = DIRECTION_INDEX[(parent[0] - x, parent[1] - y)]
+        self.directions[cell >> 2] = (self.directions[cell >> 2] & ~(3 << shift)) | (direction << shift)
+
+    def __getitem__(self, position):
+        if position == self.root:
+            return None
+        if position not in self:
+            raise KeyError(position)
+        x, y = position
+        cell = x * self.width + y
+        dx, dy = DIRECTIONS[(self.directions[cell >> 2] >> ((cell & 3) << 1)) & 3]
+        return (x + dx, y + dy)
+
+    def __len__(self):
+        return int.from_bytes(self.visited, "little").bit_count()
+
+
+def main():
+    """
+    Compare BFS peak memory with a came_from dict and with ParentBits as mazes grow.
+    """
+    from collections import deque
+    from measurement import peak_memory
+    from mazeGenerators import generate_maze
+    from searchCore import get_neighbors, reconstruct_path
+
+    def bfs(start, end, maze, came_from):
+        came_from[start] = None
+        frontier = deque([start])
+        while frontier:
+            current = frontier.popleft()
+            if current == end:
+                return reconstruct_path(came_from, current)
+            for neighbor in get_neighbors(current, maze):
+                if neighbor not in came_from:
+                    came_from[neighbor] = current
+                    frontier.append(neighbor)
+        return []
+
+    print("\nBFS Visited-State Memory (start to far corner)")
+    print("+-----------+-------------------+-------------------+-------------------+")
+    print("| Maze      | dict (MB)         | ParentBits (MB)   | BitMaze size (KB) |")
+    print("+-----------+-------------------+-------------------+-------------------+")
+    for size in (48, 96, 192, 384):
+        maze = generate_maze(size, size, seed=size, algorithm="kruskal", loops=0.1)
+        bit_maze = BitMaze(maze)
+        start, end = (1, 1), (size - 1, size - 1)
+        dict_path, dict_peak = peak_memory(lambda: bfs(start, end, bit_maze, {}))
+        bits_path, bits_peak = peak_memory(lambda: bfs(start, end, bit_maze, ParentBits(bit_maze)))
+        assert dict_path == bits_path
+        print(f"| {len(maze):>4}x{len(maze[0]):<4} | "
+              f"{dict_peak / (1024 * 1024):^17.6f} | "
+              f"{bits_peak / (1024 * 1024):^17.6f} | "
+              f"{len(bit_maze.data) / 1024:^17.2f} |")
+    print("+-----------+-------------------+-------------------+-------------------+")
+
+
+if __name__ == "__main__":
+    main()
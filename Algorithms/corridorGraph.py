@@ -0,0 +1,430 @@
+"""
+Dead-end filling and corridor contraction into a weighted junction graph.
+
+The junction graph is searched by JunctionGraph.search_core with its own
+Dijkstra, A*, greedy or DFS frontier ordering (PRIORITIES); the solver
+modules (ChiaZhenYang, TanWyHang, Shan, YongZiSheng, YapJinYan, WongYingYi)
+cannot run on it. They walk cells through searchCore.get_neighbors with a
+cost of 1 per step, while junction edges are weighted by corridor length,
+so reusing them would lose cost-optimality. Hill climbing and simulated
+annealing have no junction-graph counterpart at all.
+"""
+import heapq
+import random
+from array import array
+from collections import deque
+from mazeSamples import maze_grid, maze_test_cases
+from flatGrid import FlatGrid
+from measurement import measure_once
+from summaryTables import make_result, print_summary
+
+NONE = -1
+
+# Frontier ordering for each search method over the junction graph, given
+# (g(n), h(n), push order). Dijkstra and A* return shortest paths. These
+# stand in for the solver modules, which assume unit step costs.
+PRIORITIES = {
+    "dijkstra": lambda g, h, order: g,
+    "astar": lambda g, h, order: g + h,
+    "greedy": lambda g, h, order: h,
+    "dfs": lambda g, h, order: -order,
+}
+OPTIMAL_METHODS = ("dijkstra", "astar")
+
+
+class JunctionGraph:
+    """
+    Reduced maze: dead ends filled in and corridors contracted to weighted edges.
+
+    Dead-end filling repeatedly removes open cells with at most one open
+    neighbor, remembering for each removed cell the neighbor it hung off
+    (exit_cell). What is left (the core) only has cells with two or more
+    neighbors. Core cells with three or more neighbors become junctions, and
+    every run of two-neighbor cells between junctions becomes one edge whose
+    weight is the corridor length.
+
+    A query climbs exit_cell links from the start and goal until they meet or
+    reach the core, then searches only the junction graph. In a perfect maze
+    the whole maze is filled, so every query is answered without any search.
+    """
+
+    def __init__(self, maze):
+        """
+        Preprocess a maze.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+        """
+        self.grid = grid = maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+        self.fill_dead_ends()
+        self.contract_corridors()
+
+    @classmethod
+    def from_arrays(cls, grid, removed, exit_cell, depth, filled_count, junctions, corridors, edge_nodes, corridor_of, offset_in):
+        """
+        Rebuild a preprocessed maze from its stored arrays without filling or walking it again.
+
+        Args:
+            grid (FlatGrid): Maze the arrays were built on.
+            removed, exit_cell, depth: Per-cell results of fill_dead_ends.
+            filled_count (int): Number of cells fill_dead_ends removed.
+            junctions (sequence): Junction cell id per node.
+            corridors (list): Cell ids per corridor, junction to junction inclusive.
+            edge_nodes (list): (from node, to node) per corridor.
+            corridor_of, offset_in: Per-cell corridor index and offset along it.
+
+        Returns:
+            JunctionGraph: Graph answering queries exactly like a freshly built one.
+        """
+        graph = cls.__new__(cls)
+        graph.grid = grid
+        graph.removed, graph.exit_cell, graph.depth = removed, exit_cell, depth
+        graph.filled_count = filled_count
+        graph.junctions = list(junctions)
+        graph.node_of = {cell: index for index, cell in enumerate(graph.junctions)}
+        graph.corridors, graph.edge_nodes = corridors, edge_nodes
+        graph.adjacency = [[] for _ in graph.junctions]
+        for corridor, (u, v) in enumerate(edge_nodes):
+            graph.adjacency[u].append((v, corridor))
+            if u != v:
+                graph.adjacency[v].append((u, corridor))
+        graph.corridor_of, graph.offset_in = corridor_of, offset_in
+        return graph
+
+    def fill_dead_ends(self):
+        """
+        Remove dead-end cells until only cells on loops (or between loops) remain.
+        """
+        grid = self.grid
+        offsets, targets = grid.offsets, grid.targets
+        cell_count = len(grid.cells)
+        degree = array('i', [0]) * cell_count
+        removed = bytearray(cell_count)
+        exit_cell = array('i', [NONE]) * cell_count
+        order = []
+        queue = deque()
+        for cell in grid.open_ids():
+            degree[cell] = offsets[cell + 1] - offsets[cell]
+            if degree[cell] <= 1:
+                queue.append(cell)
+
+        while queue:
+            cell = queue.popleft()
+            if removed[cell]:
+                continue
+            removed[cell] = 1
+            order.append(cell)
+            for index in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[index]
+                if not removed[neighbor]:
+                    exit_cell[cell] = neighbor
+                    degree[neighbor] -= 1
+                    if degree[neighbor] == 1:
+                        queue.append(neighbor)
+
+        # Cells removed later sit closer to the core, so walk the order backwards
+        depth = array('i', [0]) * cell_count
+        for cell in reversed(order):
+            if exit_cell[cell] != NONE:
+                depth[cell] = depth[exit_cell[cell]] + 1
+
+        self.removed = removed
+        self.exit_cell = exit_cell
+        self.depth = depth
+        self.filled_count = len(order)
+
+    def contract_corridors(self):
+        """
+        Turn the core into junction nodes joined by corridor edges.
+        """
+        grid, removed = self.grid, self.removed
+        offsets, targets = grid.offsets, grid.targets
+
+        def core_neighbors(cell):
+            return [targets[index] for index in range(offsets[cell], offsets[cell + 1]) if not removed[targets[index]]]
+
+        core = [cell for cell in grid.open_ids() if not removed[cell]]
+        junctions = [cell for cell in core if len(core_neighbors(cell)) >= 3]
+        node_of = {cell: index for index, cell in enumerate(junctions)}
+
+        self.corridors = []  # Cell ids from one junction to another, inclusive
+        self.edge_nodes = []  # (from node, to node) per corridor
+        self.adjacency = [[] for _ in junctions]  # node -> [(other node, corridor index)]
+        self.corridor_of = array('i', [NONE]) * len(grid.cells)
+        self.offset_in = array('i', [0]) * len(grid.cells)
+        walked = set()
+
+        def walk(junction):
+            for first in core_neighbors(junction):
+                if (junction, first) in walked:
+                    continue
+                cells = array('I', [junction])
+                previous, current = junction, first
+                while current not in node_of:
+                    cells.append(current)
+                    following = [cell for cell in core_neighbors(current) if cell != previous]
+                    previous, current = current, following[0]
+                cells.append(current)
+                walked.add((junction, first))
+                walked.add((current, previous))
+                corridor = len(self.corridors)
+                self.corridors.append(cells)
+                u, v = node_of[junction], node_of[current]
+                self.edge_nodes.append((u, v))
+                self.adjacency[u].append((v, corridor))
+                if u != v:
+                    self.adjacency[v].append((u, corridor))
+                for offset in range(1, len(cells) - 1):
+                    self.corridor_of[cells[offset]] = corridor
+                    self.offset_in[cells[offset]] = offset
+
+        for junction in junctions:
+            walk(junction)
+        # A loop with no junction on it gets one so its cells belong to an edge
+        for cell in core:
+            if cell not in node_of and self.corridor_of[cell] == NONE:
+                node_of[cell] = len(junctions)
+                junctions.append(cell)
+                self.adjacency.append([])
+                walk(cell)
+
+        self.junctions = junctions
+        self.node_of = node_of
+
+    def join_filled(self, start, goal):
+        """
+        Connect two cells through the filled forest.
+
+        Returns:
+            tuple: (path cells, start side, goal side). The path is None when
+            the two climbs stop at different core cells; each side then lists
+            the cells climbed, ending at that side's core cell.
+        """
+        depth, exit_cell = self.depth, self.exit_cell
+        start_side, goal_side = [start], [goal]
+        a, b = start, goal
+        while depth[a] > depth[b]:
+            a = exit_cell[a]
+            start_side.append(a)
+        while depth[b] > depth[a]:
+            b = exit_cell[b]
+            goal_side.append(b)
+        while a != b and depth[a] > 0:
+            a, b = exit_cell[a], exit_cell[b]
+            start_side.append(a)
+            goal_side.append(b)
+        if a == b:
+            goal_side.pop()
+            return start_side + goal_side[::-1], start_side, goal_side
+        return None, start_side, goal_side
+
+    def exits(self, cell):
+        """
+        List ways out of a core cell onto the junction graph.
+
+        Returns:
+            list: (node, cost, corridor, offset, node offset) per way out, where
+            the offsets locate the cell and the node along the corridor.
+        """
+        if cell in self.node_of:
+            return [(self.node_of[cell], 0, NONE, 0, 0)]
+        corridor = self.corridor_of[cell]
+        if corridor == NONE:
+            return []
+        offset = self.offset_in[cell]
+        last = len(self.corridors[corridor]) - 1
+        u, v = self.edge_nodes[corridor]
+        return [(u, offset, corridor, offset, 0), (v, last - offset, corridor, offset, last)]
+
+    def corridor_cells(self, corridor, from_offset, to_offset):
+        """
+        Cells along a corridor between two offsets, inclusive, in walking order.
+        """
+        cells = self.corridors[corridor]
+        if from_offset <= to_offset:
+            return list(cells[from_offset:to_offset + 1])
+        return list(cells[to_offset:from_offset + 1])[::-1]
+
+    def search_core(self, source, target, method):
+        """
+        Search the junction graph between two core cells.
+
+        Args:
+            source (int): Core cell id to start from.
+            target (int): Core cell id to reach.
+            method (str): Key into PRIORITIES.
+
+        Returns:
+            tuple: (cell ids from source to target, expanded junction cell ids).
+        """
+        priority = PRIORITIES[method]
+        width = self.grid.width
+        tx, ty = divmod(target, width)
+
+        def h(node):
+            x, y = divmod(self.junctions[node], width)
+            return abs(x - tx) + abs(y - ty)
+
+        # How the target is entered from each junction: node -> (cost, corridor, offset, node offset)
+        finish = {}
+        for node, cost, corridor, offset, node_offset in self.exits(target):
+            if node not in finish or cost < finish[node][0]:
+                finish[node] = (cost, corridor, offset, node_offset)
+
+        best_cost, best_end = None, None
+        source_corridor = self.corridor_of[source]
+        if source_corridor != NONE and source_corridor == self.corridor_of[target]:
+            # Both ends lie on one corridor, so walking straight along it is an option
+            best_cost = abs(self.offset_in[source] - self.offset_in[target])
+            best_end = ("direct", None)
+
+        order = 0
+        g_scores = {}
+        came_from = {}
+        frontier = []
+        for node, cost, corridor, offset, node_offset in self.exits(source):
+            if node not in g_scores or cost < g_scores[node]:
+                g_scores[node] = cost
+                came_from[node] = ("source", corridor, offset, node_offset)
+                order += 1
+                heapq.heappush(frontier, (priority(cost, h(node), order), order, node, cost))
+
+        expanded = []
+        closed = set()
+        while frontier:
+            key, _, node, g_score = heapq.heappop(frontier)
+            if node in closed or g_score > g_scores[node]:
+                continue
+            if best_cost is not None:
+                if method not in OPTIMAL_METHODS or key >= best_cost:
+                    break
+            closed.add(node)
+            expanded.append(self.junctions[node])
+            if node in finish:
+                cost = g_score + finish[node][0]
+                if best_cost is None or cost < best_cost:
+                    best_cost, best_end = cost, ("node", node)
+                    if method not in OPTIMAL_METHODS:
+                        break
+            for neighbor, corridor in self.adjacency[node]:
+                new_g_score = g_score + len(self.corridors[corridor]) - 1
+                if neighbor not in closed and (neighbor not in g_scores or new_g_score < g_scores[neighbor]):
+                    g_scores[neighbor] = new_g_score
+                    came_from[neighbor] = (node, corridor)
+                    order += 1
+                    heapq.heappush(frontier, (priority(new_g_score, h(neighbor), order), order, neighbor, new_g_score))
+
+        if best_end is None:
+            return None, expanded
+        if best_end[0] == "direct":
+            return self.corridor_cells(source_corridor, self.offset_in[source], self.offset_in[target]), expanded
+
+        # Rebuild junction to junction, then add the partial corridors at both ends
+        last = best_end[1]
+        hops = []
+        node = last
+        while came_from[node][0] != "source":
+            previous, corridor = came_from[node]
+            hops.append((previous, node, corridor))
+            node = previous
+        _, corridor, offset, node_offset = came_from[node]
+        cells = [source] if corridor == NONE else self.corridor_cells(corridor, offset, node_offset)
+        for previous, node, corridor in reversed(hops):
+            run = self.corridors[corridor]
+            if run[0] == self.junctions[previous]:
+                cells.extend(run[1:])
+            else:
+                cells.extend(list(run[:-1])[::-1])
+        _, corridor, offset, node_offset = finish[last]
+        if corridor != NONE:
+            cells.extend(self.corridor_cells(corridor, node_offset, offset)[1:])
+        return cells, expanded
+
+    def solve(self, start, end, method="astar"):
+        """
+        Answer one query on the reduced maze and expand it back to a cell path.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+            method (str): "dijkstra", "astar", "greedy" or "dfs".
+
+        Returns:
+            tuple: (path, traversed_nodes) where traversed_nodes are the junctions expanded.
+        """
+        grid = self.grid
+        start_cell, goal_cell = grid.cell_id(tuple(start)), grid.cell_id(tuple(end))
+        if not (grid.is_open(start_cell) and grid.is_open(goal_cell)):
+            return [], []
+        cells, start_side, goal_side = self.join_filled(start_cell, goal_cell)
+        traversed_nodes = []
+        if cells is None:
+            core_cells, expanded = self.search_core(start_side[-1], goal_side[-1], method)
+            traversed_nodes = [grid.position(cell) for cell in expanded]
+            if core_cells is None:
+                return [], traversed_nodes
+            cells = start_side[:-1] + core_cells + goal_side[-2::-1]
+        return [grid.position(cell) for cell in cells], traversed_nodes
+
+
+def junction_search(start, end, maze, method="astar", graph=None):
+    """
+    Solve the maze on its junction graph.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        method (str): "dijkstra", "astar", "greedy" or "dfs".
+        graph (JunctionGraph): Preprocessed maze; built from maze if omitted.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    graph = graph or JunctionGraph(maze)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(graph.solve, start, end, method)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
+
+
+def add_loops(maze, count, seed=0):
+    """
+    Copy a maze and knock out walls that sit between two open cells.
+
+    Args:
+        maze (list): 2D grid representing the maze.
+        count (int): Number of walls to remove.
+        seed (int): Seed for choosing the walls.
+
+    Returns:
+        list: New maze with loops.
+    """
+    maze = [row[:] for row in maze]
+    walls = [(i, j) for i in range(1, len(maze) - 1) for j in range(1, len(maze[0]) - 1)
+             if maze[i][j] == 1 and ((maze[i - 1][j] == 0 and maze[i + 1][j] == 0) or
+                                     (maze[i][j - 1] == 0 and maze[i][j + 1] == 0))]
+    for i, j in random.Random(seed).sample(walls, min(count, len(walls))):
+        maze[i][j] = 0
+    return maze
+
+
+def main():
+    """
+    Solve every test case on the junction graph, on the sample maze and on a looped copy.
+    """
+    from ChiaZhenYang import astar
+
+    for label, maze in [("sample maze", maze_grid), ("sample maze + 60 loops", add_loops(maze_grid, 60))]:
+        graph = JunctionGraph(maze)
+        results = []
+        astar_nodes = 0
+        for i, test_case in enumerate(maze_test_cases, 1):
+            path, nodes_expanded, time_taken, _, peak_memory = junction_search(test_case["start"], test_case["end"], maze, graph=graph)
+            astar_nodes += astar(test_case["start"], test_case["end"], maze)[1]
+            results.append(make_result(i, test_case["start"], test_case["end"], path, nodes_expanded, time_taken, peak_memory))
+        print_summary(results, f"JUNCTION GRAPH A* ({label})")
+        print(f"Filled {graph.filled_count} dead-end cells; {len(graph.junctions)} junctions, {len(graph.corridors)} corridors left")
+        print(f"Nodes traversed: {sum(result['nodes_expanded'] for result in results)} on the junction graph vs {astar_nodes} for cell-level A*")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import random
+import time
+from collections import OrderedDict
+from mazeSamples import maze_test_cases
+from flatGrid import FlatGrid
+from batchQuery import distance_field, path_from_field
+
+# Bytes of distance fields kept before the least recently used ones are evicted
+DEFAULT_BUDGET = 16 * 1024 * 1024
+
+
+class DistanceFieldCache:
+    """
+    In-memory LRU cache of BFS distance fields keyed by (maze content hash, goal).
+
+    A field holds every cell's distance to one goal, so once it is cached any
+    start is answered by greedy descent along the field (path_from_field)
+    with no search at all. Fields are evicted least recently used first
+    whenever the stored fields would exceed the memory budget; a field
+    larger than the whole budget is returned but never stored.
+
+    Has the same grid(), lookup_field() and store_field() methods as
+    ArtifactCache, so it can be passed as the cache to batchQuery.solve_batch.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """
+        Args:
+            budget (int): Maximum bytes of distance fields to keep.
+        """
+        self.budget = budget
+        self.fields = OrderedDict()  # (content hash, goal) -> (distances, nodes_expanded)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __contains__(self, key):
+        return key in self.fields
+
+    def grid(self, maze):
+        """
+        Get a FlatGrid for a maze, reusing it if it already is one.
+        """
+        return maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+
+    def lookup_field(self, grid, goal):
+        """
+        Get a cached distance field without building it on a miss.
+
+        Args:
+            grid (FlatGrid): Maze to search.
+            goal (tuple): Goal position (x, y).
+
+        Returns:
+            tuple: (distances, nodes_expanded), or None if the field is not cached.
+        """
+        key = (grid.content_hash(), tuple(goal))
+        entry = self.fields.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.fields.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store_field(self, grid, goal, entry):
+        """
+        Cache a distance field built by batchQuery.distance_field.
+        """
+        self.store((grid.content_hash(), tuple(goal)), entry)
+
+    def distance_field(self, grid, goal):
+        """
+        Get the BFS distance field towards a goal, running the BFS only on a miss.
+
+        Args:
+            grid (FlatGrid): Maze to search.
+            goal (tuple): Goal position (x, y).
+
+        Returns:
+            tuple: (distances, nodes_expanded) as returned by batchQuery.distance_field.
+        """
+        entry = self.lookup_field(grid, goal)
+        if entry is None:
+            entry = distance_field(grid, tuple(goal))
+            self.store_field(grid, goal, entry)
+        return entry
+
+    def store(self, key, entry):
+        """
+        Add a field, evicting the least recently used ones until it fits the budget.
+        """
+        field_size = entry[0].itemsize * len(entry[0])
+        if field_size > self.budget:
+            return
+        while self.fields and self.size + field_size > self.budget:
+            _, (evicted, _) = self.fields.popitem(last=False)
+            self.size -= evicted.itemsize * len(evicted)
+            self.evictions += 1
+        self.fields[key] = entry
+        self.size += field_size
+
+    def path(self, maze, start, end):
+        """
+        Solve one query by greedy descent on the goal's distance field.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            list: Positions from start to end, empty if the goal is unreachable.
+        """
+        grid = self.grid(maze)
+        distances, _ = self.distance_field(grid, end)
+        return path_from_field(grid, distances, tuple(start))
+
+    def stats(self):
+        """
+        Counters for monitoring the cache.
+
+        Returns:
+            dict: hits, misses, evictions, hit_rate, entries, bytes and budget.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.fields),
+            "bytes": self.size,
+            "budget": self.budget,
+        }
+
+    def clear(self):
+        """
+        Drop every field; the counters are kept.
+        """
+        self.fields.clear()
+        self.size = 0
+
+
+def main():
+    """
+    Replay random queries with a few popular goals under a generous and a tight budget.
+    """
+    grid = FlatGrid(maze_test_cases[0]["maze"])
+    open_positions = [grid.position(cell) for cell in grid.open_ids()]
+    field_size = 4 * len(grid.cells)
+
+    rng = random.Random(0)
+    # Most queries head for the shared test-case goal, the rest for a handful of others
+    goals = [tuple(maze_test_cases[0]["end"])] + rng.sample(open_positions, 7)
+    queries = [(rng.choice(open_positions), goals[0] if rng.random() < 0.6 else rng.choice(goals[1:]))
+               for _ in range(2000)]
+
+    print(f"\nDistance Field Cache ({len(queries)} queries over {len(goals)} goals, {field_size / 1024:.1f} KB per field)")
+    print("+---------------------+--------+--------+-----------+----------+-------------------+")
+    print("| Budget              | Hits   | Misses | Evictions | Hit Rate | Total Time (ms)   |")
+    print("+---------------------+--------+--------+-----------+----------+-------------------+")
+    for label, budget in [("no cache (BFS each)", 0), ("3 fields", 3 * field_size), ("all fields", DEFAULT_BUDGET)]:
+        cache = DistanceFieldCache(budget)
+        start_time = time.perf_counter()
+        for start, end in queries:
+            cache.path(grid, start, end)
+        elapsed = time.perf_counter() - start_time
+        stats = cache.stats()
+        print(f"| {label:<19} | {stats['hits']:^6} | {stats['misses']:^6} | {stats['evictions']:^9} | "
+              f"{stats['hit_rate']:^8.1%} | {elapsed * 1000:^17.2f} |")
+    print("+---------------------+--------+--------+-----------+----------+-------------------+")
+
+
+if __name__ == "__main__":
+    main()
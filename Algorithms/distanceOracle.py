@@ -0,0 +1,328 @@
+import heapq
+import random
+import time
+from array import array
+from mazeSamples import get_coordinates, maze_grid
+from flatGrid import FlatGrid
+from corridorGraph import NONE, JunctionGraph, add_loops
+
+# Largest junction count that gets the all-pairs table; it takes O(J^2)
+# memory and one Dijkstra per junction to build, so past this core routes
+# are searched with A* on the junction graph instead
+DEFAULT_MAX_JUNCTIONS = 1000
+
+
+class DistanceOracle:
+    """
+    Exact many-to-many distances and paths on one fixed maze.
+
+    Built on the JunctionGraph decomposition. Filled cells form trees
+    hanging off single core cells, or, in a perfect maze, one tree per
+    component. Every open cell gets an anchor: the depth-0 cell its
+    exit_cell links climb to.
+
+    - Two cells with the same anchor: the tree path is the only simple path
+      between them. Its length comes from depths and a binary-lifting LCA.
+    - Different anchors: the two climbs are joined through the core, using
+      an all-pairs table between junctions and each core cell's offset
+      along its corridor.
+
+    distance() costs O(log n); path() costs that plus the length of the path.
+    The junction table takes O(J^2) memory and J Dijkstra runs to build for J
+    junctions. That is small for carved mazes, which have few loops; above
+    max_junctions the table is skipped and routes between different anchors
+    are searched with A* on the junction graph (JunctionGraph.search_core),
+    so those queries cost a search over the junctions instead.
+    """
+
+    def __init__(self, maze, graph=None, max_junctions=DEFAULT_MAX_JUNCTIONS):
+        """
+        Preprocess a maze.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+            graph (JunctionGraph): Reduced maze to build on; built from maze if omitted.
+            max_junctions (int): Largest junction count to build the all-pairs table for.
+        """
+        self.graph = graph = graph or JunctionGraph(maze)
+        self.grid = graph.grid
+        self.build_anchors()
+        self.build_lifting()
+        self.build_components()
+        self.junction_count = len(graph.junctions)
+        self.junction_table = self.junction_via = None
+        if self.junction_count <= max_junctions:
+            self.build_junction_table()
+
+    def build_anchors(self):
+        """
+        Record the depth-0 cell every open cell climbs to.
+        """
+        exit_cell, depth = self.graph.exit_cell, self.graph.depth
+        anchor = array('i', [NONE]) * len(self.grid.cells)
+        for cell in self.grid.open_ids():
+            climbed = []
+            while anchor[cell] == NONE and depth[cell] > 0:
+                climbed.append(cell)
+                cell = exit_cell[cell]
+            if anchor[cell] == NONE:
+                anchor[cell] = cell
+            for lower in climbed:
+                anchor[lower] = anchor[cell]
+        self.anchor = anchor
+
+    def build_lifting(self):
+        """
+        Build binary-lifting tables over exit_cell: up[k][cell] is 2^k steps up.
+        """
+        exit_cell, depth = self.graph.exit_cell, self.graph.depth
+        first = array('i', (exit_cell[cell] if depth[cell] > 0 else cell for cell in range(len(self.grid.cells))))
+        self.up = [first]
+        for _ in range(max(depth, default=0).bit_length() - 1):
+            previous = self.up[-1]
+            self.up.append(array('i', (previous[previous[cell]] for cell in range(len(previous)))))
+
+    def build_components(self):
+        """
+        Label connected components so unreachable pairs are answered immediately.
+        """
+        offsets, targets = self.grid.offsets, self.grid.targets
+        component = array('i', [NONE]) * len(self.grid.cells)
+        label = 0
+        for cell in self.grid.open_ids():
+            if component[cell] != NONE:
+                continue
+            component[cell] = label
+            stack = [cell]
+            while stack:
+                current = stack.pop()
+                for index in range(offsets[current], offsets[current + 1]):
+                    neighbor = targets[index]
+                    if component[neighbor] == NONE:
+                        component[neighbor] = label
+                        stack.append(neighbor)
+            label += 1
+        self.component = component
+
+    def build_junction_table(self):
+        """
+        Run Dijkstra from every junction, keeping distances and the corridor
+        each junction was reached through.
+        """
+        graph = self.graph
+        count = len(graph.junctions)
+        table = array('i', [NONE]) * (count * count)
+        via = array('i', [NONE]) * (count * count)
+        for source in range(count):
+            row = source * count
+            table[row + source] = 0
+            frontier = [(0, source)]
+            while frontier:
+                cost, node = heapq.heappop(frontier)
+                if cost > table[row + node]:
+                    continue
+                for neighbor, corridor in graph.adjacency[node]:
+                    new_cost = cost + len(graph.corridors[corridor]) - 1
+                    if neighbor != node and (table[row + neighbor] == NONE or new_cost < table[row + neighbor]):
+                        table[row + neighbor] = new_cost
+                        via[row + neighbor] = corridor
+                        heapq.heappush(frontier, (new_cost, neighbor))
+        self.junction_count = count
+        self.junction_table = table
+        self.junction_via = via
+
+    def lca(self, a, b):
+        """
+        Lowest common ancestor of two cells with the same anchor.
+        """
+        depth, up = self.graph.depth, self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+        lift = depth[a] - depth[b]
+        level = 0
+        while lift:
+            if lift & 1:
+                a = up[level][a]
+            lift >>= 1
+            level += 1
+        if a == b:
+            return a
+        for level in range(len(up) - 1, -1, -1):
+            if up[level][a] != up[level][b]:
+                a, b = up[level][a], up[level][b]
+        return up[0][a]
+
+    def core_route(self, u, v):
+        """
+        Cheapest way between two core cells.
+
+        Returns:
+            tuple: (cost, route) where route is ("direct", corridor), the two
+            exits used, or ("search", cells) without a junction table; or
+            (None, None) if they are not connected.
+        """
+        graph = self.graph
+        if u == v:
+            return 0, ("direct", NONE)
+        if self.junction_table is None:
+            cells, _ = graph.search_core(u, v, "astar")
+            return (None, None) if cells is None else (len(cells) - 1, ("search", cells))
+        best, route = None, None
+        corridor = graph.corridor_of[u]
+        if corridor != NONE and corridor == graph.corridor_of[v]:
+            best, route = abs(graph.offset_in[u] - graph.offset_in[v]), ("direct", corridor)
+        count, table = self.junction_count, self.junction_table
+        for exit_u in graph.exits(u):
+            for exit_v in graph.exits(v):
+                between = table[exit_u[0] * count + exit_v[0]]
+                if between == NONE:
+                    continue
+                cost = exit_u[1] + between + exit_v[1]
+                if best is None or cost < best:
+                    best, route = cost, (exit_u, exit_v)
+        return best, route
+
+    def cell_distance(self, a, b):
+        """
+        Distance between two open cell ids, or None if unreachable.
+        """
+        if self.component[a] != self.component[b]:
+            return None
+        depth = self.graph.depth
+        if self.anchor[a] == self.anchor[b]:
+            return depth[a] + depth[b] - 2 * depth[self.lca(a, b)]
+        between = self.core_route(self.anchor[a], self.anchor[b])[0]
+        return None if between is None else depth[a] + depth[b] + between
+
+    def distance(self, start, end):
+        """
+        Length of the shortest path between two positions.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            int: Number of steps, or None if either cell is a wall or unreachable.
+        """
+        grid = self.grid
+        a, b = grid.cell_id(tuple(start)), grid.cell_id(tuple(end))
+        if not (grid.is_open(a) and grid.is_open(b)):
+            return None
+        return self.cell_distance(a, b)
+
+    def climb(self, cell, stop):
+        """
+        Cells from cell up the filled tree to stop, inclusive.
+        """
+        exit_cell = self.graph.exit_cell
+        cells = [cell]
+        while cell != stop:
+            cell = exit_cell[cell]
+            cells.append(cell)
+        return cells
+
+    def core_path(self, u, v):
+        """
+        Cells of the cheapest route between two core cells, inclusive.
+        """
+        graph = self.graph
+        _, route = self.core_route(u, v)
+        if route[0] == "direct":
+            return [u] if u == v else graph.corridor_cells(route[1], graph.offset_in[u], graph.offset_in[v])
+        if route[0] == "search":
+            return route[1]
+        (node_u, _, corridor_u, offset_u, node_offset_u), (node_v, _, corridor_v, offset_v, node_offset_v) = route
+
+        cells = [u] if corridor_u == NONE else graph.corridor_cells(corridor_u, offset_u, node_offset_u)
+        count, via, junctions = self.junction_count, self.junction_via, graph.junctions
+        hops = []
+        node = node_v
+        while node != node_u:
+            corridor = via[node_u * count + node]
+            first, second = graph.edge_nodes[corridor]
+            previous = first if second == node else second
+            run = graph.corridors[corridor]
+            if run[0] == junctions[previous] and run[-1] == junctions[node]:
+                hops.append(list(run[1:]))
+            else:
+                hops.append(list(run[:-1])[::-1])
+            node = previous
+        for run in reversed(hops):
+            cells.extend(run)
+        if corridor_v != NONE:
+            cells.extend(graph.corridor_cells(corridor_v, node_offset_v, offset_v)[1:])
+        return cells
+
+    def path(self, start, end):
+        """
+        Shortest path between two positions.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            list: Positions from start to end, empty if there is no path.
+        """
+        grid = self.grid
+        a, b = grid.cell_id(tuple(start)), grid.cell_id(tuple(end))
+        if not (grid.is_open(a) and grid.is_open(b)) or self.cell_distance(a, b) is None:
+            return []
+        if self.anchor[a] == self.anchor[b]:
+            meet = self.lca(a, b)
+            cells = self.climb(a, meet) + self.climb(b, meet)[-2::-1]
+        else:
+            anchor_a, anchor_b = self.anchor[a], self.anchor[b]
+            cells = self.climb(a, anchor_a)[:-1] + self.core_path(anchor_a, anchor_b) + \
+                self.climb(b, anchor_b)[-2::-1]
+        return [grid.position(cell) for cell in cells]
+
+
+def main():
+    """
+    Benchmark oracle queries between open cells from get_coordinates against per-pair A*.
+    """
+    from ChiaZhenYang import astar_search
+
+    rng = random.Random(0)
+    for label, maze in [("sample maze", maze_grid), ("sample maze + 60 loops", add_loops(maze_grid, 60))]:
+        coordinates = get_coordinates(maze)
+        pairs = [(rng.choice(coordinates), rng.choice(coordinates)) for _ in range(2000)]
+        grid = FlatGrid(maze)
+
+        start_time = time.perf_counter()
+        oracle = DistanceOracle(grid)
+        build_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        distances = [oracle.distance(a, b) for a, b in pairs]
+        distance_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        paths = [oracle.path(a, b) for a, b in pairs]
+        path_time = time.perf_counter() - start_time
+
+        checked = pairs[:200]
+        start_time = time.perf_counter()
+        astar_paths = [astar_search(a, b, grid)[0] for a, b in checked]
+        astar_time = (time.perf_counter() - start_time) / len(checked) * len(pairs)
+
+        agree = all(len(expected) - 1 == distances[index] and len(paths[index]) == len(expected)
+                    for index, expected in enumerate(astar_paths))
+        print(f"\nDistance Oracle ({label}: {len(coordinates)} open cells, "
+              f"{oracle.junction_count} junctions, {len(pairs)} random pairs)")
+        print("+---------------------+-------------------+-------------------+")
+        print("| Operation           | Total (ms)        | Per Query (us)    |")
+        print("+---------------------+-------------------+-------------------+")
+        for name, seconds, queries in [("Build", build_time, 1),
+                                       ("distance()", distance_time, len(pairs)),
+                                       ("path()", path_time, len(pairs)),
+                                       ("A* per pair (est.)", astar_time, len(pairs))]:
+            print(f"| {name:<19} | {seconds * 1000:^17.3f} | {seconds / queries * 1e6:^17.2f} |")
+        print("+---------------------+-------------------+-------------------+")
+        print(f"Oracle agrees with A* on {len(checked)} checked pairs: {agree}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import hashlib
+import struct
+from array import array
+from functools import cached_property
+
+# Same neighbor order the solvers have always used: Up, Right, Down, Left
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+
+class FlatGrid:
+    """
+    Compact, read-only maze grid backed by a bytearray.
+
+    Cells are addressed by integer id (row * width + col). Neighbors of every
+    cell are precomputed once into a CSR-style table: the open neighbors of
+    cell id are targets[offsets[id]:offsets[id + 1]]. Solvers can take a
+    FlatGrid anywhere they take the nested-list maze; len(grid), grid[row][col]
+    and iteration over rows behave the same way.
+    """
+
+    def __init__(self, maze):
+        """
+        Build the grid and its neighbor table from a nested-list maze.
+
+        Args:
+            maze (list): 2D grid where 1 is a wall and 0 is an open cell.
+        """
+        self.height = len(maze)
+        self.width = len(maze[0]) if maze else 0
+        self.cells = bytearray(cell for row in maze for cell in row)
+
+        height, width, cells = self.height, self.width, self.cells
+        offsets = array('I', [0])
+        targets = array('I')
+        for cell_id in range(height * width):
+            x, y = divmod(cell_id, width)
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < height and 0 <= ny < width and cells[nx * width + ny] == 0:
+                    targets.append(nx * width + ny)
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_arrays(cls, height, width, cells, offsets, targets, open_cells=None):
+        """
+        Wrap an already built cell buffer and neighbor table without rescanning the maze.
+
+        Args:
+            height (int): Number of rows.
+            width (int): Number of columns.
+            cells (bytes-like): Row-major cells, 1 for a wall.
+            offsets (array or memoryview): CSR offsets, one more than the cell count.
+            targets (array or memoryview): CSR neighbor ids.
+            open_cells (array or memoryview): Open cell ids, computed on demand if omitted.
+
+        Returns:
+            FlatGrid: Grid sharing the given buffers.
+        """
+        grid = cls.__new__(cls)
+        grid.height, grid.width, grid.cells = height, width, cells
+        grid.offsets, grid.targets = offsets, targets
+        if open_cells is not None:
+            grid.open_cells = open_cells
+        return grid
+
+    @cached_property
+    def open_cells(self):
+        """
+        Ids of every open cell in row-major order.
+        """
+        return array('I', [cell_id for cell_id, cell in enumerate(self.cells) if cell == 0])
+
+    @cached_property
+    def _positions(self):
+        width = self.width
+        return [divmod(cell_id, width) for cell_id in range(self.height * width)] if width else []
+
+    @cached_property
+    def _neighbor_cells(self):
+        # One tuple of neighbor positions per cell, built from the CSR table
+        # the first time neighbors() is called
+        positions, offsets, targets = self._positions, self.offsets, self.targets
+        return [tuple(positions[targets[index]] for index in range(offsets[cell_id], offsets[cell_id + 1]))
+                for cell_id in range(len(positions))]
+
+    @cached_property
+    def _neighbor_id_tuples(self):
+        # One tuple of neighbor ids per cell, for loops that run over cell ids
+        offsets, targets = self.offsets, self.targets
+        return [tuple(targets[offsets[cell_id]:offsets[cell_id + 1]]) for cell_id in range(len(offsets) - 1)]
+
+    @cached_property
+    def _content_hash(self):
+        return hash_cells(self.height, self.width, self.cells)
+
+    def content_hash(self):
+        """
+        Hash of the grid's shape and cells, stable across runs and processes.
+
+        Computed once per grid, so caches keyed by it cost O(1) per lookup.
+        """
+        return self._content_hash
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.height:
+            raise IndexError("grid row out of range")
+        return memoryview(self.cells)[row * self.width:(row + 1) * self.width]
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self[row]
+
+    def cell_id(self, position):
+        """
+        Convert a (row, col) position to its integer cell id.
+        """
+        return position[0] * self.width + position[1]
+
+    def position(self, cell_id):
+        """
+        Convert an integer cell id back to its (row, col) position.
+        """
+        return self._positions[cell_id]
+
+    def is_open(self, cell_id):
+        """
+        Check whether a cell id refers to a walkable cell.
+        """
+        return self.cells[cell_id] == 0
+
+    def neighbor_ids(self, cell_id):
+        """
+        Get the ids of the open cells adjacent to a cell id.
+        """
+        return self.targets[self.offsets[cell_id]:self.offsets[cell_id + 1]]
+
+    def neighbor_id_table(self):
+        """
+        Get one precomputed tuple of neighbor ids per cell id, built on first use.
+
+        Looping over table[cell_id] avoids indexing the CSR arrays per neighbor.
+        """
+        return self._neighbor_id_tuples
+
+    def neighbors(self, position):
+        """
+        Get the open positions adjacent to a (row, col) position.
+
+        Returns a precomputed tuple, so no tuples or lists are allocated per call.
+        """
+        x, y = position
+        if 0 <= x < self.height and 0 <= y < self.width:
+            return self._neighbor_cells[x * self.width + y]
+        return ()
+
+    def open_ids(self):
+        """
+        List the ids of every open cell in row-major order.
+        """
+        return self.open_cells.tolist()
+
+
+def hash_cells(height, width, cells):
+    """
+    Hash a row-major cell buffer together with its shape.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        cells (bytes-like): Row-major cells, 1 for a wall.
+
+    Returns:
+        str: Hex digest identifying the maze contents.
+    """
+    digest = hashlib.blake2b(struct.pack('<II', height, width), digest_size=16)
+    digest.update(cells)
+    return digest.hexdigest()
@@ -0,0 +1,197 @@
+import os
+import shutil
+import sys
+
+RESET = "\033[0m"
+CLEAR_SCREEN = "\033[2J\033[H"
+CLEAR_LINE = "\033[K"
+
+
+class FrameRenderer:
+    """
+    Terminal renderer for search visualizations that redraws only what changed.
+
+    The first frame clears the screen and draws everything. The renderer
+    remembers how many traversed nodes it has already drawn and the path it
+    drew last, so each later frame only looks at the newly traversed tail and
+    at the path cells that changed, then emits a cursor-positioning escape
+    plus glyph for each of them in one buffered write. A frame therefore costs
+    O(new nodes + path length) rather than O(all traversed nodes).
+
+    Grids larger than the terminal are drawn through a viewport that follows
+    the head of the search, since cursor escapes outside the visible screen
+    would corrupt the display. Without ANSI support the screen is cleared and
+    the whole viewport is written in one call instead.
+    """
+
+    def __init__(self, colors=None, stream=None):
+        """
+        Args:
+            colors (dict): ANSI color prefix per glyph ("S", "E", "@", "*", ".").
+            stream (file): Output stream, defaults to sys.stdout.
+        """
+        self.colors = colors or {}
+        self.stream = stream
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the previous frame so the next one is drawn in full.
+        """
+        self.key = None
+        self.origin = (0, 0)
+        self.trail = {}  # Traversed cells drawn so far, position -> "."
+        self.traversed = None  # List the trail was read from
+        self.applied = 0  # How many of its nodes are in the trail
+        self.overlay = {}  # Path and head drawn last frame, position -> "*" or "@"
+
+    def glyph(self, symbol, ansi):
+        """
+        Format one cell as the two characters the console grid uses.
+        """
+        color = self.colors.get(symbol) if ansi else None
+        if color:
+            return f"{color}{symbol}{RESET} "
+        return f"{symbol} "
+
+    def viewport(self, maze, header, head):
+        """
+        Pick the block of the grid that fits the terminal.
+
+        Returns:
+            tuple: (top, left, rows, cols); the whole grid if it fits, otherwise
+            a block that contains the head, recentred whenever the head leaves it.
+        """
+        size = shutil.get_terminal_size()
+        # Leave room for the header, the blank line under the grid and the cursor line
+        rows = min(len(maze), max(1, size.lines - len(header) - 2))
+        cols = min(len(maze[0]), max(1, size.columns // 2))
+        top, left = self.origin
+        i, j = head
+        if not (top <= i < top + rows) or top + rows > len(maze):
+            top = min(max(i - rows // 2, 0), len(maze) - rows)
+        if not (left <= j < left + cols) or left + cols > len(maze[0]):
+            left = min(max(j - cols // 2, 0), len(maze[0]) - cols)
+        self.origin = (top, left)
+        return top, left, rows, cols
+
+    def render(self, maze, start, end, current_path, traversed_nodes, header, ansi=True):
+        """
+        Draw one frame of a search.
+
+        traversed_nodes is expected to grow by appending between frames of one
+        search; if it is a different list or has shrunk, the trail is rebuilt.
+
+        Args:
+            maze (list): The maze grid.
+            start (tuple): Starting position.
+            end (tuple): Goal position.
+            current_path (list): Current path being explored.
+            traversed_nodes (list): Nodes that have been traversed.
+            header (list): Status lines printed above the grid.
+            ansi (bool): Whether the terminal understands ANSI escapes.
+        """
+        start, end = tuple(start), tuple(end)
+        current_position = current_path[-1] if current_path else start
+
+        overlay = dict.fromkeys(current_path, "*")
+        overlay[current_position] = "@"
+        # Cells whose glyph may differ from the previous frame: the new tail and the path delta
+        changed = set()
+        previous = self.overlay
+        for pos, symbol in overlay.items():
+            if previous.get(pos) != symbol:
+                changed.add(pos)
+        for pos in previous:
+            if pos not in overlay:
+                changed.add(pos)
+        old = {pos: previous.get(pos) or self.trail.get(pos) for pos in changed}
+
+        if traversed_nodes is not self.traversed or len(traversed_nodes) < self.applied:
+            for pos in self.trail:
+                if pos not in old:
+                    old[pos] = previous.get(pos) or "."
+            self.trail = {}
+            self.traversed = traversed_nodes
+            self.applied = 0
+        for pos in traversed_nodes[self.applied:]:
+            if pos not in old:
+                old[pos] = previous.get(pos) or self.trail.get(pos)
+            self.trail[pos] = "."
+        self.applied = len(traversed_nodes)
+        self.overlay = overlay
+
+        stream = self.stream or sys.stdout
+        if not ansi:
+            os.system('cls' if os.name == 'nt' else 'clear')
+        elif self.key is None and os.name == 'nt':
+            os.system('')  # Enables escape sequence processing in the Windows console
+        view = self.viewport(maze, header, current_position)
+        key = (id(maze), len(maze), len(maze[0]), start, end, len(header), view)
+        if not ansi or key != self.key:
+            stream.write(self.full_frame(maze, start, end, header, view, ansi))
+        else:
+            stream.write(self.diff_frame(maze, start, end, old, header, view, ansi))
+        stream.flush()
+        self.key = key if ansi else None
+
+    def symbol(self, pos):
+        """
+        Dynamic glyph currently at a position, or None for a static cell.
+        """
+        return self.overlay.get(pos) or self.trail.get(pos)
+
+    def full_frame(self, maze, start, end, header, view, ansi):
+        """
+        Build the escape sequence that clears the screen and draws every cell in view.
+        """
+        top, left, rows, cols = view
+        parts = [CLEAR_SCREEN] if ansi else []
+        for line in header:
+            parts.append(line)
+            parts.append("\n")
+        for i in range(top, top + rows):
+            row = maze[i]
+            for j in range(left, left + cols):
+                pos = (i, j)
+                if pos == start:
+                    parts.append(self.glyph("S", ansi))
+                elif pos == end:
+                    parts.append(self.glyph("E", ansi))
+                else:
+                    symbol = self.symbol(pos)
+                    if symbol is not None:
+                        parts.append(self.glyph(symbol, ansi))
+                    else:
+                        parts.append("0 " if row[j] == 1 else "  ")
+            parts.append("\n")
+        parts.append("\n")
+        return "".join(parts)
+
+    def diff_frame(self, maze, start, end, old, header, view, ansi):
+        """
+        Build the escape sequence that rewrites the header and only the changed cells in view.
+
+        Args:
+            old (dict): Glyph each possibly changed cell had last frame, None if static.
+        """
+        top, left, rows, cols = view
+        parts = []
+        for line_number, line in enumerate(header, 1):
+            parts.append(f"\033[{line_number};1H{line}{CLEAR_LINE}")
+        first_row = len(header) + 1
+        for pos, before in old.items():
+            i, j = pos
+            if pos == start or pos == end or not (top <= i < top + rows and left <= j < left + cols):
+                continue
+            symbol = self.symbol(pos)
+            if symbol == before:
+                continue
+            parts.append(f"\033[{first_row + i - top};{2 * (j - left) + 1}H")
+            if symbol is None:
+                parts.append("0 " if maze[i][j] == 1 else "  ")
+            else:
+                parts.append(self.glyph(symbol, ansi))
+        # Park the cursor below the grid so later prints land underneath
+        parts.append(f"\033[{first_row + rows + 1};1H")
+        return "".join(parts)
@@ -0,0 +1,214 @@
+import statistics
+from collections import OrderedDict
+from mazeSamples import maze_test_cases
+from flatGrid import FlatGrid
+from batchQuery import UNREACHED, distance_field
+
+# Landmarks picked per maze unless asked otherwise
+DEFAULT_LANDMARKS = 8
+
+# Heuristics a LandmarkTableCache keeps before evicting the least recently used
+DEFAULT_CAPACITY = 8
+
+
+def select_landmarks(grid, count, cache=None):
+    """
+    Pick landmarks by farthest-point selection and compute their distance tables.
+
+    The first landmark is the open cell farthest from the first open cell;
+    each next one is the cell whose distance to its nearest chosen landmark is
+    largest. Landmarks on the fringe of the maze give the tightest bounds.
+
+    Args:
+        grid (FlatGrid): Maze to pick landmarks on.
+        count (int): Number of landmarks.
+        cache (ArtifactCache): Where to load distance tables from, if given.
+
+    Returns:
+        tuple: (landmark cell ids, distance tables indexed by cell id).
+    """
+    field = (lambda goal: cache.distance_field(grid, goal)) if cache is not None else \
+        (lambda goal: distance_field(grid, goal))
+    open_cells = grid.open_ids()
+    if not open_cells:
+        return [], []
+
+    # Distance from each cell to its nearest landmark; cells no landmark
+    # reaches count as farthest of all, so other components get a landmark too
+    unreached = len(grid.cells)
+    seed_distances = field(grid.position(open_cells[0]))[0]
+    candidate = max(open_cells, key=lambda cell: seed_distances[cell])
+    nearest = [unreached] * len(grid.cells)
+    landmarks, tables = [], []
+    while len(landmarks) < count and nearest[candidate] > 0:
+        distances = field(grid.position(candidate))[0]
+        landmarks.append(candidate)
+        tables.append(distances)
+        for cell in open_cells:
+            if distances[cell] != UNREACHED and distances[cell] < nearest[cell]:
+                nearest[cell] = distances[cell]
+        candidate = max(open_cells, key=nearest.__getitem__)
+    return landmarks, tables
+
+
+class LandmarkHeuristic:
+    """
+    ALT (A*, Landmarks, Triangle inequality) lower bound on maze distance.
+
+    For any landmark L, |d(L, a) - d(L, b)| <= d(a, b), so the largest such
+    difference over all landmarks is an admissible and consistent heuristic.
+    It is also never below Manhattan distance, which it falls back to when a
+    cell cannot reach a landmark. Instances are callables with the same
+    signature as heuristic(point_a, point_b), so they can be passed as
+    heuristic_fn to astar and greedy_bfs.
+    """
+
+    def __init__(self, maze, count=DEFAULT_LANDMARKS, cache=None):
+        """
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+            count (int): Number of landmarks.
+            cache (ArtifactCache): Where to load distance tables from, if given.
+        """
+        self.grid = grid = maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+        self.width = grid.width
+        self.landmarks, self.tables = select_landmarks(grid, count, cache)
+
+    def __call__(self, point_a, point_b):
+        width = self.width
+        a = point_a[0] * width + point_a[1]
+        b = point_b[0] * width + point_b[1]
+        best = abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
+        for table in self.tables:
+            distance_a, distance_b = table[a], table[b]
+            if distance_a == UNREACHED or distance_b == UNREACHED:
+                continue
+            bound = distance_a - distance_b if distance_a > distance_b else distance_b - distance_a
+            if bound > best:
+                best = bound
+        return best
+
+    def landmark_positions(self):
+        """
+        Positions of the chosen landmarks.
+        """
+        return [self.grid.position(cell) for cell in self.landmarks]
+
+
+class LandmarkTableCache:
+    """
+    LRU cache holding one LandmarkHeuristic per (maze, landmark count).
+
+    A FlatGrid is keyed by its content hash, which the grid computes once. A
+    nested-list maze is keyed by identity so a lookup is O(1) instead of
+    rebuilding a FlatGrid and hashing every cell on every call; the entry
+    keeps the list alive, so its id cannot be reused while it is cached.
+    Treat a list maze as read-only once it has been used, or pass a FlatGrid.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity (int): Number of heuristics to keep.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()  # key -> (maze, LandmarkHeuristic)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def heuristic_for(self, maze, count=DEFAULT_LANDMARKS, cache=None):
+        """
+        Get the landmark heuristic for a maze, building its tables only on a miss.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+            count (int): Number of landmarks.
+            cache (ArtifactCache): Also keep the distance tables on disk, if given.
+
+        Returns:
+            LandmarkHeuristic: Shared instance for this maze.
+        """
+        is_grid = isinstance(maze, FlatGrid)
+        key = (maze.content_hash() if is_grid else id(maze), count)
+        entry = self.entries.get(key)
+        if entry is not None and (is_grid or entry[0] is maze):
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        heuristic = LandmarkHeuristic(maze if is_grid else FlatGrid(maze), count, cache)
+        self.entries.pop(key, None)
+        self.entries[key] = (maze, heuristic)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return heuristic
+
+    def stats(self):
+        """
+        Counters for monitoring the cache.
+
+        Returns:
+            dict: hits, misses, entries and capacity.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "capacity": self.capacity}
+
+
+# Shared by callers that do not pass their own table cache
+_TABLES = LandmarkTableCache()
+
+
+def landmarks_for(maze, count=DEFAULT_LANDMARKS, cache=None, tables=None):
+    """
+    Get the landmark heuristic for a maze, building its tables only the first time.
+
+    Args:
+        maze (FlatGrid or list): 2D grid representing the maze.
+        count (int): Number of landmarks.
+        cache (ArtifactCache): Also keep the distance tables on disk, if given.
+        tables (LandmarkTableCache): In-memory cache to use, the module's shared one if omitted.
+
+    Returns:
+        LandmarkHeuristic: Shared instance for this maze.
+    """
+    return (tables if tables is not None else _TABLES).heuristic_for(maze, count, cache)
+
+def main():
+    """
+    Compare nodes traversed by A* and greedy best-first search with and without landmarks.
+    """
+    from ChiaZhenYang import astar
+    from TanWyHang import greedy_bfs
+    from corridorGraph import add_loops
+
+    mazes = [("sample maze", maze_test_cases[0]["maze"]),
+             ("sample maze + 60 loops", add_loops(maze_test_cases[0]["maze"], 60))]
+    for label, maze in mazes:
+        landmarks = landmarks_for(maze)
+        print(f"\nLandmark Heuristic ({label}, {len(landmarks.landmarks)} landmarks)")
+        print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+        print("| Algorithm           | Manhattan Nodes   | ALT Nodes         | Reduction (%)     | Path Length       |")
+        print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+        for name, solver in [("A*", astar), ("GREEDY-BFS", greedy_bfs)]:
+            manhattan_nodes, alt_nodes, manhattan_lengths, alt_lengths = [], [], [], []
+            for test_case in maze_test_cases:
+                start, end = test_case["start"], test_case["end"]
+                plain = solver(start, end, maze)
+                guided = solver(start, end, maze, heuristic_fn=landmarks)
+                manhattan_nodes.append(plain[1])
+                alt_nodes.append(guided[1])
+                manhattan_lengths.append(len(plain[0]))
+                alt_lengths.append(len(guided[0]))
+            before, after = statistics.mean(manhattan_nodes), statistics.mean(alt_nodes)
+            print(f"| {name:<19} | "
+                  f"{before:^17.1f} | "
+                  f"{after:^17.1f} | "
+                  f"{(1 - after / before) * 100:^17.1f} | "
+                  f"{f'{statistics.mean(manhattan_lengths):.1f} -> {statistics.mean(alt_lengths):.1f}':^17} |")
+        print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+
+
+if __name__ == "__main__":
+    main()
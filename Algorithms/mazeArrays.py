@@ -0,0 +1,135 @@
+import argparse
+import random
+import time
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("mazeArrays needs NumPy, which the other modules do not; install it with "
+                      "'pip install numpy'") from error
+from mazeGenerators import HEIGHT, WIDTH, WALL, carve_buffer
+
+# Number of start points sampled per maze, as in mazeGenerator.py
+START_COUNT = 20
+
+
+def carve_array(height=HEIGHT, width=WIDTH, seed=None):
+    """
+    Carve a maze and expose it as a uint8 array without copying cell by cell.
+
+    Carving itself is a sequential walk and stays in mazeGenerators; the
+    bordered bytearray it fills is viewed by NumPy and the border sliced off.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        seed (int): Seed for the carving RNG; None for a random maze.
+
+    Returns:
+        ndarray: height x width uint8 grid, 1 for a wall and 0 for an open cell.
+    """
+    cells, stride = carve_buffer(height, width, random.Random(seed))
+    bordered = np.frombuffer(cells, dtype=np.uint8).reshape(height + 4, stride)
+    return bordered[2:-2, 2:-2]
+
+
+def pad_array(grid):
+    """
+    Add the wall column on the right and wall row at the bottom that maze_grid has.
+    """
+    return np.pad(grid, ((0, 1), (0, 1)), constant_values=WALL)
+
+
+def open_cell_ids(grid):
+    """
+    Flat ids (row * width + col) of every open cell, in row-major order.
+    """
+    return np.flatnonzero(grid.ravel() == 0)
+
+
+def sample_starts(grid, count=START_COUNT, rng=None):
+    """
+    Sample open cells biased to the first and second quartile of the maze.
+
+    flatnonzero already returns open cells in row-major order, which is the
+    order mazeGenerator.py sorted its tuples into, so the first half of the
+    ids is the first half of the sorted cells without any sorting.
+
+    Args:
+        grid (ndarray): Maze grid.
+        count (int): Number of start points.
+        rng (numpy.random.Generator): Source of randomness.
+
+    Returns:
+        ndarray: count x 2 array of [row, col] positions in random order.
+    """
+    rng = rng or np.random.default_rng()
+    ids = open_cell_ids(grid)
+    first_half = ids[:len(ids) // 2]
+    chosen = rng.choice(first_half, size=min(count, len(first_half)), replace=False)
+    return np.column_stack(np.divmod(chosen, grid.shape[1]))
+
+
+def generate_case(height=HEIGHT, width=WIDTH, seed=None, count=START_COUNT):
+    """
+    Generate one padded maze and its sampled start points.
+
+    Args:
+        height (int): Rows to carve, before padding.
+        width (int): Columns to carve, before padding.
+        seed (int): Seed for both carving and sampling.
+        count (int): Number of start points.
+
+    Returns:
+        tuple: (grid, starts) as uint8 grid and count x 2 positions.
+    """
+    grid = pad_array(carve_array(height, width, seed))
+    return grid, sample_starts(grid, count, np.random.default_rng(seed))
+
+
+def generate_corpus(mazes, height=HEIGHT, width=WIDTH, seed=0, count=START_COUNT):
+    """
+    Generate a benchmark corpus of mazes and start points.
+
+    Args:
+        mazes (int): Number of mazes.
+        height (int): Rows to carve, before padding.
+        width (int): Columns to carve, before padding.
+        seed (int): Seed of the first maze; maze i uses seed + i.
+        count (int): Start points per maze.
+
+    Yields:
+        tuple: (grid, starts) per maze, as from generate_case.
+    """
+    for index in range(mazes):
+        yield generate_case(height, width, seed + index, count)
+
+
+def to_maze_grid(grid):
+    """
+    Convert an array maze to the list-of-lists format of mazeSamples.maze_grid.
+    """
+    return grid.tolist()
+
+
+def main():
+    """
+    Time corpus generation with the array pipeline.
+    """
+    parser = argparse.ArgumentParser(description="Generate a maze corpus with NumPy bookkeeping.")
+    parser.add_argument("--mazes", type=int, default=100, help="number of mazes")
+    parser.add_argument("--height", type=int, default=HEIGHT, help="rows before padding")
+    parser.add_argument("--width", type=int, default=WIDTH, help="columns before padding")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first maze")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    open_total = 0
+    for grid, _ in generate_corpus(args.mazes, args.height, args.width, args.seed):
+        open_total += grid.size - int(np.count_nonzero(grid))
+    elapsed = time.perf_counter() - start_time
+    print(f"Generated {args.mazes} mazes of {args.height + 1}x{args.width + 1} "
+          f"({open_total} open cells) in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import argparse
+import mmap
+import os
+import random
+import struct
+import time
+from mazeSamples import maze_grid, maze_test_cases
+from mazeGenerators import GENERATORS, HEIGHT, WIDTH, eller_rows, pad_maze, pad_rows
+from bitGrid import PackedRow, pack_row, row_bytes
+
+# File layout (all header fields little-endian):
+#   header: magic, format version, flags (unused, 0), height, width,
+#           bytes per row, offset of the first row
+#   rows:   height rows of bytes-per-row bytes each. Bit 1 is a wall, cells
+#           are packed most significant bit first and the unused bits at the
+#           end of a row are set (walls).
+MAGIC = b"MAZB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+DATA_OFFSET = 32
+
+
+class MazeWriter:
+    """
+    Write a maze file one row at a time.
+
+    The height is not needed up front; it is counted while rows are written
+    and patched into the header on close, so rows can come straight from a
+    streaming generator such as eller_rows.
+    """
+
+    def __init__(self, path, width):
+        """
+        Args:
+            path (str): File to create.
+            width (int): Number of cells per row.
+        """
+        self.path = path
+        self.width = width
+        self.height = 0
+        self.file = open(path, "wb")
+        self.write_header()
+
+    def write_header(self):
+        """
+        Write the header padded out to DATA_OFFSET at the current position.
+        """
+        header = HEADER.pack(MAGIC, VERSION, 0, self.height, self.width, row_bytes(self.width), DATA_OFFSET)
+        self.file.write(header.ljust(DATA_OFFSET, b"\0"))
+
+    def write_row(self, row):
+        """
+        Append one row of 0/1 cells.
+        """
+        if len(row) != self.width:
+            raise ValueError(f"row has {len(row)} cells, expected {self.width}")
+        self.file.write(pack_row(row, self.width))
+        self.height += 1
+
+    def close(self):
+        """
+        Patch the final height into the header and close the file.
+        """
+        if self.file.closed:
+            return
+        self.file.seek(0)
+        self.write_header()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_maze_file(path, rows, width=None):
+    """
+    Write any iterable of rows to a maze file.
+
+    Args:
+        path (str): File to create.
+        rows (iterable): Rows of 0/1 cells; may be a generator.
+        width (int): Cells per row, taken from the first row if omitted.
+
+    Returns:
+        int: Number of rows written.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if width is None:
+        width = len(first) if first is not None else 0
+    with MazeWriter(path, width) as writer:
+        if first is not None:
+            writer.write_row(first)
+        for row in rows:
+            writer.write_row(row)
+        return writer.height
+
+
+class MazeFile:
+    """
+    Memory-mapped maze file.
+
+    Behaves like the nested-list maze the solvers take: len(maze) is the
+    height and maze[row][col] is 1 for a wall, but rows are only decoded
+    when they are read, so a 10k x 10k maze costs its 12.5 MB of packed
+    bits in the page cache rather than 100M Python ints.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): File written by MazeWriter.
+
+        Raises:
+            ValueError: If the file is not a maze file of a supported version.
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a maze file")
+        magic, version, _, self.height, self.width, self.row_bytes, self.offset = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} maze file")
+        if len(self.data) < self.offset + self.height * self.row_bytes:
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.height
+        if not 0 <= row < self.height:
+            raise IndexError("maze row out of range")
+        return PackedRow(self.data, self.offset + row * self.row_bytes, self.width)
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self[row]
+
+    def is_wall(self, row, col):
+        """
+        Read one cell without creating a row view.
+        """
+        byte = self.data[self.offset + row * self.row_bytes + (col >> 3)]
+        return (byte >> (7 - (col & 7))) & 1
+
+    def rows(self):
+        """
+        Yield every row decoded into a bytearray of 0/1 cells.
+        """
+        for row in range(self.height):
+            yield self[row].unpack()
+
+    def close(self):
+        """
+        Unmap the file.
+        """
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    """
+    Write a maze file, reopen it with mmap and solve the test cases from it.
+    """
+    from ChiaZhenYang import astar
+
+    parser = argparse.ArgumentParser(description="Write a maze to the bit-packed maze file format.")
+    parser.add_argument("path", help="maze file to write")
+    parser.add_argument("--algorithm", choices=list(GENERATORS), default=None,
+                        help="generate a maze instead of writing the sample maze_grid "
+                             "(dfs if --height, --width or --seed is given)")
+    parser.add_argument("--height", type=int, default=None, help=f"rows before padding (default {HEIGHT})")
+    parser.add_argument("--width", type=int, default=None, help=f"columns before padding (default {WIDTH})")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible mazes")
+    args = parser.parse_args()
+    # A size or seed only means something for a generated maze
+    if args.algorithm is None and (args.height, args.width, args.seed) != (None, None, None):
+        args.algorithm = "dfs"
+    if args.height is None:
+        args.height = HEIGHT
+    if args.width is None:
+        args.width = WIDTH
+
+    start_time = time.perf_counter()
+    if args.algorithm is None:
+        rows = maze_grid
+    elif args.algorithm == "eller":
+        rows = pad_rows(eller_rows(args.height, args.width, random.Random(args.seed)))
+    else:
+        rows = pad_maze(GENERATORS[args.algorithm](args.height, args.width, random.Random(args.seed)))
+    height = write_maze_file(args.path, rows)
+    elapsed = time.perf_counter() - start_time
+    print(f"Wrote {height} rows ({os.path.getsize(args.path)} bytes) to {args.path} in {elapsed:.2f} s")
+
+    with MazeFile(args.path) as maze:
+        print(f"Mapped {maze.height}x{maze.width} maze")
+        if args.algorithm is None:
+            same = all(list(maze[i]) == maze_grid[i] for i in range(maze.height))
+            print(f"Round trip matches maze_grid: {same}")
+            for i, test_case in enumerate(maze_test_cases, 1):
+                path = astar(test_case["start"], test_case["end"], maze)[0]
+                expected = astar(test_case["start"], test_case["end"], test_case["maze"])[0]
+                print(f"Maze {i}: path length {len(path)} from the file, {len(expected)} from maze_grid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+import argparse
+import random
+import sys
+import time
+from array import array
+
+# Maze dimensions used by the sample mazes, before padding
+WIDTH = 48
+HEIGHT = 48
+
+# Directions: North, East, South, West, two cells at a time
+DIRECTIONS = [(-2, 0), (0, 2), (2, 0), (0, -2)]
+
+WALL = 1
+OPEN = 0
+BLOCKED = 2  # Margin marker in the carving buffer; never carved
+
+
+def carve_buffer(height=HEIGHT, width=WIDTH, rng=None, start=(1, 1)):
+    """
+    Carve a perfect maze with randomized depth-first search, without recursion.
+
+    The recursion of the original carve() is replaced by two flat arrays
+    holding, per stack frame, the cell id and how many directions it has
+    tried. Like the original, one directions list is shuffled in place each
+    time a cell is entered, including while an outer frame is still walking
+    it, so a given seed carves exactly the maze the recursive version did.
+
+    The checks the original made with count_adjacent_paths can never fail
+    when moving two cells at a time from an unvisited target, so they are
+    dropped. A two-cell margin marked BLOCKED around the buffer replaces
+    bounds checks.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+        start (tuple): Cell to carve from.
+
+    Returns:
+        tuple: (cells, stride) where cells is the bordered bytearray; row x of
+        the maze is cells[(x + 2) * stride + 2:(x + 2) * stride + 2 + width].
+    """
+    rng = rng or random
+    stride = width + 4
+    cells = bytearray([BLOCKED]) * (stride * (height + 4))
+    wall_row = bytes([WALL]) * width
+    for x in range(height):
+        cells[(x + 2) * stride + 2:(x + 2) * stride + 2 + width] = wall_row
+
+    # Shuffling the flat offsets draws the same random numbers as shuffling DIRECTIONS
+    steps = [dx * stride + dy for dx, dy in DIRECTIONS]
+
+    first = (start[0] + 2) * stride + start[1] + 2
+    cells[first] = OPEN
+    rng.shuffle(steps)
+    stack = array('I', [first])
+    tried = bytearray([0])
+    while stack:
+        index = tried[-1]
+        if index == 4:
+            stack.pop()
+            tried.pop()
+            continue
+        tried[-1] = index + 1
+        current = stack[-1]
+        step = steps[index]
+        target = current + step
+        if cells[target] == WALL:
+            cells[current + step // 2] = OPEN
+            cells[target] = OPEN
+            rng.shuffle(steps)
+            stack.append(target)
+            tried.append(0)
+    return cells, stride
+
+
+def carve_maze(height=HEIGHT, width=WIDTH, rng=None, start=(1, 1)):
+    """
+    Carve a perfect maze with carve_buffer and cut it into rows.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+        start (tuple): Cell to carve from.
+
+    Returns:
+        list: height rows, each a bytearray of width cells (1 wall, 0 open).
+    """
+    cells, stride = carve_buffer(height, width, rng, start)
+    return [cells[(x + 2) * stride + 2:(x + 2) * stride + 2 + width] for x in range(height)]
+
+
+def empty_rows(height, width):
+    """
+    Rows of solid wall to carve into.
+    """
+    return [bytearray([WALL]) * width for _ in range(height)]
+
+
+def lattice_neighbors(cell, cell_rows, cell_columns):
+    """
+    Ids of the lattice cells next to a lattice cell.
+
+    The lattice generators work on cell ids r * cell_columns + c, where
+    lattice cell (r, c) is maze cell (2r + 1, 2c + 1), the same cells
+    carve_maze opens.
+    """
+    r, c = divmod(cell, cell_columns)
+    found = []
+    if r > 0:
+        found.append(cell - cell_columns)
+    if c < cell_columns - 1:
+        found.append(cell + 1)
+    if r < cell_rows - 1:
+        found.append(cell + cell_columns)
+    if c > 0:
+        found.append(cell - 1)
+    return found
+
+
+def open_passage(rows, cell, other, cell_columns):
+    """
+    Open two lattice cells and the wall between them.
+    """
+    r1, c1 = divmod(cell, cell_columns)
+    r2, c2 = divmod(other, cell_columns)
+    rows[2 * r1 + 1][2 * c1 + 1] = OPEN
+    rows[2 * r2 + 1][2 * c2 + 1] = OPEN
+    rows[r1 + r2 + 1][c1 + c2 + 1] = OPEN
+
+
+def kruskal_maze(height=HEIGHT, width=WIDTH, rng=None):
+    """
+    Randomized Kruskal: join cells through walls taken in random order, skipping
+    walls whose cells are already connected. Many short dead ends.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+
+    Returns:
+        list: height rows, each a bytearray of width cells (1 wall, 0 open).
+    """
+    rng = rng or random
+    rows = empty_rows(height, width)
+    cell_rows, cell_columns = height // 2, width // 2
+    count = cell_rows * cell_columns
+    parent = array('i', range(count))
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    edges = [(cell, cell + 1) for cell in range(count) if cell % cell_columns < cell_columns - 1]
+    edges.extend((cell, cell + cell_columns) for cell in range(count - cell_columns))
+    rng.shuffle(edges)
+    if count == 1:
+        open_passage(rows, 0, 0, cell_columns)
+    for cell, other in edges:
+        root, other_root = find(cell), find(other)
+        if root != other_root:
+            parent[other_root] = root
+            open_passage(rows, cell, other, cell_columns)
+    return rows
+
+
+def prim_maze(height=HEIGHT, width=WIDTH, rng=None):
+    """
+    Randomized Prim: grow one tree by attaching a random frontier cell to a
+    random neighbor already in the maze. Short, branchy corridors.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+
+    Returns:
+        list: height rows, each a bytearray of width cells (1 wall, 0 open).
+    """
+    rng = rng or random
+    rows = empty_rows(height, width)
+    cell_rows, cell_columns = height // 2, width // 2
+    count = cell_rows * cell_columns
+    if count == 0:
+        return rows
+    state = bytearray(count)  # 0 outside, 1 frontier, 2 in the maze
+    frontier = []
+
+    def add(cell):
+        state[cell] = 2
+        for neighbor in lattice_neighbors(cell, cell_rows, cell_columns):
+            if state[neighbor] == 0:
+                state[neighbor] = 1
+                frontier.append(neighbor)
+
+    first = rng.randrange(count)
+    open_passage(rows, first, first, cell_columns)
+    add(first)
+    while frontier:
+        # Swap the pick to the end so removing it is O(1)
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        cell = frontier.pop()
+        inside = [neighbor for neighbor in lattice_neighbors(cell, cell_rows, cell_columns) if state[neighbor] == 2]
+        open_passage(rows, cell, rng.choice(inside), cell_columns)
+        add(cell)
+    return rows
+
+
+def wilson_maze(height=HEIGHT, width=WIDTH, rng=None):
+    """
+    Wilson's algorithm: loop-erased random walks from each cell until they hit
+    the tree. Samples uniformly among all perfect mazes, so it has no
+    corridor or branching bias.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+
+    Returns:
+        list: height rows, each a bytearray of width cells (1 wall, 0 open).
+    """
+    rng = rng or random
+    rows = empty_rows(height, width)
+    cell_rows, cell_columns = height // 2, width // 2
+    count = cell_rows * cell_columns
+    if count == 0:
+        return rows
+    in_tree = bytearray(count)
+    # Last exit taken from each cell; overwriting it on revisits erases loops
+    next_cell = array('i', [-1]) * count
+    root = rng.randrange(count)
+    in_tree[root] = 1
+    open_passage(rows, root, root, cell_columns)
+
+    for start in range(count):
+        cell = start
+        while not in_tree[cell]:
+            next_cell[cell] = rng.choice(lattice_neighbors(cell, cell_rows, cell_columns))
+            cell = next_cell[cell]
+        cell = start
+        while not in_tree[cell]:
+            in_tree[cell] = 1
+            open_passage(rows, cell, next_cell[cell], cell_columns)
+            cell = next_cell[cell]
+    return rows
+
+
+def eller_rows(height=HEIGHT, width=WIDTH, rng=None):
+    """
+    Eller's algorithm, yielding the maze one row at a time.
+
+    Only the current row's set labels are kept, so memory is O(width) however
+    tall the maze is. Each cell row randomly joins neighbors in different
+    sets, then every set drops at least one passage to the next row; the
+    last cell row joins every remaining set so the maze is connected.
+
+    Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        rng (random.Random): Source of randomness, defaults to the random module.
+
+    Yields:
+        bytearray: Each of the height rows in order (1 wall, 0 open).
+    """
+    rng = rng or random
+    cell_rows, cell_columns = height // 2, width // 2
+    wall = bytearray([WALL]) * width
+    labels = list(range(cell_columns))
+    next_label = cell_columns
+    parent = {}
+
+    def find(label):
+        root = label
+        while root in parent:
+            root = parent[root]
+        while label != root:
+            parent[label], label = root, parent[label]
+        return root
+
+    if height:
+        yield bytearray(wall)
+    emitted = 1
+    for r in range(cell_rows):
+        last = r == cell_rows - 1
+        row = bytearray(wall)
+        row[1:2 * cell_columns:2] = bytes(cell_columns)
+        parent.clear()
+        for c in range(cell_columns - 1):
+            left, right = find(labels[c]), find(labels[c + 1])
+            if left != right and (last or rng.random() < 0.5):
+                parent[right] = left
+                row[2 * c + 2] = OPEN
+        labels = [find(label) for label in labels]
+        yield row
+        emitted += 1
+        if emitted == height:
+            return
+
+        below = bytearray(wall)
+        if not last:
+            members = {}
+            for c, label in enumerate(labels):
+                members.setdefault(label, []).append(c)
+            kept = [False] * cell_columns
+            for columns in members.values():
+                chosen = rng.choice(columns)
+                for c in columns:
+                    if c == chosen or rng.random() < 0.5:
+                        below[2 * c + 1] = OPEN
+                        kept[c] = True
+            for c in range(cell_columns):
+                if not kept[c]:
+                    labels[c] = next_label
+                    next_label += 1
+        yield below
+        emitted += 1
+        if emitted == height:
+            return
+    while emitted < height:
+        yield bytearray(wall)
+        emitted += 1
+
+
+def eller_maze(height=HEIGHT, width=WIDTH, rng=None):
+    """
+    Eller's algorithm collected into a list of rows, see eller_rows.
+    """
+    return list(eller_rows(height, width, rng))
+
+
+def braid(rows, fraction, rng=None):
+    """
+    Inject loops by knocking a wall out of a share of the dead ends.
+
+    Dead ends are visited in random order; each one still a dead end is opened
+    into a neighboring lattice cell with probability fraction, preferring a
+    neighbor that is itself a dead end. fraction 0 keeps a perfect maze and
+    1 leaves no dead ends at all.
+
+    Args:
+        rows (list): Maze rows from any generator, changed in place.
+        fraction (float): Share of dead ends to remove, between 0 and 1.
+        rng (random.Random): Source of randomness, defaults to the random module.
+
+    Returns:
+        list: The same rows.
+    """
+    rng = rng or random
+    height, width = len(rows), len(rows[0]) if rows else 0
+
+    def open_at(x, y):
+        return 0 <= x < height and 0 <= y < width and rows[x][y] == OPEN
+
+    def exits(x, y):
+        return sum(1 for dx, dy in ((-1, 0), (0, 1), (1, 0), (0, -1)) if open_at(x + dx, y + dy))
+
+    dead_ends = [(x, y) for x in range(1, height, 2) for y in range(1, width, 2)
+                 if rows[x][y] == OPEN and exits(x, y) == 1]
+    rng.shuffle(dead_ends)
+    for x, y in dead_ends:
+        if exits(x, y) != 1 or rng.random() >= fraction:
+            continue
+        walls = [(dx, dy) for dx, dy in DIRECTIONS
+                 if open_at(x + dx, y + dy) and rows[x + dx // 2][y + dy // 2] == WALL]
+        if not walls:
+            continue
+        preferred = [(dx, dy) for dx, dy in walls if exits(x + dx, y + dy) == 1]
+        dx, dy = rng.choice(preferred or walls)
+        rows[x + dx // 2][y + dy // 2] = OPEN
+    return rows
+
+
+# Every generator takes (height, width, rng) and returns rows of 1s and 0s
+GENERATORS = {
+    "dfs": carve_maze,
+    "kruskal": kruskal_maze,
+    "prim": prim_maze,
+    "wilson": wilson_maze,
+    "eller": eller_maze,
+}
+
+
+def pad_maze(rows):
+    """
+    Add a wall column on the right and a wall row at the bottom.
+
+    Args:
+        rows (list): Maze rows.
+
+    Returns:
+        list: The same rows, extended in place, plus one new wall row.
+    """
+    for row in rows:
+        row.append(WALL)
+    rows.append(type(rows[0])([WALL]) * len(rows[0]) if rows else [WALL])
+    return rows
+
+
+def pad_rows(rows):
+    """
+    Streaming pad_maze: yield each row with a wall appended, then a wall row.
+    """
+    width = None
+    for row in rows:
+        row.append(WALL)
+        width = len(row)
+        yield row
+    yield bytearray([WALL]) * (width or 1)
+
+
+def generate_maze(height=HEIGHT, width=WIDTH, seed=None, pad=True, algorithm="dfs", loops=0.0):
+    """
+    Generate a maze in the format of mazeSamples.maze_grid.
+
+    Args:
+        height (int): Rows to carve, before padding.
+        width (int): Columns to carve, before padding.
+        seed (int): Seed for a private random.Random; None for a random maze.
+        pad (bool): Whether to add the wall column and row maze_grid has.
+        algorithm (str): Key into GENERATORS.
+        loops (float): Share of dead ends to braid away, 0 for a perfect maze.
+
+    Returns:
+        list: List of lists of ints, 1 for a wall and 0 for an open cell.
+    """
+    rng = random.Random(seed)
+    rows = GENERATORS[algorithm](height, width, rng)
+    if loops:
+        braid(rows, loops, rng)
+    if pad:
+        pad_maze(rows)
+    return [list(row) for row in rows]
+
+
+def format_maze(maze):
+    """
+    Format a maze as the Python literal mazeSamples.py stores.
+    """
+    return "[\n" + ",\n".join(str(list(row)) for row in maze) + "\n]"
+
+
+def write_maze(rows, stream):
+    """
+    Write a maze literal one row at a time, so large mazes never exist as one string.
+
+    Args:
+        rows (iterable): Maze rows; may be a generator such as eller_rows.
+        stream (file): Output stream.
+    """
+    stream.write("[")
+    separator = "\n"
+    for row in rows:
+        stream.write(separator)
+        stream.write(str(list(row)))
+        separator = ",\n"
+    stream.write("\n]\n")
+
+
+def main():
+    """
+    Generate one maze and print it as a maze_grid literal.
+    """
+    parser = argparse.ArgumentParser(description="Generate a maze in the maze_grid format.")
+    parser.add_argument("--height", type=int, default=HEIGHT, help="rows before padding")
+    parser.add_argument("--width", type=int, default=WIDTH, help="columns before padding")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible mazes")
+    parser.add_argument("--algorithm", choices=list(GENERATORS), default="dfs", help="generation algorithm")
+    parser.add_argument("--loops", type=float, default=0.0, help="share of dead ends to braid away (0 to 1)")
+    parser.add_argument("--time", action="store_true", help="report generation time instead of printing the maze")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.algorithm == "eller" and not args.loops and not args.time:
+        # Stream straight to the output without holding the maze
+        write_maze(pad_rows(eller_rows(args.height, args.width, rng)), sys.stdout)
+        return
+
+    start_time = time.perf_counter()
+    rows = GENERATORS[args.algorithm](args.height, args.width, rng)
+    if args.loops:
+        braid(rows, args.loops, rng)
+    pad_maze(rows)
+    elapsed = time.perf_counter() - start_time
+    if args.time:
+        open_count = sum(len(row) - sum(row) for row in rows)
+        print(f"Generated {len(rows)}x{len(rows[0])} {args.algorithm} maze with {open_count} open cells in {elapsed:.2f} s")
+    else:
+        write_maze(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
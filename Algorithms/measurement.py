@@ -0,0 +1,187 @@
+import random
+import statistics
+import time
+import tracemalloc
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Linearly interpolated percentile of already sorted samples.
+
+    Args:
+        sorted_samples (list): Samples in ascending order.
+        fraction (float): Percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: Interpolated percentile value.
+    """
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def peak_memory(function, *args, **kwargs):
+    """
+    Run a function once under tracemalloc and report its peak traced memory.
+
+    Args:
+        function (callable): Function to run.
+        *args: Positional arguments for function.
+        **kwargs: Keyword arguments for function.
+
+    Returns:
+        tuple: (result, peak_memory) with peak memory in bytes.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if already_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = function(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, peak
+
+
+def measure_once(function, *args, **kwargs):
+    """
+    Time one call with tracing off, then repeat it under tracemalloc for memory.
+
+    The random module's state is replayed for the memory pass so randomized
+    solvers make the same choices in both passes.
+
+    Args:
+        function (callable): Function to measure.
+        *args: Positional arguments for function.
+        **kwargs: Keyword arguments for function.
+
+    Returns:
+        tuple: (result, time_taken, peak_memory) with time in seconds and memory in bytes.
+    """
+    random_state = random.getstate()
+    start_ns = time.perf_counter_ns()
+    result = function(*args, **kwargs)
+    time_taken = (time.perf_counter_ns() - start_ns) / 1e9
+
+    after_state = random.getstate()
+    random.setstate(random_state)
+    _, peak = peak_memory(function, *args, **kwargs)
+    random.setstate(after_state)
+    return result, time_taken, peak
+
+
+def preview_run(function, *args, **kwargs):
+    """
+    Run a function for display only, leaving the random module's state untouched.
+
+    Solver wrappers call this for the visualized run before measure_once, so a
+    randomized solver's measured run makes the same choices the user watched.
+
+    Args:
+        function (callable): Function to run.
+        *args: Positional arguments for function.
+        **kwargs: Keyword arguments for function.
+
+    Returns:
+        The function's result.
+    """
+    random_state = random.getstate()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        random.setstate(random_state)
+
+
+def benchmark(function, *args, warmup=2, repeat=10, **kwargs):
+    """
+    Time repeated calls of a function and summarize the distribution.
+
+    Warmup calls are discarded. Timing uses perf_counter_ns with tracemalloc
+    off; peak memory comes from one extra traced call afterwards.
+
+    Args:
+        function (callable): Function to measure.
+        *args: Positional arguments for function.
+        warmup (int): Untimed calls made first.
+        repeat (int): Timed calls.
+        **kwargs: Keyword arguments for function.
+
+    Returns:
+        dict: result, samples (seconds), min, median, mean, p90, p99, max and peak_memory (bytes).
+    """
+    for _ in range(warmup):
+        function(*args, **kwargs)
+
+    samples = []
+    result = None
+    for _ in range(max(1, repeat)):
+        start_ns = time.perf_counter_ns()
+        result = function(*args, **kwargs)
+        samples.append((time.perf_counter_ns() - start_ns) / 1e9)
+
+    _, peak = peak_memory(function, *args, **kwargs)
+    ordered = sorted(samples)
+    return {
+        "result": result,
+        "samples": samples,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p90": percentile(ordered, 0.90),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1],
+        "peak_memory": peak,
+    }
+
+
+def main():
+    """
+    Benchmark every solver's pure search over the maze test cases.
+    """
+    from mazeSamples import maze_test_cases
+    from ChiaZhenYang import astar_search
+    from TanWyHang import greedy_bfs_search
+    from Shan import bfs_search
+    from YongZiSheng import dfs_search
+    from YapJinYan import hill_climbing_search
+    from WongYingYi import simulated_annealing_search
+
+    searches = [
+        ("A*", astar_search),
+        ("GREEDY-BFS", greedy_bfs_search),
+        ("BFS", bfs_search),
+        ("DFS", dfs_search),
+        ("HILL-CLIMBING", hill_climbing_search),
+        ("SIMULATED ANNEALING", simulated_annealing_search),
+    ]
+
+    print("\nSearch Timing (perf_counter_ns, tracing off; 2 warmup + 10 timed runs per case)")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+    print("| Algorithm           | Median (ms)       | p90 (ms)          | p99 (ms)          | Peak Memory (MB)  |")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+    for name, search in searches:
+        samples = []
+        peak = 0
+        for test_case in maze_test_cases:
+            random.seed(0)
+            stats = benchmark(search, test_case["start"], test_case["end"], test_case["maze"])
+            samples.extend(stats["samples"])
+            peak = max(peak, stats["peak_memory"])
+        samples.sort()
+        print(f"| {name:<19} | "
+              f"{statistics.median(samples) * 1000:^17.4f} | "
+              f"{percentile(samples, 0.90) * 1000:^17.4f} | "
+              f"{percentile(samples, 0.99) * 1000:^17.4f} | "
+              f"{peak / (1024 * 1024):^17.6f} |")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+
+
+if __name__ == "__main__":
+    main()
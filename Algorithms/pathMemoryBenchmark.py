@@ -0,0 +1,119 @@
+import heapq
+import tracemalloc
+from collections import deque
+from mazeSamples import maze_test_cases
+from ChiaZhenYang import astar, get_neighbors, heuristic
+from TanWyHang import greedy_bfs
+from Shan import bfs
+from YongZiSheng import dfs
+
+SOLVERS = [
+    ("A*", "astar", astar),
+    ("GREEDY-BFS", "greedy", greedy_bfs),
+    ("BFS", "bfs", bfs),
+    ("DFS", "dfs", dfs),
+]
+
+
+def path_copy_search(start, end, maze, strategy):
+    """
+    Reference search that stores a full copy of the path in every frontier entry.
+
+    This mirrors how the solvers worked before they switched to a parent map
+    and exists only so the benchmark has something to compare against.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        strategy (str): One of "astar", "greedy", "bfs" or "dfs".
+
+    Returns:
+        tuple: (path, peak_memory)
+    """
+    start, end = tuple(start), tuple(end)
+    position_id = 0
+    if strategy in ("astar", "greedy"):
+        frontier = [(heuristic(start, end), position_id, start, [start], 0)]
+    else:
+        frontier = deque([(start, [start])])
+    visited = {start: 0}
+    traversed_nodes = []
+
+    tracemalloc.start()
+    while frontier:
+        if strategy in ("astar", "greedy"):
+            _, _, current, path, g_score = heapq.heappop(frontier)
+        elif strategy == "bfs":
+            current, path = frontier.popleft()
+            g_score = len(path) - 1
+        else:
+            current, path = frontier.pop()
+            g_score = len(path) - 1
+        if g_score > visited[current]:
+            continue
+        traversed_nodes.append(current)
+
+        if current == end:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return path, peak_memory
+
+        for neighbor in get_neighbors(current, maze):
+            new_g_score = g_score + 1
+            if strategy == "astar":
+                if neighbor in visited and new_g_score >= visited[neighbor]:
+                    continue
+            elif neighbor in visited:
+                continue
+            visited[neighbor] = new_g_score
+            new_path = path + [neighbor]
+            if strategy in ("astar", "greedy"):
+                priority = heuristic(neighbor, end)
+                if strategy == "astar":
+                    priority += new_g_score
+                position_id += 1
+                heapq.heappush(frontier, (priority, position_id, neighbor, new_path, new_g_score))
+            else:
+                frontier.append((neighbor, new_path))
+
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return [], peak_memory
+
+
+def main():
+    """
+    Compare peak memory of path-copying frontiers against the parent-map solvers.
+    """
+    print("\n\nPeak Memory: Path Copies vs Parent Map")
+    print("+--------+------------+-------------------+-------------------+-----------+")
+    print("| Maze # | Algorithm  | Path Copy (MB)    | Parent Map (MB)   | Reduction |")
+    print("+--------+------------+-------------------+-------------------+-----------+")
+    totals = {name: [0, 0] for name, _, _ in SOLVERS}
+    for i, test_case in enumerate(maze_test_cases, 1):
+        maze = test_case["maze"]
+        for name, strategy, solver in SOLVERS:
+            _, copy_peak = path_copy_search(test_case["start"], test_case["end"], maze, strategy)
+            path, _, _, _, parent_peak = solver(test_case["start"], test_case["end"], maze)
+            totals[name][0] += copy_peak
+            totals[name][1] += parent_peak
+            reduction = (1 - parent_peak / copy_peak) * 100 if copy_peak else 0
+            print(f"| {i:^6} | "
+                  f"{name:<10} | "
+                  f"{copy_peak / (1024 * 1024):^17.6f} | "
+                  f"{parent_peak / (1024 * 1024):^17.6f} | "
+                  f"{reduction:>8.1f}% |")
+    print("+--------+------------+-------------------+-------------------+-----------+")
+    for name, (copy_total, parent_total) in totals.items():
+        reduction = (1 - parent_total / copy_total) * 100 if copy_total else 0
+        print(f"| {'All':^6} | "
+              f"{name:<10} | "
+              f"{copy_total / (1024 * 1024):^17.6f} | "
+              f"{parent_total / (1024 * 1024):^17.6f} | "
+              f"{reduction:>8.1f}% |")
+    print("+--------+------------+-------------------+-------------------+-----------+")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import heapq
+import statistics
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from mazeSamples import maze_test_cases
+from flatGrid import FlatGrid
+
+NONE = -1
+# Stamps are unsigned 32-bit; wrap before overflowing
+MAX_EPOCH = 2 ** 32 - 1
+# Timed batches per solver in main()
+REPEAT = 25
+
+
+class SearchContext:
+    """
+    Reusable per-maze search state for answering many queries without reallocating.
+
+    Every per-cell table (discovered, closed, parent, g(n)) is an array sized
+    to the maze and allocated once. Instead of clearing the tables between
+    queries, each query bumps an epoch counter: a cell counts as discovered
+    or closed only if its stamp equals the current epoch, so stale entries
+    from earlier queries are ignored and "clearing" is O(1). The frontier
+    containers and the traversed list are reused too, and neighbors come
+    from the grid's precomputed tuple of neighbor ids per cell.
+
+    Searches expand cells in exactly the order the standalone solvers do, so
+    paths and node counts match astar_search, greedy_bfs_search, bfs_search
+    and dfs_search.
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+        """
+        self.grid = grid = maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+        self.adjacency = grid.neighbor_id_table()
+        cell_count = len(grid.cells)
+        self.seen = array('I', [0]) * cell_count
+        self.closed = array('I', [0]) * cell_count
+        self.parent = array('i', [NONE]) * cell_count
+        self.g_score = array('i', [0]) * cell_count
+        self.epoch = 0
+        self.heap = []
+        self.queue = deque()
+        self.traversed = []  # Cell ids expanded by the latest query
+        self.queries = 0
+
+    def begin(self):
+        """
+        Start a new query: advance the epoch and empty the reused containers.
+        """
+        self.epoch += 1
+        if self.epoch == MAX_EPOCH:
+            # Rare full reset so old stamps can never collide with new epochs
+            self.seen[:] = array('I', [0]) * len(self.seen)
+            self.closed[:] = array('I', [0]) * len(self.closed)
+            self.epoch = 1
+        self.heap.clear()
+        self.queue.clear()
+        self.traversed.clear()
+        self.queries += 1
+        return self.epoch
+
+    def path_to(self, cell):
+        """
+        Follow parent ids from a cell back to the query's start.
+
+        Returns:
+            list: Positions from the start to cell (inclusive).
+        """
+        position, parent = self.grid.position, self.parent
+        path = []
+        while cell != NONE:
+            path.append(position(cell))
+            cell = parent[cell]
+        path.reverse()
+        return path
+
+    def traversed_nodes(self):
+        """
+        Positions expanded by the latest query, in expansion order.
+        """
+        position = self.grid.position
+        return [position(cell) for cell in self.traversed]
+
+    def bfs(self, start, end):
+        """
+        Breadth-First Search.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            tuple: (path, nodes_expanded); expanded cell ids stay in self.traversed.
+        """
+        epoch = self.begin()
+        grid, seen, parent, queue, traversed = self.grid, self.seen, self.parent, self.queue, self.traversed
+        adjacency = self.adjacency
+        source, goal = grid.cell_id(start), grid.cell_id(end)
+        seen[source] = epoch
+        parent[source] = NONE
+        queue.append(source)
+        while queue:
+            current = queue.popleft()
+            traversed.append(current)
+            if current == goal:
+                return self.path_to(current), len(traversed)
+            for neighbor in adjacency[current]:
+                if seen[neighbor] != epoch:
+                    seen[neighbor] = epoch
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+        return [], len(traversed)
+
+    def dfs(self, start, end):
+        """
+        Depth-First Search, marking cells when they are pushed.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            tuple: (path, nodes_expanded); expanded cell ids stay in self.traversed.
+        """
+        epoch = self.begin()
+        grid, seen, parent, stack, traversed = self.grid, self.seen, self.parent, self.heap, self.traversed
+        adjacency = self.adjacency
+        source, goal = grid.cell_id(start), grid.cell_id(end)
+        seen[source] = epoch
+        parent[source] = NONE
+        stack.append(source)
+        while stack:
+            current = stack.pop()
+            traversed.append(current)
+            if current == goal:
+                return self.path_to(current), len(traversed)
+            for neighbor in adjacency[current]:
+                if seen[neighbor] != epoch:
+                    seen[neighbor] = epoch
+                    parent[neighbor] = current
+                    stack.append(neighbor)
+        return [], len(traversed)
+
+    def greedy_bfs(self, start, end):
+        """
+        Greedy Best-First Search on the Manhattan distance to the goal.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            tuple: (path, nodes_expanded); expanded cell ids stay in self.traversed.
+        """
+        epoch = self.begin()
+        grid, seen, parent, frontier, traversed = self.grid, self.seen, self.parent, self.heap, self.traversed
+        adjacency, width = self.adjacency, grid.width
+        source, goal = grid.cell_id(start), grid.cell_id(end)
+        gx, gy = divmod(goal, width)
+        position_id = 0  # Tie-breaker for items with same heuristic
+        seen[source] = epoch
+        parent[source] = NONE
+        sx, sy = divmod(source, width)
+        frontier.append((abs(sx - gx) + abs(sy - gy), position_id, source))
+        while frontier:
+            _, _, current = heapq.heappop(frontier)
+            traversed.append(current)
+            if current == goal:
+                return self.path_to(current), len(traversed)
+            for neighbor in adjacency[current]:
+                if seen[neighbor] != epoch:
+                    seen[neighbor] = epoch
+                    parent[neighbor] = current
+                    position_id += 1
+                    nx, ny = divmod(neighbor, width)
+                    heapq.heappush(frontier, (abs(nx - gx) + abs(ny - gy), position_id, neighbor))
+        return [], len(traversed)
+
+    def astar(self, start, end):
+        """
+        A* Search on the Manhattan distance, closing cells when they are popped.
+
+        g_score keeps the cheapest cost pushed for each cell this epoch, so a
+        push that could only ever be popped as a stale entry is skipped.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            tuple: (path, nodes_expanded); expanded cell ids stay in self.traversed.
+        """
+        epoch = self.begin()
+        grid, seen, closed, parent, g_scores = self.grid, self.seen, self.closed, self.parent, self.g_score
+        frontier, traversed = self.heap, self.traversed
+        adjacency, width = self.adjacency, grid.width
+        source, goal = grid.cell_id(start), grid.cell_id(end)
+        gx, gy = divmod(goal, width)
+        position_id = 0  # Tie-breaker for items with same f(n) score
+        sx, sy = divmod(source, width)
+        seen[source] = epoch
+        g_scores[source] = 0
+        # Priority queue stores (f(n), position_id, current, g(n), parent)
+        frontier.append((abs(sx - gx) + abs(sy - gy), position_id, source, 0, NONE))
+        while frontier:
+            _, _, current, g_score, came_from = heapq.heappop(frontier)
+            if closed[current] == epoch:
+                continue  # Already expanded through a path at least as cheap
+            closed[current] = epoch
+            parent[current] = came_from
+            traversed.append(current)
+            if current == goal:
+                return self.path_to(current), len(traversed)
+            new_g_score = g_score + 1  # Each step has a cost of 1
+            for neighbor in adjacency[current]:
+                if closed[neighbor] == epoch:
+                    continue
+                if seen[neighbor] == epoch and g_scores[neighbor] <= new_g_score:
+                    continue
+                seen[neighbor] = epoch
+                g_scores[neighbor] = new_g_score
+                position_id += 1
+                nx, ny = divmod(neighbor, width)
+                heapq.heappush(frontier, (new_g_score + abs(nx - gx) + abs(ny - gy), position_id, neighbor,
+                                          new_g_score, current))
+        return [], len(traversed)
+
+
+def main():
+    """
+    Answer the maze_test_cases batch with fresh solver calls and with one reused context.
+    """
+    from ChiaZhenYang import astar_search
+    from TanWyHang import greedy_bfs_search
+    from Shan import bfs_search
+    from YongZiSheng import dfs_search
+
+    grid = FlatGrid(maze_test_cases[0]["maze"])
+    context = SearchContext(grid)
+    queries = [(test_case["start"], test_case["end"]) for test_case in maze_test_cases]
+    pairs = [
+        ("A*", astar_search, context.astar),
+        ("GREEDY-BFS", greedy_bfs_search, context.greedy_bfs),
+        ("BFS", bfs_search, context.bfs),
+        ("DFS", dfs_search, context.dfs),
+    ]
+
+    def run_fresh(search):
+        return [(path, len(traversed)) for path, traversed in (search(start, end, grid) for start, end in queries)]
+
+    def run_context(search):
+        return [search(start, end) for start, end in queries]
+
+    def peak(batch, search):
+        tracemalloc.start()
+        result = batch(search)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, peak_memory
+
+    def compare(fresh, reused, repeat=REPEAT):
+        # Alternate the two batches so drift in machine load hits both alike
+        fresh_samples, context_samples = [], []
+        for _ in range(repeat):
+            for batch, search, samples in ((run_fresh, fresh, fresh_samples), (run_context, reused, context_samples)):
+                start_ns = time.perf_counter_ns()
+                batch(search)
+                samples.append((time.perf_counter_ns() - start_ns) / 1e6)
+        return statistics.median(fresh_samples), statistics.median(context_samples)
+
+    print(f"\nSearch Context Reuse ({len(queries)} queries per batch, median of {REPEAT} interleaved batches)")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+    print("| Algorithm           | Fresh (ms)        | Context (ms)      | Fresh Peak (KB)   | Context Peak (KB) |")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+    for name, fresh, reused in pairs:
+        run_fresh(fresh), run_context(reused)  # Warmup, which also builds the grid's lazy neighbor tables
+        fresh_result, fresh_peak = peak(run_fresh, fresh)
+        context_result, context_peak = peak(run_context, reused)
+        assert fresh_result == context_result, name
+        fresh_time, context_time = compare(fresh, reused)
+        print(f"| {name:<19} | "
+              f"{fresh_time:^17.4f} | "
+              f"{context_time:^17.4f} | "
+              f"{fresh_peak / 1024:^17.2f} | "
+              f"{context_peak / 1024:^17.2f} |")
+    print("+---------------------+-------------------+-------------------+-------------------+-------------------+")
+    print(f"Context served {context.queries} queries from one set of {len(context.seen)}-cell arrays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from flatGrid import DIRECTIONS, FlatGrid
+from bitGrid import BitMaze
+
+
+def get_neighbors(position, maze):
+    """
+    Get valid neighboring positions (walkable cells only).
+
+    A FlatGrid answers from its precomputed neighbor table and a BitMaze
+    from its packed wall bits; a nested-list maze is scanned directly.
+
+    Args:
+        position (tuple): Current position (x, y).
+        maze (FlatGrid, BitMaze or list): 2D grid representing the maze.
+
+    Returns:
+        tuple or list: Valid neighboring positions.
+    """
+    if isinstance(maze, (FlatGrid, BitMaze)):
+        return maze.neighbors(position)
+    x, y = position
+    neighbors = []
+    for dx, dy in DIRECTIONS:  # Up, Right, Down, Left
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
+            neighbors.append((nx, ny))
+    return neighbors
+
+
+def reconstruct_path(came_from, node):
+    """
+    Rebuild the path ending at a node by following parent pointers.
+
+    Solvers record only the parent of each discovered cell instead of
+    carrying a full copy of the path in every frontier entry, so the path is
+    rebuilt once when the goal is reached.
+
+    Args:
+        came_from (dict or ParentBits): Maps each discovered position to its parent (None for the start).
+        node (tuple): Position the path should end at.
+
+    Returns:
+        list: Positions from the start to node (inclusive).
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = came_from[node]
+    path.reverse()
+    return path
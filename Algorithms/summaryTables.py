@@ -0,0 +1,68 @@
+def make_result(maze_num, start, end, path, nodes_expanded, time_taken, peak_memory):
+    """
+    Build one summary row in the shape the result tables consume.
+
+    Args:
+        maze_num (int): Test case number.
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        path (list): Path found, empty if none.
+        nodes_expanded (int): Number of nodes expanded.
+        time_taken (float): Time taken in seconds.
+        peak_memory (int): Peak memory in bytes.
+
+    Returns:
+        dict: Summary row.
+    """
+    solution_found = bool(path)
+    return {
+        "maze_num": maze_num,
+        "start": start,
+        "end": end,
+        "solution_found": "Yes" if solution_found else "No",
+        "steps": len(path) - 1 if solution_found else 0,
+        "time": time_taken,
+        "nodes_expanded": nodes_expanded,
+        "peak_memory_mb": peak_memory / (1024 * 1024),
+    }
+
+
+def print_summary(results, title):
+    """
+    Print the Test Result and Algorithm Performance Metrics tables.
+
+    Args:
+        results (list): Summary rows built by make_result.
+        title (str): Algorithm name shown in the metrics table heading.
+    """
+    print("\nTest Result")
+    print("+--------+----------+----------+----------------+")
+    print("| Maze # | Start    | Goal     | Solution Found |")
+    print("+--------+----------+----------+----------------+")
+    for result in results:
+        print(f"| {result['maze_num']:^6} | "
+              f"{str(tuple(result['start'])):^8} | "
+              f"{str(tuple(result['end'])):^8} | "
+              f"{result['solution_found']:^14} |")
+    print("+--------+----------+----------+----------------+")
+
+    print(f"\n\nAlgorithm Performance Metrics for {title}")
+    print("+--------+---------------------+-------+-------------------+-------------------+-------------------+-------+-------------------+")
+    print("| Maze # | Time (s)            | <1s   | Nodes Traversed   | Path Length       | Branching Factor  | <1MB  | Peak Memory (MB)  |")
+    print("+--------+---------------------+-------+-------------------+-------------------+-------------------+-------+-------------------+")
+    for result in results:
+        path_length = result['steps'] + 1 if result['solution_found'] == "Yes" else 0
+        branching_factor = (result['nodes_expanded'] / path_length) if path_length > 0 else 0
+        # Pass/Fail for time < 1s
+        time_status = "PASS" if result['time'] < 1 else "FAIL"
+        # Pass/Fail for peak memory < 1MB
+        mem_status = "PASS" if result['peak_memory_mb'] < 1 else "FAIL"
+        print(f"| {result['maze_num']:^6} | "
+              f"{result['time']:<19.16f} | "
+              f"{time_status:^5} | "
+              f"{result['nodes_expanded']:^17} | "
+              f"{path_length:^17} | "
+              f"{branching_factor:^17.2f} | "
+              f"{mem_status:^5} | "
+              f"{result['peak_memory_mb']:^17.6f} |")
+    print("+--------+---------------------+-------+-------------------+-------------------+-------------------+-------+-------------------+")
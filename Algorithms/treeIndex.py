@@ -0,0 +1,332 @@
+import random
+import time
+from array import array
+from collections import OrderedDict
+from mazeSamples import maze_grid, maze_test_cases
+from flatGrid import FlatGrid
+from measurement import measure_once, preview_run
+from summaryTables import make_result, print_summary
+from ChiaZhenYang import astar_search
+
+NONE = -1
+# Indexes a TreeIndexCache keeps before evicting the least recently used
+DEFAULT_CAPACITY = 8
+
+
+def is_tree(grid):
+    """
+    Check the edge count of a maze: its open cells form a tree only if edges == cells - 1.
+
+    Connectivity is confirmed when the index is built; a maze that passes this
+    count but is split into pieces must contain a loop somewhere.
+
+    Args:
+        grid (FlatGrid): Maze to check.
+
+    Returns:
+        bool: True if the open cells could form a single tree.
+    """
+    offsets = grid.offsets
+    cell_count = len(grid.open_cells)
+    # Every edge is stored once from each end; wall cells have neighbor lists too, so skip them
+    edge_count = sum(offsets[cell + 1] - offsets[cell] for cell in grid.open_cells) // 2
+    return cell_count > 0 and edge_count == cell_count - 1
+
+
+class TreeIndex:
+    """
+    Lowest-common-ancestor index over a perfect maze.
+
+    In a maze whose open cells form a tree, the path between two cells is the
+    walk up from each to their lowest common ancestor. An iterative DFS from
+    the first open cell records parents, depths and an Euler tour; a sparse
+    table of minimum-depth cells over the tour answers LCA in O(1), so a path
+    costs only its own length and a distance costs O(1). Nothing is searched.
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+
+        Raises:
+            ValueError: If the open cells do not form a single tree.
+        """
+        self.grid = grid = maze if isinstance(maze, FlatGrid) else FlatGrid(maze)
+        if not is_tree(grid):
+            raise ValueError("maze has loops or no open cells")
+        self.build_tour()
+        if len(self.tour) != 2 * len(grid.open_cells) - 1:
+            raise ValueError("maze is not connected")
+        self.build_sparse_table()
+
+    def build_tour(self):
+        """
+        Walk the tree depth-first, recording parents, depths and the Euler tour.
+        """
+        grid = self.grid
+        offsets, targets = grid.offsets, grid.targets
+        cell_count = len(grid.cells)
+        parent = array('i', [NONE]) * cell_count
+        depth = array('i', [0]) * cell_count
+        first = array('i', [NONE]) * cell_count
+        tour = array('i')
+
+        root = grid.open_cells[0]
+        first[root] = 0
+        tour.append(root)
+        # Each stack entry is (cell, index of its next neighbor to try)
+        stack = [(root, offsets[root])]
+        while stack:
+            cell, index = stack[-1]
+            if index == offsets[cell + 1]:
+                stack.pop()
+                if stack:
+                    tour.append(stack[-1][0])  # Back at the parent
+                continue
+            stack[-1] = (cell, index + 1)
+            child = targets[index]
+            if first[child] != NONE:
+                continue  # The parent, or a loop in a maze that only looked like a tree
+            parent[child] = cell
+            depth[child] = depth[cell] + 1
+            first[child] = len(tour)
+            tour.append(child)
+            stack.append((child, offsets[child]))
+
+        self.root = root
+        self.parent = parent
+        self.depth = depth
+        self.first = first
+        self.tour = tour
+
+    def build_sparse_table(self):
+        """
+        table[k][i] is the shallowest cell among tour[i:i + 2^k].
+        """
+        depth, tour = self.depth, self.tour
+        self.table = [tour]
+        span = 1
+        while span * 2 <= len(tour):
+            previous = self.table[-1]
+            self.table.append(array('i', (
+                previous[i] if depth[previous[i]] <= depth[previous[i + span]] else previous[i + span]
+                for i in range(len(previous) - span))))
+            span *= 2
+
+    def lca(self, a, b):
+        """
+        Lowest common ancestor of two open cell ids.
+        """
+        left, right = self.first[a], self.first[b]
+        if left > right:
+            left, right = right, left
+        level = (right - left + 1).bit_length() - 1
+        row = self.table[level]
+        x, y = row[left], row[right - (1 << level) + 1]
+        return x if self.depth[x] <= self.depth[y] else y
+
+    def distance(self, start, end):
+        """
+        Number of steps between two positions.
+
+        Returns:
+            int: Steps from start to end, or None if either is a wall.
+        """
+        grid, depth = self.grid, self.depth
+        a, b = grid.cell_id(tuple(start)), grid.cell_id(tuple(end))
+        if not (grid.is_open(a) and grid.is_open(b)):
+            return None
+        return depth[a] + depth[b] - 2 * depth[self.lca(a, b)]
+
+    def path(self, start, end):
+        """
+        Path between two positions.
+
+        Args:
+            start (list): Starting position [x, y].
+            end (list): Goal position [x, y].
+
+        Returns:
+            list: Positions from start to end, empty if either is a wall.
+        """
+        grid, parent = self.grid, self.parent
+        a, b = grid.cell_id(tuple(start)), grid.cell_id(tuple(end))
+        if not (grid.is_open(a) and grid.is_open(b)):
+            return []
+        meet = self.lca(a, b)
+        up, down = [a], []
+        while a != meet:
+            a = parent[a]
+            up.append(a)
+        while b != meet:
+            down.append(b)
+            b = parent[b]
+        return [grid.position(cell) for cell in up + down[::-1]]
+
+
+class TreeIndexCache:
+    """
+    LRU cache holding one TreeIndex per maze, or None for mazes with loops.
+
+    A FlatGrid is keyed by its content hash, which the grid computes once. A
+    nested-list maze is keyed by identity so a lookup is O(1) instead of
+    hashing every cell on every query; the entry keeps the list alive, so its
+    id cannot be reused while it is cached. Treat a list maze as read-only
+    once it has been queried, or pass a FlatGrid.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity (int): Number of mazes to keep indexes for.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()  # key -> (maze, TreeIndex or None)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def index_for(self, maze):
+        """
+        Get the tree index for a maze, building it only on a miss.
+
+        Args:
+            maze (FlatGrid or list): 2D grid representing the maze.
+
+        Returns:
+            TreeIndex: Index for this maze, or None if it has loops.
+        """
+        is_grid = isinstance(maze, FlatGrid)
+        key = maze.content_hash() if is_grid else id(maze)
+        entry = self.entries.get(key)
+        if entry is not None and (is_grid or entry[0] is maze):
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        try:
+            index = TreeIndex(maze)
+        except ValueError:
+            index = None
+        self.entries.pop(key, None)
+        self.entries[key] = (maze, index)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return index
+
+    def stats(self):
+        """
+        Counters for monitoring the cache.
+
+        Returns:
+            dict: hits, misses, entries and capacity.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "capacity": self.capacity}
+
+
+# Shared by callers that do not pass their own cache
+_CACHE = TreeIndexCache()
+
+
+def tree_index_for(maze, cache=None):
+    """
+    Get the tree index for a maze, building it only the first time.
+
+    Args:
+        maze (FlatGrid or list): 2D grid representing the maze.
+        cache (TreeIndexCache): Cache to use, the module's shared one if omitted.
+
+    Returns:
+        TreeIndex: Index for this maze, or None if it has loops.
+    """
+    return (cache if cache is not None else _CACHE).index_for(maze)
+
+
+def tree_path_search(start, end, maze, index=None, cache=None):
+    """
+    Answer a path query from the tree index, or with A* if the maze has loops.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        index (TreeIndex): Index for this maze; looked up in cache if omitted.
+        cache (TreeIndexCache): Cache to look the index up in.
+
+    Returns:
+        tuple: (path, traversed_nodes); traversed_nodes is empty on the tree path.
+    """
+    if index is None:
+        index = tree_index_for(maze, cache)
+    if index is None:
+        return astar_search(start, end, maze)
+    return index.path(start, end), []
+
+
+def tree_path(start, end, maze, visualize=False, ansi=True, index=None, cache=None):
+    """
+    Solve the maze with the LCA index, falling back to A* Search on mazes with loops.
+
+    Args:
+        start (list): Starting position [x, y].
+        end (list): Goal position [x, y].
+        maze (list): 2D grid representing the maze.
+        visualize (bool): Whether to visualize the A* fallback.
+        ansi (bool): Whether to use ANSI color in visualization.
+        index (TreeIndex): Index for this maze; looked up in cache if omitted.
+        cache (TreeIndexCache): Cache to look the index up in.
+
+    Returns:
+        tuple: (path, nodes_expanded, time_taken, traversed_nodes, peak_memory)
+    """
+    if index is None:
+        index = tree_index_for(maze, cache)
+    if visualize and index is None:
+        preview_run(astar_search, start, end, maze, visualize=True, ansi=ansi)
+    (path, traversed_nodes), time_taken, peak_memory = measure_once(tree_path_search, start, end, maze, index=index,
+                                                                    cache=cache)
+    return path, len(traversed_nodes), time_taken, traversed_nodes, peak_memory
+
+
+def main():
+    """
+    Solve every test case through the tree index and time random LCA queries.
+    """
+    from corridorGraph import add_loops
+
+    grid = FlatGrid(maze_grid)
+    print(f"Sample maze is a tree: {is_tree(grid)}; with 60 loops: {is_tree(FlatGrid(add_loops(maze_grid, 60)))}")
+
+    start_time = time.perf_counter()
+    index = TreeIndex(grid)
+    build_time = time.perf_counter() - start_time
+
+    results = []
+    for i, test_case in enumerate(maze_test_cases, 1):
+        path, nodes_expanded, time_taken, _, peak_memory = tree_path(test_case["start"], test_case["end"], test_case["maze"],
+                                                                     index=index)
+        results.append(make_result(i, test_case["start"], test_case["end"], path, nodes_expanded, time_taken, peak_memory))
+    print_summary(results, "TREE LCA")
+
+    rng = random.Random(0)
+    open_positions = [grid.position(cell) for cell in grid.open_ids()]
+    pairs = [(rng.choice(open_positions), rng.choice(open_positions)) for _ in range(10000)]
+    start_time = time.perf_counter()
+    for start, end in pairs:
+        index.distance(start, end)
+    distance_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for start, end in pairs:
+        index.path(start, end)
+    path_time = time.perf_counter() - start_time
+    print(f"Index built in {build_time * 1000:.2f} ms ({len(index.table)} sparse table levels over a "
+          f"{len(index.tour)}-entry Euler tour)")
+    print(f"{len(pairs)} random queries: distance {distance_time / len(pairs) * 1e6:.2f} us, "
+          f"path {path_time / len(pairs) * 1e6:.2f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import math
+from collections import deque
+
+# Milliseconds between frames (25 frames per second)
+FRAME_INTERVAL = 40
+# At 1x speed an animation of any length takes about this long
+TARGET_SECONDS = 5.0
+
+
+class AnimationScheduler:
+    """
+    Plays queued canvas updates on a fixed frame clock.
+
+    Each step is a zero-argument callable, such as painting one cell. Only
+    one after() callback is pending at a time. Every frame applies a batch of
+    steps, so a large maze animates in a bounded time instead of flooding
+    the Tk event queue with one callback per cell.
+    """
+
+    def __init__(self, widget, frame_interval=FRAME_INTERVAL, batch_size=None, target_seconds=TARGET_SECONDS):
+        """
+        Args:
+            widget (tk.Misc): Widget whose after() drives the clock.
+            frame_interval (int): Milliseconds between frames.
+            batch_size (int): Steps per frame at 1x speed. If None, a batch is
+                sized so the animation takes about target_seconds.
+            target_seconds (float): Length of an animation at 1x speed when batch_size is None.
+        """
+        self.widget = widget
+        self.frame_interval = frame_interval
+        self.batch_size = batch_size
+        self.target_seconds = target_seconds
+        self.speed = 1.0
+        self.steps = deque()
+        self.batch = 1
+        self.credit = 0.0  # Fractional steps carried between frames at low speeds
+        self.job = None
+        self.paused = False
+        self.on_finish = None
+
+    @property
+    def running(self):
+        return bool(self.steps)
+
+    def play(self, steps, on_finish=None):
+        """
+        Cancel whatever is playing and start a new animation.
+
+        Args:
+            steps (iterable): Zero-argument callables, applied in order.
+            on_finish (callable): Called once after the last step.
+        """
+        self.cancel()
+        self.steps.extend(steps)
+        self.on_finish = on_finish
+        self.paused = False
+        self.resize_batch()
+        self.schedule()
+
+    def extend(self, steps):
+        """
+        Queue more steps behind the current animation, starting the clock if it is idle.
+        """
+        self.steps.extend(steps)
+        self.resize_batch()
+        self.schedule()
+
+    def resize_batch(self):
+        if self.batch_size is not None:
+            self.batch = self.batch_size
+        else:
+            frames = max(1, self.target_seconds * 1000 / self.frame_interval)
+            self.batch = max(1, math.ceil(len(self.steps) / frames))
+
+    def schedule(self):
+        if self.job is None and self.steps and not self.paused:
+            self.job = self.widget.after(self.frame_interval, self.frame)
+
+    def frame(self):
+        self.job = None
+        self.credit += self.batch * self.speed
+        count = min(int(self.credit), len(self.steps))
+        self.credit -= count
+        for _ in range(count):
+            self.steps.popleft()()
+        if self.steps:
+            self.schedule()
+        else:
+            self.finish()
+
+    def finish(self):
+        self.credit = 0.0
+        on_finish, self.on_finish = self.on_finish, None
+        if on_finish is not None:
+            on_finish()
+
+    def set_speed(self, speed):
+        """
+        Scale the steps applied per frame, e.g. 0.5 for half speed or 4 for four times.
+        """
+        self.speed = speed
+
+    def pause(self):
+        self.paused = True
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def resume(self):
+        self.paused = False
+        self.schedule()
+
+    def toggle_pause(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def skip(self):
+        """
+        Apply every remaining step now and finish the animation.
+        """
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        while self.steps:
+            self.steps.popleft()()
+        self.paused = False
+        self.finish()
+
+    def cancel(self):
+        """
+        Drop every pending step without applying it or calling on_finish.
+        """
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        self.steps.clear()
+        self.credit = 0.0
+        self.on_finish = None
@@ -3,12 +3,15 @@ from tkinter import ttk, messagebox
 import random
 from queue import Queue
 import heapq
+from functools import partial
+from animationScheduler import AnimationScheduler
+from searchWorker import SearchWorker
 
 class MazeGame:
     def __init__(self, root):
         self.root = root
         self.root.title("Maze Sucker - Beta Ver")
-        self.min_cell_size = 20
+        self.min_cell_size = 1  # Lets large mazes shrink to fit instead of overflowing the window
         self.max_cell_size = 50
         self.visited_color = "#ADD8E6"  # Light blue
         self.path_color = "#0000FF"     # Blue (unused as per request)
@@ -16,8 +19,12 @@ class MazeGame:
         self.wall_color = "#000000"     # Black
         self.start_color = "#00FF00"    # Green
         self.goal_color = "#FF0000"     # Red
+        self.resize_delay = 100  # ms of quiet after the last <Configure> before resizing
+        self.resize_job = None
+        self.animator = AnimationScheduler(root)
+        self.solver = SearchWorker(root)
         self.setup_gui()
-        self.root.bind("<Configure>", self.resize_canvas)
+        self.root.bind("<Configure>", self.schedule_resize)
 
     def setup_gui(self):
         self.control_frame = ttk.Frame(self.root)
@@ -39,8 +46,27 @@ class MazeGame:
         self.algo_menu = ttk.OptionMenu(self.control_frame, self.algo_var, "BFS", *algorithms)
         self.algo_menu.pack(side=tk.LEFT, padx=5)
 
+        # "Image" rasterizes the maze into one PhotoImage; "Canvas Items" draws a rectangle per cell
+        self.renderer_var = tk.StringVar(value="Image")
+        ttk.Label(self.control_frame, text="Renderer:").pack(side=tk.LEFT, padx=5)
+        self.renderer_menu = ttk.OptionMenu(self.control_frame, self.renderer_var, "Image", "Image", "Canvas Items",
+                                            command=self.change_renderer)
+        self.renderer_menu.pack(side=tk.LEFT, padx=5)
+
         ttk.Button(self.control_frame, text="Generate Maze", command=self.generate_maze).pack(side=tk.LEFT, padx=5)
         ttk.Button(self.control_frame, text="Solve Maze", command=self.solve_maze).pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(self.control_frame, text="Cancel", command=self.cancel_search, state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
+        # Animation controls: speed multiplies the cells painted per frame
+        self.speed_var = tk.StringVar(value="1x")
+        speeds = ["0.25x", "0.5x", "1x", "2x", "4x", "8x"]
+        ttk.Label(self.control_frame, text="Speed:").pack(side=tk.LEFT, padx=5)
+        ttk.OptionMenu(self.control_frame, self.speed_var, "1x", *speeds,
+                       command=self.change_speed).pack(side=tk.LEFT, padx=5)
+        self.pause_button = ttk.Button(self.control_frame, text="Pause", command=self.toggle_pause)
+        self.pause_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.control_frame, text="Skip", command=self.animator.skip).pack(side=tk.LEFT, padx=5)
 
         self.canvas_frame = ttk.Frame(self.root)
         self.canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -51,40 +77,76 @@ class MazeGame:
         self.start = None
         self.goal = None
         self.cells = {}
-        self.walls = []
+        self.walls = {}
+        self.maze_image = None  # One pixel per cell; zoomed into scaled_image for display
+        self.scaled_image = None
+        self.image_item = None
         self.cell_size = self.min_cell_size
 
-    def resize_canvas(self, event=None):
-        if not self.maze:
-            return
+    def change_speed(self, speed):
+        self.animator.set_speed(float(speed.rstrip("x")))
+
+    def toggle_pause(self):
+        self.animator.toggle_pause()
+        self.pause_button.config(text="Resume" if self.animator.paused else "Pause")
+
+    def change_renderer(self, renderer):
+        if self.maze:
+            self.draw_maze()
+
+    def schedule_resize(self, event=None):
+        # <Configure> fires for every child widget and many times per drag;
+        # restart the timer on each one so only the last event resizes
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+        self.resize_job = self.root.after(self.resize_delay, self.resize_canvas)
+
+    def fit_cell_size(self):
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         rows, cols = len(self.maze), len(self.maze[0])
         # Ensure maze fits within 1920x1200 for 50x50, accounting for control frame (~100px)
         available_height = canvas_height - 100 if canvas_height > 100 else canvas_height
-        self.cell_size = min(
+        cell_size = min(
             canvas_width // cols,
             available_height // rows,
             self.max_cell_size
         )
-        self.cell_size = max(self.cell_size, self.min_cell_size)
-        self.draw_maze()
+        return max(cell_size, self.min_cell_size)
+
+    def resize_canvas(self, event=None):
+        self.resize_job = None
+        if not self.maze:
+            return
+        cell_size = self.fit_cell_size()
+        if cell_size == self.cell_size:
+            return
+        # Rescale what is already drawn, painted cells included, instead of rebuilding it
+        if self.maze_image is not None:
+            self.scaled_image = self.maze_image.zoom(cell_size)
+            self.canvas.itemconfig(self.image_item, image=self.scaled_image)
+        else:
+            factor = cell_size / self.cell_size
+            self.canvas.scale("all", 0, 0, factor, factor)
+        self.cell_size = cell_size
 
     def generate_maze(self):
         try:
             rows = int(self.rows_entry.get())
             cols = int(self.cols_entry.get())
-            if rows < 5 or cols < 5 or rows > 50 or cols > 50:
-                messagebox.showerror("Error", "Rows and columns must be between 5 and 50.")
+            if rows < 5 or cols < 5 or rows > 500 or cols > 500:
+                messagebox.showerror("Error", "Rows and columns must be between 5 and 500.")
                 return
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers for rows and columns.")
             return
 
+        self.cancel_search()
+
         # Initialize maze grid with all borders as walls
         self.maze = [[1 for _ in range(cols)] for _ in range(rows)]
         self.cells = {}
-        self.walls = []
+        self.walls = {}
 
         # Generate maze using randomized DFS, starting from (1, 1) to preserve borders
         if rows > 2 and cols > 2:
@@ -98,23 +160,62 @@ class MazeGame:
         self.maze[self.start[0]][self.start[1]] = 0
         self.maze[self.goal[0]][self.goal[1]] = 0
 
-        self.resize_canvas()
+        self.cell_size = self.fit_cell_size()
+        self.draw_maze()
 
     def dfs_generate(self, x, y, rows, cols):
+        # Iterative so large grids do not hit the recursion limit; each stack
+        # entry keeps the cell's own shuffled directions and where it got to
         self.maze[x][y] = 0
         directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
         random.shuffle(directions)
-        for dx, dy in directions:
-            nx, ny = x + dx * 2, y + dy * 2
-            # Avoid carving into border cells
-            if 1 <= nx < rows - 1 and 1 <= ny < cols - 1 and self.maze[nx][ny] == 1:
-                self.maze[x + dx][y + dy] = 0
-                self.dfs_generate(nx, ny, rows, cols)
+        stack = [(x, y, iter(directions))]
+        while stack:
+            x, y, remaining = stack[-1]
+            for dx, dy in remaining:
+                nx, ny = x + dx * 2, y + dy * 2
+                # Avoid carving into border cells
+                if 1 <= nx < rows - 1 and 1 <= ny < cols - 1 and self.maze[nx][ny] == 1:
+                    self.maze[x + dx][y + dy] = 0
+                    self.maze[nx][ny] = 0
+                    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+                    random.shuffle(directions)
+                    stack.append((nx, ny, iter(directions)))
+                    break
+            else:
+                stack.pop()
 
     def draw_maze(self):
+        # Pending steps belong to the old drawing
+        self.animator.cancel()
+        if self.renderer_var.get() == "Image":
+            self.draw_maze_image()
+        else:
+            self.draw_maze_items()
+
+    def draw_maze_image(self):
+        # Rasterize the static maze at one pixel per cell with a single put of
+        # row strings, then let Tk zoom it to the cell size. The canvas holds
+        # one image item instead of a rectangle per cell and lines per wall
+        self.canvas.delete("all")
+        self.cells = {}
+        self.walls = {}
+        rows, cols = len(self.maze), len(self.maze[0])
+        colors = ("white", "black")
+        self.maze_image = tk.PhotoImage(width=cols, height=rows)
+        self.maze_image.put(" ".join("{" + " ".join(colors[cell] for cell in row) + "}" for row in self.maze))
+        self.maze_image.put(self.start_color, to=(self.start[1], self.start[0]))
+        self.maze_image.put(self.goal_color, to=(self.goal[1], self.goal[0]))
+        self.scaled_image = self.maze_image.zoom(self.cell_size)
+        self.image_item = self.canvas.create_image(0, 0, image=self.scaled_image, anchor="nw")
+
+    def draw_maze_items(self):
         self.canvas.delete("all")
         self.cells = {}
-        self.walls = []
+        self.walls = {}
+        self.maze_image = None
+        self.scaled_image = None
+        self.image_item = None
         rows, cols = len(self.maze), len(self.maze[0])
         for i in range(rows):
             for j in range(cols):
@@ -131,7 +232,7 @@ class MazeGame:
                 elif (i, j) == self.goal:
                     self.canvas.itemconfig(cell_id, fill=self.goal_color)
 
-        # Draw internal walls
+        # Draw internal walls, indexed by (upper or left cell, lower or right cell)
         for i in range(rows):
             for j in range(cols):
                 x1 = j * self.cell_size
@@ -140,29 +241,35 @@ class MazeGame:
                 y2 = y1 + self.cell_size
                 if i < rows - 1 and (self.maze[i][j] == 1 or self.maze[i + 1][j] == 1):
                     wall_id = self.canvas.create_line(x1, y2, x2, y2, width=2, fill=self.wall_color)
-                    self.walls.append(((i, j), (i + 1, j), wall_id))
+                    self.walls[((i, j), (i + 1, j))] = wall_id
                 if j < cols - 1 and (self.maze[i][j] == 1 or self.maze[i][j + 1] == 1):
                     wall_id = self.canvas.create_line(x2, y1, x2, y2, width=2, fill=self.wall_color)
-                    self.walls.append(((i, j), (i, j + 1), wall_id))
+                    self.walls[((i, j), (i, j + 1))] = wall_id
 
     def solve_maze(self):
         if not self.maze:
             messagebox.showerror("Error", "Please generate a maze first.")
             return
-        algo = self.algo_var.get()
-        path = None
-        visited = set()
-        if algo == "BFS":
-            path, visited = self.bfs()
-        elif algo == "DFS":
-            path, visited = self.dfs()
-        elif algo == "A*":
-            path, visited = self.a_star()
-        elif algo == "Hill Climbing":
-            path, visited = self.hill_climbing()
-        self.animate_solution(path, visited)
-
-    def bfs(self):
+        searches = {"BFS": self.bfs, "DFS": self.dfs, "A*": self.a_star, "Hill Climbing": self.hill_climbing}
+        # The search runs on a worker thread; visited cells stream back and
+        # are animated while it is still going
+        self.animator.cancel()
+        self.animator.resume()
+        self.pause_button.config(text="Pause")
+        self.cancel_button.config(state="normal")
+        self.solver.start(searches[self.algo_var.get()], self.animate_visited, self.animate_solution,
+                          self.search_failed)
+
+    def cancel_search(self):
+        self.solver.cancel()
+        self.animator.cancel()  # Drop visited cells that were queued but not yet painted
+        self.cancel_button.config(state="disabled")
+
+    def search_failed(self, error):
+        self.cancel_button.config(state="disabled")
+        messagebox.showerror("Error", f"Search failed: {error}")
+
+    def bfs(self, visit=None):
         # Complete: Yes, Cost-Optimal: Yes, Time: O(V+E), Space: O(V)
         queue = Queue()
         queue.put([self.start])
@@ -176,10 +283,12 @@ class MazeGame:
                 nx, ny = x + dx, y + dy
                 if 0 <= nx < len(self.maze) and 0 <= ny < len(self.maze[0]) and self.maze[nx][ny] == 0 and (nx, ny) not in visited:
                     visited.add((nx, ny))
+                    if visit:
+                        visit((nx, ny))
                     queue.put(path + [(nx, ny)])
         return [], visited
 
-    def dfs(self):
+    def dfs(self, visit=None):
         # Complete: No (on infinite graphs), Cost-Optimal: No, Time: O(V+E), Space: O(V)
         stack = [[self.start]]
         visited = {self.start}
@@ -192,10 +301,12 @@ class MazeGame:
                 nx, ny = x + dx, y + dy
                 if 0 <= nx < len(self.maze) and 0 <= ny < len(self.maze[0]) and self.maze[nx][ny] == 0 and (nx, ny) not in visited:
                     visited.add((nx, ny))
+                    if visit:
+                        visit((nx, ny))
                     stack.append(path + [(nx, ny)])
         return [], visited
 
-    def a_star(self):
+    def a_star(self, visit=None):
         # Complete: Yes, Cost-Optimal: Yes (with consistent heuristic), Time: O(E log V), Space: O(V)
         def heuristic(a, b):
             return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -216,9 +327,11 @@ class MazeGame:
                         priority = new_cost + heuristic((nx, ny), self.goal)
                         heapq.heappush(pq, (priority, path + [(nx, ny)]))
                         visited.add((nx, ny))
+                        if visit:
+                            visit((nx, ny))
         return [], visited
 
-    def hill_climbing(self):
+    def hill_climbing(self, visit=None):
         # Complete: No, Cost-Optimal: No, Time: O(V), Space: O(1) for path
         def heuristic(a, b):
             return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -236,27 +349,42 @@ class MazeGame:
             next_cell = min(neighbors, key=lambda x: heuristic(x, self.goal))
             path.append(next_cell)
             visited.add(next_cell)
+            if visit:
+                visit(next_cell)
             current = next_cell
         return path, visited
 
-    def animate_solution(self, path, visited):
-        def update_cell(i):
-            if i < len(visited_list):
-                cell = visited_list[i]
-                if cell != self.start and cell != self.goal:
-                    self.canvas.itemconfig(self.cells[cell], fill=self.visited_color)
-                self.root.after(50, update_cell, i + 1)
-            elif i < len(visited_list) + len(path):
-                cell = path[i - len(visited_list)]
-                if cell != self.start and cell != self.goal:
-                    self.canvas.itemconfig(self.cells[cell], fill=self.final_path_color)
-                for (c1, c2, wall_id) in self.walls:
-                    if (c1 == cell and c2 in path) or (c2 == cell and c1 in path):
-                        self.canvas.itemconfig(wall_id, state="hidden")
-                self.root.after(50, update_cell, i + 1)
-
-        visited_list = list(visited - {self.start, self.goal})
-        update_cell(0)
+    def paint_cell(self, cell, color):
+        # Dynamic cells are painted into both images so a later zoom keeps them
+        if self.maze_image is not None:
+            i, j = cell
+            size = self.cell_size
+            self.maze_image.put(color, to=(j, i))
+            self.scaled_image.put(color, to=(j * size, i * size, (j + 1) * size, (i + 1) * size))
+        else:
+            self.canvas.itemconfig(self.cells[cell], fill=color)
+
+    def animate_visited(self, cells):
+        self.animator.extend(partial(self.paint_cell, cell, self.visited_color)
+                             for cell in cells if cell != self.start and cell != self.goal)
+
+    def animate_solution(self, result):
+        path, _ = result
+        self.cancel_button.config(state="disabled")
+
+        def reveal_path_cell(cell):
+            if cell != self.start and cell != self.goal:
+                self.paint_cell(cell, self.final_path_color)
+            # Only the four walls around this cell can sit between two path cells
+            x, y = cell
+            for c1, c2 in (((x - 1, y), cell), ((x, y - 1), cell), (cell, (x + 1, y)), (cell, (x, y + 1))):
+                wall_id = self.walls.get((c1, c2))
+                if wall_id is not None and c1 in path_cells and c2 in path_cells:
+                    self.canvas.itemconfig(wall_id, state="hidden")
+
+        # Queued behind the visited cells, played in batches on the frame clock
+        path_cells = set(path)
+        self.animator.extend(partial(reveal_path_cell, cell) for cell in path)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -4,6 +4,9 @@ import random
 from collections import deque
 import heapq
 import time
+from functools import partial
+from animationScheduler import AnimationScheduler
+from searchWorker import SearchWorker
 
 class MazeGame:
     def __init__(self, root):
@@ -16,6 +19,9 @@ class MazeGame:
         self.start = (0, 0)
         self.goal = (9, 9)
         self.path = []
+        self.animator = AnimationScheduler(root)
+        self.solver = SearchWorker(root)
+        self.expanded = 0
         self.setup_gui()
 
     def setup_gui(self):
@@ -45,6 +51,22 @@ class MazeGame:
         ttk.Button(control_frame, text="Find Path", command=self.find_path).grid(row=0, column=7, padx=5)
         ttk.Button(control_frame, text="Clear", command=self.clear_canvas).grid(row=0, column=8, padx=5)
 
+        # Animation controls: speed multiplies the cells drawn per frame
+        ttk.Label(control_frame, text="Speed:").grid(row=0, column=9, padx=5)
+        self.speed_var = tk.StringVar(value="1x")
+        speed_menu = ttk.OptionMenu(control_frame, self.speed_var, "1x", "0.25x", "0.5x", "1x", "2x", "4x", "8x",
+                                    command=self.change_speed)
+        speed_menu.grid(row=0, column=10, padx=5)
+        self.pause_button = ttk.Button(control_frame, text="Pause", command=self.toggle_pause)
+        self.pause_button.grid(row=0, column=11, padx=5)
+        ttk.Button(control_frame, text="Skip", command=self.animator.skip).grid(row=0, column=12, padx=5)
+        self.cancel_button = ttk.Button(control_frame, text="Cancel", command=self.cancel_search, state="disabled")
+        self.cancel_button.grid(row=0, column=13, padx=5)
+
+        # Search progress, fed by the worker's expansion events
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self.root, textvariable=self.status_var).grid(row=2, column=0, padx=5, sticky="w")
+
         # Canvas for maze
         self.canvas = tk.Canvas(self.root, width=300, height=300, bg="white")
         self.canvas.grid(row=1, column=0, padx=5, pady=5)
@@ -60,6 +82,7 @@ class MazeGame:
             messagebox.showerror("Error", "Please enter valid numbers for rows and columns.")
             return
 
+        self.cancel_search()
         self.maze = [[1 for _ in range(self.cols)] for _ in range(self.rows)]
 
         # Generate maze using recursive backtracking
@@ -98,6 +121,8 @@ class MazeGame:
         self.draw_maze()
 
     def draw_maze(self):
+        # Pending steps belong to the old drawing
+        self.animator.cancel()
         self.canvas.delete("all")
         canvas_width = self.cols * self.cell_size
         canvas_height = self.rows * self.cell_size
@@ -121,20 +146,40 @@ class MazeGame:
             messagebox.showerror("Error", "Please generate a maze first.")
             return
 
-        algo = self.algo_var.get()
-        if algo == "DFS":
-            self.path = self.dfs()
-        elif algo == "BFS":
-            self.path = self.bfs()
-        else:
-            self.path = self.a_star()
-
+        searches = {"DFS": self.dfs, "BFS": self.bfs}
+        search = searches.get(self.algo_var.get(), self.a_star)
+        # The search runs on a worker thread so the window stays responsive;
+        # expansion events stream back to update the progress label
+        self.expanded = 0
+        self.status_var.set("Searching...")
+        self.cancel_button.config(state="normal")
+        self.solver.start(search, self.show_progress, self.show_result, self.search_failed)
+
+    def show_progress(self, cells):
+        self.expanded += len(cells)
+        self.status_var.set(f"Searching... {self.expanded} cells expanded")
+
+    def show_result(self, path):
+        self.cancel_button.config(state="disabled")
+        self.status_var.set(f"{self.expanded} cells expanded")
+        self.path = path
         if not self.path:
             messagebox.showinfo("Result", "No path found!")
         else:
             self.animate_path()
 
-    def dfs(self):
+    def search_failed(self, error):
+        self.cancel_button.config(state="disabled")
+        self.status_var.set("")
+        messagebox.showerror("Error", f"Search failed: {error}")
+
+    def cancel_search(self):
+        if self.solver.busy:
+            self.status_var.set("Search cancelled")
+        self.solver.cancel()
+        self.cancel_button.config(state="disabled")
+
+    def dfs(self, visit=None):
         stack = [(self.start, [self.start])]
         visited = set()
 
@@ -145,6 +190,8 @@ class MazeGame:
             if (x, y) in visited:
                 continue
             visited.add((x, y))
+            if visit:
+                visit((x, y))
 
             for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 nx, ny = x + dx, y + dy
@@ -152,7 +199,7 @@ class MazeGame:
                     stack.append(((nx, ny), path + [(nx, ny)]))
         return []
 
-    def bfs(self):
+    def bfs(self, visit=None):
         queue = deque([(self.start, [self.start])])
         visited = set()
 
@@ -163,6 +210,8 @@ class MazeGame:
             if (x, y) in visited:
                 continue
             visited.add((x, y))
+            if visit:
+                visit((x, y))
 
             for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 nx, ny = x + dx, y + dy
@@ -170,7 +219,7 @@ class MazeGame:
                     queue.append(((nx, ny), path + [(nx, ny)]))
         return []
 
-    def a_star(self):
+    def a_star(self, visit=None):
         def heuristic(a, b):
             return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
@@ -185,6 +234,8 @@ class MazeGame:
             if (x, y) in closed:
                 continue
             closed.add((x, y))
+            if visit:
+                visit((x, y))
 
             for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 nx, ny = x + dx, y + dy
@@ -196,11 +247,17 @@ class MazeGame:
                         heapq.heappush(open_list, (f_score, (nx, ny), path + [(nx, ny)]))
         return []
 
+    def change_speed(self, speed):
+        self.animator.set_speed(float(speed.rstrip("x")))
+
+    def toggle_pause(self):
+        self.animator.toggle_pause()
+        self.pause_button.config(text="Resume" if self.animator.paused else "Pause")
+
     def animate_path(self):
         self.draw_maze()
-        for i, (x, y) in enumerate(self.path[1:-1], 1):
-            self.canvas.after(i * 100, self.draw_path_cell, x, y)
-        self.root.update()
+        self.pause_button.config(text="Pause")
+        self.animator.play(partial(self.draw_path_cell, x, y) for x, y in self.path[1:-1])
 
     def draw_path_cell(self, x, y):
         x1 = y * self.cell_size
@@ -210,6 +267,8 @@ class MazeGame:
         self.canvas.create_rectangle(x1, y1, x2, y2, fill="blue", outline="gray")
 
     def clear_canvas(self):
+        self.cancel_search()
+        self.animator.cancel()
         self.maze = []
         self.path = []
         self.canvas.delete("all")
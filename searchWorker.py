@@ -0,0 +1,121 @@
+import queue
+import threading
+
+# Milliseconds between checks of the worker's event queue
+POLL_INTERVAL = 30
+
+
+class SearchCancelled(Exception):
+    """
+    Raised inside a worker search by visit() once the search has been cancelled.
+    """
+
+
+class SearchWorker:
+    """
+    Runs one maze search at a time on a background thread.
+
+    The search reports each cell it visits through a visit(cell) callback,
+    which only puts events on a queue. The Tk main loop drains that queue
+    every poll_interval ms with after(), so the GUI keeps handling events
+    and widgets are only ever touched from the main thread. Cancelling sets
+    a flag and stops polling; the worker's next visit() raises
+    SearchCancelled, which ends the search quietly.
+    """
+
+    def __init__(self, widget, poll_interval=POLL_INTERVAL):
+        """
+        Args:
+            widget (tk.Misc): Widget whose after() schedules the polling.
+            poll_interval (int): Milliseconds between queue checks.
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.events = None
+        self.cancel_event = None
+        self.job = None
+        self.on_visit = None
+        self.on_done = None
+        self.on_error = None
+
+    @property
+    def busy(self):
+        return self.events is not None
+
+    def start(self, search, on_visit, on_done, on_error=None):
+        """
+        Cancel any running search and start a new one on a worker thread.
+
+        Args:
+            search (callable): search(visit) -> result, run on the worker thread.
+                It must not touch Tk; it calls visit(cell) for each cell it visits.
+            on_visit (callable): Called on the main thread with a list of newly visited cells.
+            on_done (callable): Called on the main thread with the search's result.
+            on_error (callable): Called on the main thread with an exception the
+                search raised; the exception is re-raised if omitted.
+        """
+        self.cancel()
+        events = queue.SimpleQueue()
+        cancel_event = threading.Event()
+
+        def visit(cell):
+            if cancel_event.is_set():
+                raise SearchCancelled
+            events.put(("visit", cell))
+
+        def run():
+            try:
+                events.put(("done", search(visit)))
+            except SearchCancelled:
+                pass
+            except Exception as error:
+                events.put(("error", error))
+
+        self.events = events
+        self.cancel_event = cancel_event
+        self.on_visit, self.on_done, self.on_error = on_visit, on_done, on_error
+        threading.Thread(target=run, daemon=True).start()
+        self.job = self.widget.after(self.poll_interval, self.poll)
+
+    def poll(self):
+        self.job = None
+        visited = []
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "visit":
+                visited.append(value)
+                continue
+            if visited:
+                self.on_visit(visited)
+            on_done, on_error = self.on_done, self.on_error
+            self.reset()
+            if kind == "done":
+                on_done(value)
+            elif on_error is not None:
+                on_error(value)
+            else:
+                raise value
+            return
+        if visited:
+            self.on_visit(visited)
+        self.job = self.widget.after(self.poll_interval, self.poll)
+
+    def cancel(self):
+        """
+        Stop the running search, if any, and drop its pending events.
+        """
+        if self.events is None:
+            return
+        self.cancel_event.set()
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+        self.reset()
+
+    def reset(self):
+        self.events = None
+        self.cancel_event = None
+        self.job = None
+        self.on_visit = self.on_done = self.on_error = None